@@ -0,0 +1,194 @@
+from collections import OrderedDict
+from json import dumps
+from threading import Lock
+
+from django.conf import settings
+from graphene_django.settings import graphene_settings
+from graphql.backend.base import GraphQLBackend
+from graphql.backend.core import GraphQLCoreBackend
+from graphql.execution import ExecutionResult, execute
+from graphql.language import ast
+from graphql.language.visitor import TypeInfoVisitor, Visitor, visit
+from graphql.type import GraphQLObjectType
+from graphql.type.definition import get_named_type
+from graphql.utils.get_operation_ast import get_operation_ast
+from graphql.utils.type_info import TypeInfo
+from graphql.validation import validate
+
+from coc.cache import cache_key, get_cache, stats
+from coc.persisted_queries import query_hash
+from coc.query_cost import QueryCostError, check_query_cost
+
+
+class CostAnalysisBackend(GraphQLCoreBackend):
+    """GraphQL backend validating every document once, when it is parsed,
+    and scoring every query before it is executed. Queries over budget are
+    rejected and the cost of the others is reported in the result
+    extensions."""
+
+    def __init__(self, max_cost: int = None, max_depth: int = None,
+                 default_page_size: int = 100, executor=None):
+        super().__init__(executor=executor)
+        self.max_cost = max_cost
+        self.max_depth = max_depth
+        self.default_page_size = default_page_size
+
+    @classmethod
+    def from_settings(cls):
+        """Backend with the budget set at the project settings."""
+        return cls(
+            max_cost=getattr(settings, 'GRAPHQL_MAX_QUERY_COST', None),
+            max_depth=getattr(settings, 'GRAPHQL_MAX_QUERY_DEPTH', None),
+            default_page_size=graphene_settings.RELAY_CONNECTION_MAX_LIMIT
+        )
+
+    def document_from_string(self, schema, document_string):
+        document = super().document_from_string(schema, document_string)
+        document_ast = document.document_ast
+        validation_errors = validate(schema, document_ast)
+
+        def execute_within_budget(*args, **kwargs):
+            if validation_errors:
+                return ExecutionResult(errors=validation_errors, invalid=True)
+            try:
+                score = check_query_cost(
+                    document_ast,
+                    variables=kwargs.get('variable_values'),
+                    operation_name=kwargs.get('operation_name'),
+                    max_cost=self.max_cost,
+                    max_depth=self.max_depth,
+                    default_page_size=self.default_page_size
+                )
+            except QueryCostError as error:
+                return ExecutionResult(errors=[error], invalid=True)
+            options = {**self.execute_params, **kwargs}
+            result = execute(schema, document_ast, *args, **options)
+            result.extensions['cost'] = score.cost
+            return result
+
+        document.execute = execute_within_budget
+        return document
+
+
+class LRUCachedBackend(GraphQLBackend):
+    """Keeps the most recently used documents of a backend, keyed by the
+    sha256 of their query, so repeated queries skip parsing and validation.
+    """
+
+    def __init__(self, backend: GraphQLBackend, maxsize: int = 256):
+        self.backend = backend
+        self.maxsize = maxsize
+        self.documents = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+
+    def document_from_string(self, schema, document_string):
+        if not isinstance(document_string, str):
+            return self.backend.document_from_string(schema, document_string)
+        key = (schema, query_hash(document_string))
+        with self._lock:
+            document = self.documents.get(key)
+            if document is not None:
+                self.documents.move_to_end(key)
+                self.hits += 1
+                return document
+            self.misses += 1
+        # parse outside the lock, a concurrent miss only parses twice.
+        document = self.backend.document_from_string(schema, document_string)
+        with self._lock:
+            self.documents[key] = document
+            self.documents.move_to_end(key)
+            while len(self.documents) > self.maxsize:
+                self.documents.popitem(last=False)
+        return document
+
+
+class ObjectTypesVisitor(Visitor):
+    """Collects the names of the object types the fields of a document
+    return, fragments included."""
+
+    def __init__(self, type_info: TypeInfo):
+        self.type_info = type_info
+        self.names = set()
+
+    def enter_Field(self, node, *args):
+        field_type = get_named_type(self.type_info.get_type())
+        if isinstance(field_type, GraphQLObjectType):
+            self.names.add(field_type.name)
+
+
+class ResultCachedBackend(GraphQLBackend):
+    """Answers the queries reading only the given root fields (catalog
+    connections) from the response cache, keyed by the query hash, its
+    operation and variables under the catalog version. Every field of the
+    document must return one of the given node types, their connections and
+    edges or scalars, a reverse relation to the investigators is not
+    invalidated by the catalog version. Only results without errors are
+    stored, their data along the extensions of the run; hits report
+    {"cached": true} in the extensions.
+    """
+    kind = 'graphql'
+
+    def __init__(self, backend: GraphQLBackend, fields=(), types=()):
+        self.backend = backend
+        self.fields = frozenset(fields)
+        self.types = frozenset(
+            f'{name}{suffix}' for name in types
+            for suffix in ('', 'Connection', 'Edge')
+        ) | {'PageInfo'}
+
+    def reads_cached_types(self, schema, document_ast) -> bool:
+        """Whether every object field of the document returns a cached
+        type."""
+        type_info = TypeInfo(schema)
+        visitor = ObjectTypesVisitor(type_info)
+        visit(document_ast, TypeInfoVisitor(type_info, visitor))
+        return visitor.names <= self.types
+
+    def cacheable(self, operation) -> bool:
+        """Whether the operation is a query of the cached root fields."""
+        if operation is None or operation.operation != 'query':
+            return False
+        selections = operation.selection_set.selections
+        return all(
+            isinstance(selection, ast.Field) and (
+                selection.name.value in self.fields
+                or selection.name.value == '__typename'
+            ) for selection in selections
+        )
+
+    def document_from_string(self, schema, document_string):
+        document = self.backend.document_from_string(schema, document_string)
+        if not self.fields or not isinstance(document_string, str):
+            return document
+        document_ast = document.document_ast
+        if not self.reads_cached_types(schema, document_ast):
+            return document
+        hash_ = query_hash(document_string)
+        execute_document = document.execute
+
+        def execute_cached(*args, **kwargs):
+            operation_name = kwargs.get('operation_name')
+            cache = get_cache()
+            if cache is None or not self.cacheable(
+                    get_operation_ast(document_ast, operation_name)):
+                return execute_document(*args, **kwargs)
+            key = cache_key(self.kind, dumps(
+                [hash_, operation_name, kwargs.get('variable_values')],
+                sort_keys=True
+            ), cache)
+            cached = cache.get(key)
+            stats.count(self.kind, cached is not None)
+            if cached is not None:
+                data, extensions = cached
+                return ExecutionResult(
+                    data=data, extensions={**extensions, 'cached': True})
+            result = execute_document(*args, **kwargs)
+            if not result.errors and not result.invalid:
+                cache.set(key, (result.data, result.extensions),
+                          settings.CATALOG_CACHE_TIMEOUT)
+            return result
+
+        document.execute = execute_cached
+        return document
@@ -0,0 +1,143 @@
+# '''
+# versioned response cache module.
+# '''
+import os
+from functools import wraps
+from hashlib import sha256
+from random import randrange
+from threading import Lock
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.http import HttpResponse
+
+# Every entry is keyed by the version of the catalog it was made from, a
+# mutation starts a new version and the entries of the previous ones are
+# left to expire.
+VERSION_KEY = 'catalog:version'
+CACHED_METHODS = ('GET', 'HEAD')
+
+# versions of the process local caches are counted by every process, see
+# etag.
+_boot = uuid4().hex[:8]
+_local_version = 0
+
+
+class CacheStats:
+    """Hits and misses of the cached responses of this process, by kind."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self.counts = {}
+
+    def count(self, kind: str, hit: bool):
+        with self._lock:
+            hits, misses = self.counts.get(kind, (0, 0))
+            self.counts[kind] = (hits + 1, misses) if hit else (
+                hits, misses + 1)
+
+    def ratio(self, kind: str = None) -> float:
+        """Hits over lookups of the kind, of every kind by default."""
+        counts = [
+            counts for name, counts in self.counts.items()
+            if kind is None or name == kind
+        ]
+        hits = sum(hits for hits, _ in counts)
+        lookups = hits + sum(misses for _, misses in counts)
+        return hits / lookups if lookups else 0.0
+
+    def reset(self):
+        with self._lock:
+            self.counts = {}
+
+
+stats = CacheStats()
+
+
+def get_cache():
+    """Cache of the CATALOG_CACHE alias, None when the cache is disabled."""
+    alias = getattr(settings, 'CATALOG_CACHE', 'default')
+    return caches[alias] if alias else None
+
+
+def version(cache=None) -> int:
+    """Current version of the catalog. A missing version (first use, an
+    evicted or flushed key) starts at a random one, so the entries left
+    from before are never read again."""
+    cache = cache or get_cache()
+    if cache is None:
+        return _local_version
+    current = cache.get(VERSION_KEY)
+    if current is None:
+        cache.add(VERSION_KEY, randrange(1 << 30), timeout=None)
+        current = cache.get(VERSION_KEY, 0)
+    return current
+
+
+def bump():
+    """Start a new version of the catalog, called on every change of the
+    reference data, see creator.signals. Returns the new version, the
+    previous one is the version minus one as the increase is atomic, None
+    when the version is missing."""
+    global _local_version
+    _local_version += 1
+    cache = get_cache()
+    if cache is None:
+        return _local_version
+    try:
+        return cache.incr(VERSION_KEY)
+    except ValueError:
+        # missing, the next read starts a random version.
+        return None
+
+
+def etag() -> str:
+    """Tag of the catalog version for the HTTP caches. The versions of a
+    process local cache are only increased by the saves of the process, so
+    the tags of two processes never match."""
+    cache = get_cache()
+    if cache is None or isinstance(cache, LocMemCache):
+        return f'{_boot}.{os.getpid()}.{version(cache)}'
+    return str(version(cache))
+
+
+def cache_key(kind: str, key: str, cache=None) -> str:
+    """Key of an entry of the current version, `key` identifies the entry
+    among the ones of its kind, eg. the request path."""
+    digest = sha256(key.encode('utf-8')).hexdigest()
+    return f'catalog:{version(cache)}:{kind}:{digest}'
+
+
+def cache_response(kind: str):
+    """Decorator caching the successful GET responses of a view, keyed by
+    their full path, for CATALOG_CACHE_TIMEOUT seconds or until the catalog
+    changes. Streaming responses are passed on uncached, storing them would
+    read them whole. Only the content and its type are kept, put the
+    decorators adding headers (etag, cache_control) over this one.
+    Arguments:
+        kind -- name of the cached view, the hits are counted by kind.
+    """
+    def decorator(view):
+        @wraps(view)
+        def cached_view(request, *args, **kwargs):
+            cache = get_cache()
+            if cache is None or request.method not in CACHED_METHODS:
+                return view(request, *args, **kwargs)
+            key = cache_key(kind, request.get_full_path(), cache)
+            cached = cache.get(key)
+            stats.count(kind, cached is not None)
+            if cached is not None:
+                content_type, content = cached
+                return HttpResponse(content, content_type=content_type)
+            response = view(request, *args, **kwargs)
+            if response.status_code != 200 or response.streaming:
+                return response
+            cache.set(
+                key, (response['Content-Type'], response.content),
+                settings.CATALOG_CACHE_TIMEOUT
+            )
+            return response
+        return cached_view
+    return decorator
@@ -0,0 +1,37 @@
+# '''
+# structured logging module.
+# '''
+from json import dumps
+from logging import Formatter
+
+# attributes every LogRecord has, anything else was passed with `extra`.
+RECORD_ATTRIBUTES = frozenset((
+    'args', 'asctime', 'created', 'exc_info', 'exc_text', 'filename',
+    'funcName', 'levelname', 'levelno', 'lineno', 'message', 'module',
+    'msecs', 'msg', 'name', 'pathname', 'process', 'processName',
+    'relativeCreated', 'stack_info', 'taskName', 'thread', 'threadName',
+))
+
+
+class JsonFormatter(Formatter):
+    """Formats every record as a single JSON line, eg.
+    {"time": "...", "level": "INFO", "logger": "django.request",
+    "message": "...", "status_code": 404}.
+    The `extra` attributes of the record are added as keys.
+    """
+
+    def format(self, record) -> str:
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in RECORD_ATTRIBUTES and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry['stack'] = self.formatStack(record.stack_info)
+        return dumps(entry, default=str)
@@ -0,0 +1,77 @@
+# '''
+# persisted graphql queries module.
+# '''
+from hashlib import sha256
+from json import dump, load
+from os import path, replace
+from threading import Lock
+
+from django.conf import settings
+
+
+def query_hash(query: str) -> str:
+    """sha256 hex digest identifying a query."""
+    return sha256(query.encode('utf-8')).hexdigest()
+
+
+class PersistedQueries:
+    """Allowlist of registered queries keyed by their hash, stored as a
+    JSON file (GRAPHQL_PERSISTED_QUERIES by default). The file is read
+    lazily and again when it changes on disk.
+    """
+
+    def __init__(self, file_path: str = None):
+        self._file_path = file_path
+        self._lock = Lock()
+        self._queries = None
+        self._stamp = None
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path or settings.GRAPHQL_PERSISTED_QUERIES
+
+    def _load(self):
+        file_path = self.file_path
+        try:
+            stamp = (file_path, path.getmtime(file_path))
+        except OSError:
+            stamp = (file_path, None)
+        with self._lock:
+            if self._queries is not None and stamp == self._stamp:
+                return self._queries
+            queries = {}
+            if stamp[1] is not None:
+                with open(file_path, encoding='utf-8') as stored:
+                    queries = load(stored)
+            self._queries = queries
+            self._stamp = stamp
+            return queries
+
+    def get(self, hash_: str):
+        """Query registered under the hash, None when unknown."""
+        return self._load().get(hash_)
+
+    def __contains__(self, query: str) -> bool:
+        return self.get(query_hash(query)) == query
+
+    def register(self, queries, clear: bool = False) -> dict:
+        """Add queries to the allowlist and write it.
+        Arguments:
+            queries -- iterable of query strings.
+            clear -- drop the queries registered before.
+        Returns:
+            dict of hash: query of the given queries.
+        """
+        registered = {query_hash(query): query for query in queries}
+        stored = {} if clear else dict(self._load())
+        stored.update(registered)
+        temporary = f'{self.file_path}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as output:
+            dump(stored, output, indent=2, sort_keys=True)
+        replace(temporary, self.file_path)
+        with self._lock:
+            self._queries = None
+        return registered
+
+
+persisted_queries = PersistedQueries()
@@ -0,0 +1,137 @@
+# '''
+# graphql query cost and depth analysis module.
+# '''
+from collections import namedtuple
+
+from graphql.error import GraphQLError
+from graphql.language.ast import (Field, FragmentDefinition, FragmentSpread,
+                                  InlineFragment, IntValue,
+                                  OperationDefinition, Variable)
+
+# page size arguments of the relay connections.
+PAGE_ARGUMENTS = ('first', 'last')
+
+QueryCost = namedtuple('QueryCost', ['cost', 'depth'])
+
+
+class QueryCostError(GraphQLError):
+    """The query goes over the cost or depth budget."""
+
+
+def _page_size(field, variables: dict, default_page_size: int) -> int:
+    """Rows a connection field may return, the `first` and `last` arguments
+    are capped by the default (maximum) page size."""
+    sizes = []
+    for argument in field.arguments or []:
+        if argument.name.value not in PAGE_ARGUMENTS:
+            continue
+        value = argument.value
+        if isinstance(value, Variable):
+            value = variables.get(value.name.value)
+        elif isinstance(value, IntValue):
+            value = int(value.value)
+        else:
+            value = None
+        if isinstance(value, int):
+            sizes.append(value)
+    if not sizes:
+        return default_page_size
+    return max(0, min(min(sizes), default_page_size))
+
+
+class CostAnalyzer:
+    """Scores a query document without executing it.
+    Every object field costs one point, the fields selected under a relay
+    connection (a field selecting `edges`) are multiplied by its page size.
+    Leaf fields are free and introspection fields are not scored.
+    """
+
+    def __init__(self, document_ast, variables: dict = None,
+                 default_page_size: int = 100):
+        self.variables = variables or {}
+        self.default_page_size = default_page_size
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document_ast.definitions
+            if isinstance(definition, FragmentDefinition)
+        }
+        self.operations = [
+            definition for definition in document_ast.definitions
+            if isinstance(definition, OperationDefinition)
+        ]
+
+    def _fields(self, selection_set, visited: frozenset):
+        if selection_set is None:
+            return
+        for selection in selection_set.selections:
+            if isinstance(selection, Field):
+                if not selection.name.value.startswith('__'):
+                    yield selection
+            elif isinstance(selection, InlineFragment):
+                yield from self._fields(selection.selection_set, visited)
+            elif isinstance(selection, FragmentSpread):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                # cycles are rejected by the validation, just stop on them.
+                if fragment is not None and name not in visited:
+                    yield from self._fields(
+                        fragment.selection_set, visited | {name})
+
+    def _score(self, selection_set, visited: frozenset = frozenset()) -> QueryCost:
+        cost = 0
+        depth = 0
+        for field in self._fields(selection_set, visited):
+            if field.selection_set is None:
+                depth = max(depth, 1)
+                continue
+            children = self._score(field.selection_set, visited)
+            multiplier = 1
+            if any(child.name.value == 'edges'
+                   for child in self._fields(field.selection_set, visited)):
+                multiplier = _page_size(
+                    field, self.variables, self.default_page_size)
+            cost += 1 + multiplier * children.cost
+            depth = max(depth, 1 + children.depth)
+        return QueryCost(cost, depth)
+
+    def analyze(self, operation_name: str = None) -> QueryCost:
+        """Cost and depth of the operation to execute, the worst operation
+        when it can not be told apart."""
+        operations = [
+            operation for operation in self.operations
+            if operation_name is None
+            or (operation.name and operation.name.value == operation_name)
+        ]
+        scores = [
+            self._score(operation.selection_set) for operation in operations
+        ]
+        return QueryCost(
+            max((score.cost for score in scores), default=0),
+            max((score.depth for score in scores), default=0)
+        )
+
+
+def check_query_cost(document_ast, variables: dict = None,
+                     operation_name: str = None, max_cost: int = None,
+                     max_depth: int = None,
+                     default_page_size: int = 100) -> QueryCost:
+    """Analyze a query and raise QueryCostError when it goes over budget.
+    Arguments:
+        document_ast -- parsed query document.
+        variables -- variable values of the request.
+        operation_name -- operation of the document to execute.
+        max_cost -- cost budget, None disables it.
+        max_depth -- maximum field nesting, None disables it.
+        default_page_size -- rows assumed for connections without `first`
+        or `last`, also caps them.
+    """
+    score = CostAnalyzer(
+        document_ast, variables, default_page_size).analyze(operation_name)
+    if max_depth is not None and score.depth > max_depth:
+        raise QueryCostError(
+            f"Query depth {score.depth} exceeds the maximum depth {max_depth}")
+    if max_cost is not None and score.cost > max_cost:
+        raise QueryCostError(
+            f"Query cost {score.cost} exceeds the maximum cost {max_cost}, "
+            "narrow the connections with first/last")
+    return score
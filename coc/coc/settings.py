@@ -20,12 +20,18 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 # See https://docs.djangoproject.com/en/2.1/howto/deployment/checklist/
 
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = '6b_5lw#7mv&67m87()8zuy@)8qhclnimytq2$5^sw_^v0&4rf%'
+SECRET_KEY = os.environ.get(
+    'DJANGO_SECRET_KEY',
+    '6b_5lw#7mv&67m87()8zuy@)8qhclnimytq2$5^sw_^v0&4rf%'
+)
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+# The production profile (docker/docker-compose.prod.yml) sets DJANGO_DEBUG=0.
+DEBUG = os.environ.get('DJANGO_DEBUG', '1').lower() not in ('0', 'false', 'no')
 
-ALLOWED_HOSTS = ['coc', 'localhost', '127.0.0.1']
+ALLOWED_HOSTS = os.environ.get(
+    'DJANGO_ALLOWED_HOSTS', 'coc,localhost,127.0.0.1'
+).split(',')
 
 
 # Application definition
@@ -38,11 +44,12 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'graphene_django',
-    'creator'
+    'creator.apps.CreatorConfig'
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -70,17 +77,98 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'coc.wsgi.application'
+ASGI_APPLICATION = 'coc.asgi.application'
 
 
 # Database
 # https://docs.djangoproject.com/en/2.1/ref/settings/#databases
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': os.path.join(BASE_DIR, 'db.sqlite3'),
+# SQLite by default, DJANGO_DB_ENGINE=postgresql switches to the POSTGRES_*
+# variables. Connections are kept open DJANGO_DB_CONN_MAX_AGE seconds (0
+# closes them after every request, leave it at 0 behind a pooler in
+# transaction mode, eg. pgbouncer).
+DB_ENGINE = os.environ.get('DJANGO_DB_ENGINE', 'sqlite3')
+
+if DB_ENGINE == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('POSTGRES_DB', 'coc'),
+            'USER': os.environ.get('POSTGRES_USER', 'coc'),
+            'PASSWORD': os.environ.get('POSTGRES_PASSWORD', ''),
+            'HOST': os.environ.get('POSTGRES_HOST', 'localhost'),
+            'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+            'CONN_MAX_AGE': int(os.environ.get('DJANGO_DB_CONN_MAX_AGE', 60)),
+        }
     }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.path.join(BASE_DIR, 'db.sqlite3'),
+        }
+    }
+
+# Pragmas run on every new SQLite connection (creator.signals). The tuned
+# ones suit a single node deployment: WAL lets readers go on while a writer
+# commits, NORMAL syncs only at checkpoints, a busy writer is waited for
+# 5s instead of failing with "database is locked", 256MB are memory mapped
+# and 64MB of pages cached (negative cache_size is in KiB). They are on when
+# DEBUG is off, DJANGO_SQLITE_TUNING=0/1 overrides it. See the sqlite_bench
+# command for their effect under mixed load.
+SQLITE_TUNED_PRAGMAS = {
+    'journal_mode': 'wal',
+    'synchronous': 'normal',
+    'busy_timeout': 5000,
+    'mmap_size': 268435456,
+    'cache_size': -65536,
+    'temp_store': 'memory',
+}
+SQLITE_TUNING = os.environ.get(
+    'DJANGO_SQLITE_TUNING', '0' if DEBUG else '1'
+).lower() not in ('0', 'false', 'no')
+SQLITE_PRAGMAS = SQLITE_TUNED_PRAGMAS if SQLITE_TUNING else {}
+
+# Catalog search index (creator.search): 'memory' builds an inverted index in
+# every process, rebuilt after the catalog writes of the others (the shared
+# version of coc.cache), 'database' keeps a shared FTS5 (SQLite) or tsvector
+# (PostgreSQL) table, filled after migrating or by rebuild_search_index.
+SEARCH_BACKEND = os.environ.get('DJANGO_SEARCH_BACKEND', 'memory')
+
+# Seconds browsers may reuse the catalog listings before revalidating them
+# with their ETag.
+CATALOG_MAX_AGE = int(os.environ.get('DJANGO_CATALOG_MAX_AGE', 60))
+
+# Response cache of the read only catalog endpoints and graphql queries, see
+# coc.cache. 'locmem' is kept by every process, 'file' and 'redis' are shared
+# by the processes of a host or of every host.
+CACHE_BACKEND = os.environ.get('DJANGO_CACHE_BACKEND', 'locmem')
+CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'coc',
+        'OPTIONS': {'MAX_ENTRIES': 1000},
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get(
+            'DJANGO_CACHE_LOCATION', '/tmp/coc_cache'),
+        'OPTIONS': {'MAX_ENTRIES': 1000},
+    },
+    'redis': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': os.environ.get('REDIS_URL', 'redis://localhost:6379/1'),
+    },
+}
+CACHES = {
+    'default': CACHE_BACKENDS[CACHE_BACKEND],
 }
+# Alias of CACHES holding the responses, empty disables the response cache.
+CATALOG_CACHE = os.environ.get('DJANGO_CATALOG_CACHE', 'default')
+# Seconds an entry is kept, mutations of the catalog replace every entry
+# before that, see coc.cache.bump.
+CATALOG_CACHE_TIMEOUT = int(
+    os.environ.get('DJANGO_CATALOG_CACHE_TIMEOUT', 300))
 
 
 # Password validation
@@ -126,8 +214,59 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'uploads')
 MEDIA_URL = 'uploads/'
 #html files can only be loaded  if rendered through django views, this is needed to link to the templates statically as is
 STATICFILES_DIRS = [os.path.join(BASE_DIR, 'creator','templates'),]
+# Static files are served by whitenoise, from the finders while debugging and
+# from the compressed, hashed copies of collectstatic otherwise.
+WHITENOISE_USE_FINDERS = DEBUG
+WHITENOISE_AUTOREFRESH = DEBUG
+if not DEBUG:
+    STATICFILES_STORAGE = (
+        'whitenoise.storage.CompressedManifestStaticFilesStorage'
+    )
 # Remove this!
 DATA_UPLOAD_MAX_NUMBER_FIELDS = 100000000
+# Budget of a graphql query, checked before it runs. The cost counts every
+# object field, multiplied by the page size of the connections it is under
+# (first/last, RELAY_CONNECTION_MAX_LIMIT when missing). None disables them.
+GRAPHQL_MAX_QUERY_COST = 5000
+GRAPHQL_MAX_QUERY_DEPTH = 10
+# Parsed and validated graphql documents kept in memory.
+GRAPHQL_DOCUMENT_CACHE_SIZE = 256
+# Allowlist of queries clients can send by hash, see the register_queries
+# command. When GRAPHQL_PERSISTED_QUERIES_ONLY is set any other query is
+# refused.
+GRAPHQL_PERSISTED_QUERIES = os.path.join(BASE_DIR, 'persisted_queries.json')
+GRAPHQL_PERSISTED_QUERIES_ONLY = False
+# Root fields whose queries are answered from the response cache, when every
+# root field of the operation is one of them and every field of the query
+# returns one of the GRAPHQL_CACHED_TYPES (catalog nodes, their connections
+# and edges) or a scalar.
+GRAPHQL_CACHED_FIELDS = (
+    'allItems', 'allOccupations', 'allSkills', 'allSpells')
+GRAPHQL_CACHED_TYPES = ('ItemNode', 'OccupationNode', 'SkillNode', 'SpellNode')
+
+# Logging, one JSON object per line on stderr.
+LOG_LEVEL = os.environ.get('DJANGO_LOG_LEVEL', 'DEBUG' if DEBUG else 'INFO')
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'json': {'()': 'coc.log_format.JsonFormatter'},
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'json',
+        },
+    },
+    'root': {
+        'handlers': ['console'],
+        'level': LOG_LEVEL,
+    },
+    'loggers': {
+        # one record per query while debugging is too much even then.
+        'django.db.backends': {'level': 'INFO'},
+    },
+}
 #  GRAPHENE = {
     #  'SCHEMA': 'coc.schema.schema'
 #  }
@@ -18,14 +18,13 @@ from django.conf.urls.static import static
 from django.urls import path, include
 from django.contrib import admin
 
-from graphene_django.views import GraphQLView
-
 from coc.schema import schema
+from coc.views import MeteredGraphQLView
 
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path('graphql', GraphQLView.as_view(graphiql=True, schema=schema)),
+    path('graphql', MeteredGraphQLView.as_view(graphiql=True, schema=schema)),
     path('creator/', include('creator.urls'))
 ] + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
 
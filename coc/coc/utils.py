@@ -1,9 +1,61 @@
-from logging import DEBUG, basicConfig
+from logging import getLogger
 
-log = basicConfig(level=DEBUG)
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import CharField, Value
+from django.dispatch import Signal
+from django.utils import timezone
 
+log = getLogger(__name__)
 
-def mutation_flow(mutation, model, method, input_, field):
+# Sent after a mutation wrote its records, with the model as sender and the
+# method ('create', 'update' or 'delete') and records as arguments. Updates
+# and bulk writes skip the model signals, the caches of the mutated data are
+# kept current by its receivers, see creator.signals.
+mutated = Signal()
+
+
+def assign_relations(model, input_, relations):
+    """Swap the related pks of a mutation input for `<key>_id` entries, so
+    the related records are never loaded. Their existence is checked with
+    a single query for all the relations: unknown pks of nullable relations
+    are set to None, unknown pks of required ones are rejected.
+    Arguments:
+        model -- Django model being mutated.
+        input_ -- dictionary that contains all necessary information.
+        relations -- dict of input key to the related model.
+    """
+    values = {}
+    for key, related_model in relations.items():
+        if key not in input_:
+            continue
+        value = input_.pop(key)
+        if value is None:
+            input_[f'{key}_id'] = None
+            continue
+        try:
+            values[key] = related_model._meta.pk.to_python(value)
+        except ValidationError:
+            raise ValidationError(f"Invalid {key} {value}")
+    if not values:
+        return
+    checks = [
+        relations[key].objects.filter(pk=pk).annotate(
+            relation=Value(key, output_field=CharField())
+        ).values_list('relation', flat=True)
+        for key, pk in values.items()
+    ]
+    found = set(checks[0].union(*checks[1:], all=True))
+    for key, pk in values.items():
+        if key not in found:
+            if not model._meta.get_field(key).null:
+                raise ValidationError(
+                    f"{relations[key].__name__} {pk} does not exist")
+            pk = None
+        input_[f'{key}_id'] = pk
+
+
+def mutation_flow(mutation, model, method, input_, field, relations=None):
     """Considers the main flow of action at the mutations this is
     the same for each one of them.
     Arguments:
@@ -12,8 +64,12 @@ def mutation_flow(mutation, model, method, input_, field):
         method -- CREATE, DELETE OR UPDATE
         input_ -- dictionary that contains all necessary information.
         field -- string that represents the field name of the mutation.
+        relations -- dict of input keys holding the pk of a related record to
+        its model, assigned by id, see assign_relations.
     """
     method = method.lower().strip()
+    if relations and method != 'delete':
+        assign_relations(model, input_, relations)
     if method != 'create':
         uuid = input_.get('uuid')
         assert uuid is not None, "Mutations require a UUID"
@@ -23,15 +79,148 @@ def mutation_flow(mutation, model, method, input_, field):
             mutate.delete()
             # Mitigates Graphql "GraphQLError: Cannot return null for non-nullable field"
             mutate.uuid = uuid
+            mutated.send(sender=model, method=method, records=[mutate])
             return mutation(**{field: mutate})
     
         if method == 'update':
             del input_['uuid']
             mutations.update(**input_)
             mutate = mutations.first()
+            # update() skips save(), refresh the derived values it changed.
+            if (hasattr(mutate, 'refresh_derived_stats')
+                    and mutate.refresh_derived_stats()):
+                mutate.save(update_fields=model.DERIVED_FIELDS)
+            mutated.send(sender=model, method=method, records=[mutate])
 
             return mutation(**{field: mutate})
     else: 
         mutate = model(**input_) 
         mutate.save()
+        mutated.send(sender=model, method=method, records=[mutate])
         return mutation(**{field: mutate})
+
+
+def resolve_relations(inputs, relations, errors):
+    """Swap the related pks of the inputs for their records, loaded with a
+    single query per relation.
+    Arguments:
+        inputs -- list of mutation input dictionaries.
+        relations -- dict of input key to the related model.
+        errors -- dict of input index to its list of error messages.
+    """
+    for key, related_model in relations.items():
+        pk_field = related_model._meta.pk
+        values = {}
+        for index, input_ in enumerate(inputs):
+            value = input_.get(key)
+            if value is None:
+                continue
+            try:
+                values[index] = pk_field.to_python(value)
+            except ValidationError:
+                errors.setdefault(index, []).append(f"Invalid {key} {value}")
+        found = related_model.objects.in_bulk(set(values.values()))
+        for index, input_ in enumerate(inputs):
+            if key not in input_:
+                continue
+            if index in values and values[index] not in found:
+                errors.setdefault(index, []).append(
+                    f"{related_model.__name__} {input_[key]} does not exist")
+            input_[key] = found.get(values.get(index))
+
+
+def bulk_mutation_flow(mutation, model, method, inputs, field, relations=None):
+    """Bulk counterpart of mutation_flow, the whole batch is validated before
+    anything is written and then created, updated or deleted in a single
+    transaction.
+    Arguments:
+        mutation -- Mutation class
+        model -- Django model to be generated
+        method -- CREATE, DELETE OR UPDATE
+        inputs -- list of dictionaries, one per record.
+        field -- string that represents the (list) field name of the mutation.
+        relations -- dict of input keys holding the pk of a related record to
+        its model, resolved with one query per relation.
+    """
+    method = method.lower().strip()
+    assert method in ('create', 'update', 'delete'), "Unknown method"
+    inputs = [dict(input_) for input_ in inputs]
+    errors = {}
+    records = []
+    if method != 'create':
+        uuids = [input_.pop('uuid', None) for input_ in inputs]
+        assert all(uuids), "Mutations require a UUID"
+        # the related records are returned along, join them
+        queryset = model.objects.select_related(*(relations or {}))
+        existing = {
+            str(pk): record for pk, record in queryset.in_bulk(uuids).items()
+        }
+        for index, uuid in enumerate(uuids):
+            if str(uuid) not in existing:
+                errors.setdefault(index, []).append(f"{uuid} does not exist")
+            records.append(existing.get(str(uuid)))
+
+    if method == 'delete':
+        if errors:
+            raise ValidationError(_error_messages(errors))
+        with transaction.atomic():
+            model.objects.filter(pk__in=[record.pk for record in records]).delete()
+        mutated.send(sender=model, method=method, records=records)
+        return mutation(**{field: records})
+
+    resolve_relations(inputs, relations or {}, errors)
+    relation_fields = [
+        model_field.name for model_field in model._meta.concrete_fields
+        if model_field.is_relation
+    ]
+    if method == 'create':
+        records = [model(**input_) for input_ in inputs]
+    else:
+        for record, input_ in zip(records, inputs):
+            if record is None:
+                continue
+            for key, value in input_.items():
+                setattr(record, key, value)
+    for index, record in enumerate(records):
+        if record is None:
+            continue
+        try:
+            # related records were already checked, skip their queries
+            record.clean_fields(exclude=relation_fields)
+        except ValidationError as error:
+            errors.setdefault(index, []).extend(
+                f"{key}: {' '.join(messages)}"
+                for key, messages in error.message_dict.items()
+            )
+    if errors:
+        raise ValidationError(_error_messages(errors))
+
+    # bulk writes skip save(), models storing derived values refresh them.
+    derived_fields = getattr(model, 'DERIVED_FIELDS', ())
+    if derived_fields:
+        for record in records:
+            record.refresh_derived_stats()
+    with transaction.atomic():
+        if method == 'create':
+            records = model.objects.bulk_create(records)
+        else:
+            updated = {key for input_ in inputs for key in input_}
+            if derived_fields:
+                updated.update(derived_fields)
+            # bulk_update does not run auto_now
+            if 'modified' in [f.name for f in model._meta.concrete_fields]:
+                now = timezone.now()
+                for record in records:
+                    record.modified = now
+                updated.add('modified')
+            if updated:
+                model.objects.bulk_update(records, list(updated))
+    mutated.send(sender=model, method=method, records=records)
+    return mutation(**{field: records})
+
+
+def _error_messages(errors: dict) -> list:
+    return [
+        f"records[{index}] {message}"
+        for index in sorted(errors) for message in errors[index]
+    ]
@@ -0,0 +1,94 @@
+from json import loads
+
+from django.conf import settings
+from django.db import connection
+from django.http import HttpResponseBadRequest
+from graphene_django.views import GraphQLView, HttpError
+
+from coc.backends import (CostAnalysisBackend, LRUCachedBackend,
+                          ResultCachedBackend)
+from coc.persisted_queries import persisted_queries
+
+
+class QueryCounter:
+    """Database execute wrapper counting the queries it lets through."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class MeteredGraphQLView(GraphQLView):
+    """GraphQL view reporting the database queries each request cost, along
+    the query cost, in the response extensions, eg.
+    {"extensions": {"queries": 3, "cost": 201}}.
+    Queries are scored before they run, see CostAnalysisBackend, their
+    parsed documents are kept in a LRU cache and the results of the catalog
+    queries in the response cache, see ResultCachedBackend.
+
+    Registered queries can be sent by hash instead of text, as in the
+    automatic persisted queries protocol:
+    {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": "..."}}}
+    """
+
+    def __init__(self, *args, backend=None, **kwargs):
+        if backend is None:
+            backend = LRUCachedBackend(
+                ResultCachedBackend(
+                    CostAnalysisBackend.from_settings(),
+                    fields=settings.GRAPHQL_CACHED_FIELDS,
+                    types=settings.GRAPHQL_CACHED_TYPES
+                ),
+                maxsize=settings.GRAPHQL_DOCUMENT_CACHE_SIZE
+            )
+        super().__init__(*args, backend=backend, **kwargs)
+
+    @staticmethod
+    def persisted_query_hash(request, data):
+        """Hash of the persisted query requested, None when not sent."""
+        extensions = request.GET.get('extensions') or data.get('extensions')
+        if isinstance(extensions, str):
+            try:
+                extensions = loads(extensions)
+            except ValueError:
+                raise HttpError(
+                    HttpResponseBadRequest("Extensions are invalid JSON."))
+        if not isinstance(extensions, dict):
+            return None
+        persisted_query = extensions.get('persistedQuery') or {}
+        return persisted_query.get('sha256Hash')
+
+    @staticmethod
+    def get_graphql_params(request, data):
+        query, variables, operation_name, id = GraphQLView.get_graphql_params(
+            request, data)
+        hash_ = MeteredGraphQLView.persisted_query_hash(request, data)
+        if hash_ is not None:
+            persisted_query = persisted_queries.get(hash_)
+            if persisted_query is None:
+                raise HttpError(
+                    HttpResponseBadRequest("PersistedQueryNotFound"))
+            query = persisted_query
+        elif (query and settings.GRAPHQL_PERSISTED_QUERIES_ONLY
+              and query not in persisted_queries):
+            raise HttpError(
+                HttpResponseBadRequest("Query is not a persisted query."))
+        return query, variables, operation_name, id
+
+    def execute_graphql_request(self, request, *args, **kwargs):
+        counter = QueryCounter()
+        with connection.execute_wrapper(counter):
+            result = super().execute_graphql_request(request, *args, **kwargs)
+        request.graphql_extensions = {'queries': counter.count}
+        if result is not None:
+            request.graphql_extensions.update(result.extensions)
+        return result
+
+    def json_encode(self, request, d, pretty=False):
+        extensions = getattr(request, 'graphql_extensions', None)
+        if isinstance(d, dict) and extensions is not None:
+            d['extensions'] = extensions
+        return super().json_encode(request, d, pretty)
@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class CreatorConfig(AppConfig):
     name = 'creator'
+
+    def ready(self):
+        # Connect signal receivers.
+        import creator.signals  # noqa: F401
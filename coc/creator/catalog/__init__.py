@@ -0,0 +1,168 @@
+# '''
+# in process reference data cache module.
+# '''
+from collections import namedtuple
+from threading import Lock
+from types import MappingProxyType
+
+from coc import cache
+from creator.constants import ERA
+from creator.models import Item, Occupation, Skills, Spell
+
+Catalog = namedtuple(
+    'Catalog',
+    [
+        'version',
+        'skills',
+        'skills_by_era',
+        'skill_templates',
+        'occupations',
+        'occupations_by_era',
+        'items',
+        'items_by_uuid',
+        'items_by_era',
+        'items_by_category',
+        'items_by_subcategory',
+        'spells',
+        'spells_by_uuid',
+        'spells_by_category',
+    ]
+)
+
+
+
+class SkillTemplate(namedtuple('SkillTemplate', ['era', 'skills', 'categories'])):
+    """Precompiled skill sheet of an era.
+    Attributes:
+        era -- era of the template.
+        skills -- ordered tuple of (skill name, base value) pairs, category
+        skills are expanded into their "Title(Sub)" names.
+        categories -- mapping of category skill titles (eg. "Science") to
+        the tuple of their expanded skill names.
+    """
+    __slots__ = ()
+
+    def new_sheet(self) -> dict:
+        """Fresh skill dict as stored at Investigator.skills."""
+        return {
+            name: {'base_value': base_value, 'value': base_value}
+            for name, base_value in self.skills
+        }
+
+
+_lock = Lock()
+_version = 0
+_catalog = None
+# shared version (coc.cache) the catalog was loaded at, the writes of the
+# other processes bump it.
+_loaded_at = None
+
+
+def _index(records, key) -> MappingProxyType:
+    """Group records into a read only mapping of tuples.
+    Arguments:
+        records -- iterable of model instances.
+        key -- callable returning the grouping key of a record.
+    """
+    groups = {}
+    for record in records:
+        groups.setdefault(key(record), []).append(record)
+    return MappingProxyType(
+        {group: tuple(members) for group, members in groups.items()}
+    )
+
+
+def _skill_template(era: str, skills: tuple) -> SkillTemplate:
+    """Expand the skills into a flat template for the given era.
+    Skills of other eras are kept since occupations reference them, the
+    era own rows win when titles clash.
+    """
+    base_values = {}
+    categories = {}
+    for skill in sorted(skills, key=lambda skill: skill.era == era):
+        sub_skills = skill.sub_skills
+        if sub_skills:
+            names = []
+            for sub_skill in sub_skills:
+                name = f"{skill.title}({sub_skill})"
+                sub_skill_val = sub_skills[sub_skill].get('base_value')
+                if sub_skill_val is None:
+                    sub_skill_val = skill.base_value
+                base_values[name] = sub_skill_val
+                names.append(name)
+            categories[skill.title] = tuple(names)
+        else:
+            base_values[skill.title] = skill.base_value
+    template = SkillTemplate(
+        era=era,
+        skills=tuple(base_values.items()),
+        categories=MappingProxyType(categories)
+    )
+    return template
+
+
+def _load(version: int) -> Catalog:
+    """Read every catalog table once and build its indexes."""
+    # stable ordering, seeded generations pick the same entries.
+    skills = tuple(Skills.objects.order_by('era', 'title', 'uuid'))
+    occupations = tuple(Occupation.objects.order_by('era', 'title', 'uuid'))
+    items = tuple(Item.objects.order_by('era', 'title', 'uuid'))
+    spells = tuple(Spell.objects.order_by('name', 'uuid'))
+    catalog = Catalog(
+        version=version,
+        skills=skills,
+        skills_by_era=_index(skills, lambda skill: skill.era),
+        skill_templates=MappingProxyType(
+            {era: _skill_template(era, skills) for era, _ in ERA}
+        ),
+        occupations=occupations,
+        occupations_by_era=_index(occupations, lambda occ: occ.era),
+        items=items,
+        items_by_uuid=MappingProxyType({item.uuid: item for item in items}),
+        items_by_era=_index(items, lambda item: item.era),
+        items_by_category=_index(items, lambda item: item.category),
+        items_by_subcategory=_index(
+            items,
+            lambda item: (item.category, item.properties.get('subcategory'))
+        ),
+        spells=spells,
+        spells_by_uuid=MappingProxyType(
+            {spell.uuid: spell for spell in spells}),
+        spells_by_category=_index(spells, lambda spell: spell.category),
+    )
+    return catalog
+
+
+def get_catalog() -> Catalog:
+    """Return the loaded catalog, reading the database only the first time,
+    after an invalidation or once the reference data changed in another
+    process (the shared version of coc.cache moved on)."""
+    shared = cache.version()
+    catalog = _catalog
+    if catalog is None or _loaded_at != shared:
+        catalog = _reload(shared)
+    return catalog
+
+
+def _reload(shared) -> Catalog:
+    global _catalog, _loaded_at
+    with _lock:
+        if _catalog is None or _loaded_at != shared:
+            # the version is read before the data, a concurrent write
+            # reloads it again.
+            _catalog = _load(_version)
+            _loaded_at = shared
+        return _catalog
+
+
+def invalidate():
+    """Drop the loaded catalog, the next access reloads it."""
+    global _catalog, _version
+    with _lock:
+        _version += 1
+        _catalog = None
+
+
+def version() -> int:
+    """Version of the catalog, increased on every invalidation."""
+    return _version
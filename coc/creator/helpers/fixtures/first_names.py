@@ -1,3542 +0,0 @@
-FIRST_NAMES = [
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "John"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Dorothy"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Michael"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Madison"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "James"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Helen"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Joshua"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Emma"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "William"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Betty"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Matthew"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Olivia"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Charles"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Margaret"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Daniel"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Hannah"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "George"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Ruth"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Christopher"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Abigail"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Joseph"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Virginia"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Andrew"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Isabella"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Richard"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Doris"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Ethan"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Samantha"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Edward"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Mildred"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Elizabeth"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Donald"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Frances"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Ashley"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Thomas"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Anthony"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Alexis"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Frank"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Evelyn"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "David"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Sarah"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Harold"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Anna"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Alexander"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Sophia"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Paul"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Marie"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Nicholas"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Alyssa"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Raymond"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Alice"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Ryan"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Grace"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Walter"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Jean"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Tyler"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Ava"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Jack"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Shirley"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Taylor"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Henry"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Barbara"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Brianna"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Kenneth"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Irene"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Jonathan"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Lauren"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Arthur"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Marjorie"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Noah"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Chloe"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Albert"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Florence"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Brandon"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Natalie"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Lois"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Christian"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Kayla"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Harry"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Martha"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Dylan"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Jessica"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Eugene"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Rose"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Samuel"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Ralph"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Lillian"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Benjamin"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Victoria"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Howard"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Louise"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Nathan"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Mia"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Carl"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Catherine"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Zachary"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Hailey"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Willie"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Ruby"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Logan"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Sydney"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Louis"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Eleanor"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Justin"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Jasmine"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Clarence"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Patricia"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Gabriel"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Julia"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Earl"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Gladys"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Jose"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Morgan"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Roy"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Annie"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Austin"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Destiny"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Fred"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Josephine"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Kevin"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Rachel"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Joe"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Thelma"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Elijah"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Ella"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Francis"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Edna"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Caleb"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Kaitlyn"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Lawrence"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Norma"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Robert"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Megan"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Herbert"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Pauline"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Katherine"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Leonard"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Lucille"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Jordan"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Savannah"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Ernest"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Edith"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Cameron"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Jennifer"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Alfred"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Gloria"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Alexandra"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Ethel"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Hunter"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Allison"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Stanley"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Phyllis"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Jackson"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Haley"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Norman"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Angel"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Maria"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Gerald"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Hazel"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Isaiah"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Kaylee"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "June"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Evan"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Lily"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Bernice"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Isaac"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Makayla"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Bernard"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Marion"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Luke"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Brooke"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Billy"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Dolores"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Mason"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Nicole"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Melvin"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Rita"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Jayden"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Mackenzie"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Marvin"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Lorraine"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Jason"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Addison"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Warren"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Ann"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Gavin"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Stephanie"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Esther"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Aaron"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Leroy"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Beatrice"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Connor"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Andrea"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Russell"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Juanita"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Aiden"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Faith"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Leo"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Clara"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Aidan"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Zoe"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Jane"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Kyle"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Kimberly"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Edwin"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Geraldine"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Juan"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Madeline"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Elmer"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Alexa"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Peter"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Luis"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Katelyn"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Floyd"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Joan"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Adam"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Gabriella"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Lloyd"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Joyce"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Lucas"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Gabrielle"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Ray"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Nancy"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Brian"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Trinity"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Frederick"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Eric"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Amanda"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Theodore"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Gertrude"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Adrian"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Kylie"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Clifford"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Elsie"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Nathaniel"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Mary"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Vernon"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Sean"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Paige"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Herman"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Agnes"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Alex"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Riley"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Clyde"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Wilma"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Carlos"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Leah"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Chester"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Marian"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Bryan"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Jenna"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Philip"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Bertha"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Ian"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Sara"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Alvin"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Eva"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Owen"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Rebecca"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Lester"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Jesus"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Michelle"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Wayne"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Audrey"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Landon"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Sofia"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Vincent"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Theresa"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Julian"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Vanessa"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Gordon"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Vivian"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Chase"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Leon"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Wanda"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Cole"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Angelina"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Lewis"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Laura"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Diego"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Caroline"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Charlie"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Charlotte"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Jeremiah"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Avery"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Glenn"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Ida"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Steven"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Calvin"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Elaine"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Sebastian"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Martin"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Anne"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Xavier"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Maya"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Milton"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Marilyn"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Timothy"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Claire"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Lee"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Kathryn"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Carter"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Autumn"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Jesse"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Maxine"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Wyatt"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Jocelyn"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Dale"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Kathleen"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Brayden"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Ariana"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Cecil"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Viola"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Blake"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Nevaeh"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Bill"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Pearl"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Hayden"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Arianna"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Harvey"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Vera"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Devin"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Jada"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Roger"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Bessie"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Cody"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Bailey"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Victor"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Myrtle"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Brooklyn"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Alma"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Seth"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Aaliyah"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Wallace"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Beverly"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Dominic"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Amber"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Ronald"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Violet"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Jaden"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Isabel"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Sam"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Nellie"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Antonio"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Mariah"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Allen"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Miguel"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Danielle"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Arnold"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Lillie"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Liam"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Melanie"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Willard"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Jessie"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Patrick"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Sierra"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Gilbert"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Jeanne"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Carson"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Erin"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Edgar"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Eileen"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Amelia"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Oscar"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Ellen"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Tristan"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Molly"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Gene"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Lucy"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Alejandro"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Isabelle"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Jerry"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Minnie"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Madelyn"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Douglas"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Sylvia"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Melissa"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Johnnie"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Donna"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Trevor"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Jacqueline"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Claude"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Leona"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Bryce"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Marissa"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Don"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Rosemary"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Jake"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Angela"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Eddie"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Stella"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Shelby"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Roland"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Mattie"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Colin"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Leslie"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Everett"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Margie"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Jared"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Katie"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Maurice"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Genevieve"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Jeremy"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Jade"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Curtis"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Mabel"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Mark"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Janet"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Caden"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Diana"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Virgil"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Geneva"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Garrett"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Aubrey"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Wilbur"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Georgia"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Parker"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Mya"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Manuel"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Bonnie"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Marcus"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Amy"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Stephen"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Carol"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Briana"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Jerome"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Velma"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Kaleb"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Sophie"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Homer"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Lena"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Kaden"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Gabriela"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Carolyn"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Brady"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Breanna"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Glen"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Mae"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Colton"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Gianna"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Jennie"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Kennedy"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Hubert"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Joel"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Gracie"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Christine"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Peyton"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Jimmie"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Arlene"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Josiah"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Adriana"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Sidney"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Peggy"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Jorge"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Christina"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Morris"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Marguerite"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Ashton"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Courtney"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Hugh"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Opal"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Cooper"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Daniela"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Max"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Tanner"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Lydia"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Bobby"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Loretta"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Eduardo"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Bob"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Harriet"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Valeria"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Rosa"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Layla"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Luther"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Muriel"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Ivan"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Alexandria"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Bruce"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Eunice"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Preston"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Natalia"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Junior"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Jeanette"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Maxwell"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Wesley"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Blanche"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Alan"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Rudolph"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Carrie"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Levi"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Emily"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Franklin"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Beulah"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Grant"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Cheyenne"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Tom"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Billie"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Nicolas"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Miranda"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Irving"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Dora"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Dakota"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Mikayla"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Horace"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Roberta"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Omar"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Naomi"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Willis"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Hilda"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Kelsey"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Payton"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Steve"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Anita"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Eli"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Ana"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Johnny"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Collin"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Alicia"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Dean"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Alberta"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Spencer"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Jillian"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Julius"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Inez"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Gage"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Daisy"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Keith"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Delores"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Mckenzie"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Oliver"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Fannie"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Ricardo"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Ashlyn"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Earnest"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Hattie"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Cristian"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Sabrina"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Ben"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Lula"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Derek"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Caitlin"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Jim"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Verna"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Micah"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Summer"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Tony"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Cora"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Brody"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Edmund"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Constance"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Francisco"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Rylee"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Lyle"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Nolan"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Valerie"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Guy"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Miriam"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Ayden"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Skylar"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Salvatore"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Ada"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Dalton"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Lindsey"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Orville"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Shane"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Kelly"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Delbert"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Mamie"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Genesis"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Lola"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Damian"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Zoey"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Phillip"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Rosie"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Jeffrey"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Clayton"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Erma"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Brendan"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Sadie"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Otis"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Travis"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Alexia"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Archie"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Mable"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Fernando"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Cassidy"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Flora"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Kylee"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Angelo"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Conner"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Kendall"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Mike"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Sally"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Andres"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Jordyn"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Jacob"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Marcella"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Javier"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Kate"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Clifton"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Bette"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Giovanni"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Jayla"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Bennie"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Olga"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Shawn"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Karen"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Duane"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Braden"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Tiffany"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Laverne"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Jonah"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Cassandra"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Clinton"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Bradley"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Juliana"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Dennis"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Nora"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Cesar"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Reagan"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Wilbert"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Emmanuel"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Caitlyn"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Dan"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Estelle"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Giselle"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Jay"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Irma"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Serenity"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Marshall"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Susie"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Mario"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Alondra"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Leland"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Eula"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Erik"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Merle"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Winifred"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Bianca"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Ira"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Eloise"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Johnathan"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Kiara"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Janice"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Devon"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Crystal"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Maggie"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Erick"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Erica"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Ervin"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Antoinette"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Angelica"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Jimmy"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Nina"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Hope"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Irvin"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Rosalie"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Trenton"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Chelsea"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Alton"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Imogene"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Hector"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Alana"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Lowell"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Lorene"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Malachi"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Liliana"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Dewey"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Olive"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Jalen"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Brittany"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Larry"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Camila"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Emil"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Regina"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Gregory"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Makenzie"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Abraham"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Lilly"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Wilfred"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Henrietta"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Elias"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Veronica"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Elbert"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Della"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Leonardo"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Abby"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Bettie"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Sergio"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Jazmin"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Lila"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Donovan"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Adrianna"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Allan"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Fern"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Colby"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Delaney"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Lonnie"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Faye"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Marco"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Karina"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Nelson"
-    },
-    {
-        "decade": "00'",
-        "gender": "male",
-        "first_name": "Bryson"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Ellie"
-    },
-    {
-        "decade": "20'",
-        "gender": "male",
-        "first_name": "Forrest"
-    },
-    {
-        "decade": "20'",
-        "gender": "female",
-        "first_name": "Jeannette"
-    },
-    {
-        "decade": "00'",
-        "gender": "female",
-        "first_name": "Jasmin"
-    }
-]
\ No newline at end of file
@@ -1,321 +0,0 @@
-LAST_NAMES = [
-    "JONES",
-    "BROWN",
-    "JOHNSON",
-    "WILLIAMS",
-    "MILLER",
-    "TAYLOR",
-    "WILSON",
-    "DAVIS",
-    "WHITE",
-    "CLARK",
-    "HALL",
-    "THOMAS",
-    "THOMPSON",
-    "MOORE",
-    "HILL",
-    "WALKER",
-    "ANDERSON",
-    "WRIGHT",
-    "MARTIN",
-    "WOOD",
-    "ALLEN",
-    "ROBINSON",
-    "LEWIS",
-    "SCOTT",
-    "YOUNG",
-    "JACKSON",
-    "ADAMS",
-    "TRYNISKI",
-    "GREEN",
-    "EVANS",
-    "KING",
-    "BAKER",
-    "JOHN",
-    "HARRIS",
-    "ROBERTS",
-    "CAMPBELL",
-    "JAMES",
-    "STEWART",
-    "LEE",
-    "COUNTY",
-    "TURNER",
-    "PARKER",
-    "COOK",
-    "MC",
-    "EDWARDS",
-    "MORRIS",
-    "MITCHELL",
-    "BELL",
-    "WARD",
-    "WATSON",
-    "MORGAN",
-    "DAVIES",
-    "COOPER",
-    "PHILLIPS",
-    "ROGERS",
-    "GRAY",
-    "HUGHES",
-    "HARRISON",
-    "CARTER",
-    "MURPHY",
-    "COLLINS",
-    "HENRY",
-    "FOSTER",
-    "RICHARDSON",
-    "RUSSELL",
-    "HAMILTON",
-    "SHAW",
-    "BENNETT",
-    "HOWARD",
-    "REED",
-    "FISHER",
-    "MARSHALL",
-    "MAY",
-    "CHURCH",
-    "WASHINGTON",
-    "KELLY",
-    "PRICE",
-    "MURRAY",
-    "WILLIAM",
-    "PALMER",
-    "STEVENS",
-    "COX",
-    "ROBERTSON",
-    "MISS",
-    "CLARKE",
-    "BAILEY",
-    "GEORGE",
-    "NELSON",
-    "MASON",
-    "BUTLER",
-    "MILLS",
-    "HUNT",
-    "ISLAND",
-    "SIMPSON",
-    "GRAHAM",
-    "HENDERSON",
-    "ROSS",
-    "STONE",
-    "PORTER",
-    "WALLACE",
-    "KENNEDY",
-    "GIBSON",
-    "WEST",
-    "BROOKS",
-    "ELLIS",
-    "BARNES",
-    "JOHNSTON",
-    "SULLIVAN",
-    "WELLS",
-    "HART",
-    "FORD",
-    "REYNOLDS",
-    "ALEXANDER",
-    "CO",
-    "COLE",
-    "FOX",
-    "HOLMES",
-    "DAY",
-    "CHAPMAN",
-    "POWELL",
-    "WEBSTER",
-    "LONG",
-    "RICHARDS",
-    "GRANT",
-    "HUNTER",
-    "WEBB",
-    "THOMSON",
-    "WM",
-    "LINCOLN",
-    "GORDON",
-    "WHEELER",
-    "STREET",
-    "PERRY",
-    "BLACK",
-    "LANE",
-    "GARDNER",
-    "CITY",
-    "LAWRENCE",
-    "ANDREWS",
-    "WARREN",
-    "SPENCER",
-    "RICE",
-    "JENKINS",
-    "KNIGHT",
-    "ARMSTRONG",
-    "BURNS",
-    "BARKER",
-    "DUNN",
-    "REID",
-    "COLLEGE",
-    "MARY",
-    "HAYES",
-    "PAGE",
-    "ROSE",
-    "PATTERSON",
-    "ANN",
-    "CRAWFORD",
-    "ARNOLD",
-    "HOUSE",
-    "FLETCHER",
-    "HARVEY",
-    "FULLER",
-    "ELLIOTT",
-    "CARPENTER",
-    "PERKINS",
-    "MORRISON",
-    "PETERSON",
-    "DAVIDSON",
-    "FERGUSON",
-    "PARK",
-    "MYERS",
-    "RYAN",
-    "FREEMAN",
-    "PIERCE",
-    "FELLOWS",
-    "DOUGLAS",
-    "TUCKER",
-    "DIXON",
-    "BRADLEY",
-    "HOPKINS",
-    "POTTER",
-    "LLOYD",
-    "OWEN",
-    "PAYNE",
-    "CURTIS",
-    "NEWTON",
-    "WOODS",
-    "CARR",
-    "DUNCAN",
-    "FRENCH",
-    "BALDWIN",
-    "FIELD",
-    "BISHOP",
-    "PEARSON",
-    "BRIEN",
-    "WILLIAMSON",
-    "NICHOLS",
-    "WILKINSON",
-    "BALL",
-    "BURTON",
-    "MORTON",
-    "BRYAN",
-    "SHERMAN",
-    "BERRY",
-    "WARNER",
-    "PRATT",
-    "GILBERT",
-    "BOOTH",
-    "HUDSON",
-    "FRANK",
-    "WALSH",
-    "DEAN",
-    "AUSTIN",
-    "BURKE",
-    "MATTHEWS",
-    "BOYD",
-    "DAWSON",
-    "COLEMAN",
-    "STEVENSON",
-    "PARSONS",
-    "FRANCIS",
-    "GRIFFIN",
-    "SHARP",
-    "GOULD",
-    "BARRETT",
-    "CHARLES",
-    "NEWMAN",
-    "HAWKINS",
-    "OLIVER",
-    "CUNNINGHAM",
-    "SNYDER",
-    "BATES",
-    "FRANKLIN",
-    "MARSH",
-    "NORTON",
-    "HOWE",
-    "FOWLER",
-    "GEO",
-    "HOLLAND",
-    "CARROLL",
-    "HALE",
-    "STUART",
-    "IT",
-    "STEPHENS",
-    "ATKINSON",
-    "CAMERON",
-    "HARPER",
-    "SIMMONS",
-    "BARBER",
-    "BARTON",
-    "LITTLE",
-    "LYNCH",
-    "MANN",
-    "HOLT",
-    "SANDERS",
-    "CONNOR",
-    "CROSS",
-    "CRAIG",
-    "JORDAN",
-    "ELIZABETH",
-    "CLAY",
-    "BRYANT",
-    "PETERS",
-    "RILEY",
-    "SAUNDERS",
-    "WELCH",
-    "WILLIS",
-    "HAMMOND",
-    "ROBERT",
-    "PAUL",
-    "COOKE",
-    "BUCHANAN",
-    "BRUCE",
-    "HAY",
-    "FLEMING",
-    "WATTS",
-    "JOSEPH",
-    "BLAIR",
-    "EDWARD",
-    "STANLEY",
-    "BROS",
-    "KERR",
-    "SUTTON",
-    "HOWELL",
-    "WEAVER",
-    "LAMB",
-    "OWENS",
-    "TODD",
-    "ROOSEVELT",
-    "DAVID",
-    "GREENE",
-    "LEONARD",
-    "WALTER",
-    "GREGORY",
-    "HICKS",
-    "MONTGOMERY",
-    "ABBOTT",
-    "MILES",
-    "BLAKE",
-    "WALTON",
-    "GOODWIN",
-    "HUTCHINSON",
-    "GRIFFITHS",
-    "GRIFFITH",
-    "JANE",
-    "CHAMBERS",
-    "BAXTER",
-    "LAWSON",
-    "HOFFMAN",
-    "JENNINGS",
-    "CHASE",
-    "BRIGGS",
-    "KELLEY",
-    "HARDING",
-    "CHANDLER",
-    "MEYER",
-    "FRASER",
-    "NO",
-    "AVENUE"
-]
\ No newline at end of file
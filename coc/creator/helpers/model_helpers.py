@@ -1,5 +1,5 @@
+import random
 from datetime import datetime as dt
-from random import randint
 
 
 def renamer(instance, filename) -> str:
@@ -22,9 +22,15 @@ def renamer(instance, filename) -> str:
     return fname_clean
 
 
-def roller_stats(dsix: int = 3) -> int:
-    """Roll for stats specifying the amount of d6."""
-    stat = sum([randint(1, 6) for _ in range(dsix)])
+def roller_stats(dsix: int = 3, rng=random) -> int:
+    """Roll for stats specifying the amount of d6.
+
+    Keyword arguments:
+
+    dsix -- amount of d6 to roll.
+    rng -- random.Random instance used for the rolls.
+    """
+    stat = sum([rng.randint(1, 6) for _ in range(dsix)])
     if dsix == 2:
         stat += 6
         stat *= 5
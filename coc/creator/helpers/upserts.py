@@ -0,0 +1,91 @@
+# '''
+# race free upserts of the investigator relations module.
+# '''
+from django.db import connections, transaction
+from django.db.models import Count, F, Max
+
+
+def add_once(model, select_related=(), **lookup):
+    """Insert a row unless one with the same lookup values exists, in two
+    queries: the insert, that the database ignores when it conflicts with
+    the unique constraint on the lookup fields, and the read of the row.
+    Concurrent adds never duplicate the row and only one of them creates it.
+    Arguments:
+        model -- Django model with a unique constraint on the lookup fields.
+        select_related -- relations read along the row.
+        lookup -- field values of the row, eg. investigator_id, mania_id.
+    Returns:
+        (instance, created) as get_or_create.
+    """
+    candidate = model(**lookup)
+    model.objects.bulk_create([candidate], ignore_conflicts=True)
+    instance = model.objects.select_related(*select_related).get(**lookup)
+    return instance, instance.pk == candidate.pk
+
+
+def stack(model, owner, field: str = 'stock', read_owner: bool = True,
+          **lookup):
+    """Add one to the `field` counter of the row matching the lookup, or
+    create it. Concurrent adds to the same owner are applied one after the
+    other instead of creating two rows: the owner row is locked first on the
+    databases with row locks, on SQLite the update takes the database write
+    lock (a read first would deadlock the upgrade of two transactions).
+    Arguments:
+        model -- Django model of the stacked rows.
+        owner -- queryset of the single row owning the stack, eg. the
+        investigator of an inventory.
+        field -- counter field.
+        read_owner -- return the owner of a created row, without it a new
+        row costs two queries on SQLite (the update and the insert).
+        lookup -- field values of the row.
+    Returns:
+        (owner, instance, created), owner and instance are None when an
+        existing row was increased, owner is None as well when it is not
+        read.
+    """
+    connection = connections[model.objects.db]
+    with transaction.atomic():
+        if connection.features.has_select_for_update:
+            owner = owner.select_for_update().get()
+        increased = model.objects.filter(**lookup).update(
+            **{field: F(field) + 1})
+        if increased:
+            return None, None, False
+        if not connection.features.has_select_for_update:
+            owner = owner.get() if read_owner else None
+        instance = model.objects.create(**lookup)
+    return owner, instance, True
+
+
+def remove_duplicates(model, fields, merge=(), using=None):
+    """Delete the rows repeating the values of `fields` of another row,
+    keeping the earliest created of each group, so the unique constraint on
+    the fields can be added. Running it again deletes nothing.
+    Arguments:
+        model -- Django model of the rows.
+        fields -- names of the fields that must be unique together.
+        merge -- numeric fields the kept row takes the largest value of
+        among its group, eg. the duration of a mania.
+        using -- database alias, the default one of the model when None.
+    Returns:
+        number of deleted rows.
+    """
+    deleted = 0
+    manager = model._default_manager.db_manager(using)
+    # only the named columns are read, the table may be behind the model
+    # while migrating.
+    groups = manager.values(*fields).annotate(
+        rows=Count('pk'),
+        **{f'{field}_max': Max(field) for field in merge}
+    ).filter(rows__gt=1).order_by()
+    with transaction.atomic(using=manager.db):
+        for group in groups:
+            rows = manager.filter(
+                **{field: group[field] for field in fields})
+            kept = rows.order_by('created', 'pk').values_list(
+                'pk', flat=True)[0]
+            if merge:
+                manager.filter(pk=kept).update(
+                    **{field: group[f'{field}_max'] for field in merge})
+            deleted += rows.exclude(pk=kept).delete()[0]
+    return deleted
@@ -1,10 +1,20 @@
+from json import dumps
+
+from django.core.exceptions import ValidationError
+from django.db.models import Prefetch
+
+from creator.catalog import get_catalog
+from creator.constants import (ERA, ITEM_CATEGORIES, ITEM_SUBCATEGORIES,
+                               SILOUETTES)
 from creator.forms import (AttributesForm, DerivativeAttributesForm,
                            InvestigatorBasicInfoForm)
 from creator.helpers.investigator import generate_full_half_fifth_values
-from creator.models import (Inventory, Investigator, Item, Mania, Occupation,
-                            Phobia, Skills, Spell)
-from creator.random_inv import (base_skills_generator, free_point_assigner,
-                                occ_point_assigner)
+from creator.models import (Inventory, Investigator, Item, Mania,
+                            ManiaInvestigator, Occupation, Phobia,
+                            PhobiaInvestigator, Portrait, Skills, Spell,
+                            SpellInvestigator)
+from creator.random_inv import (SEED_BITS, base_skills_generator,
+                                free_point_assigner, occ_point_assigner)
 
 ALL_MODELS = {
     'occupations': Occupation,
@@ -15,6 +25,98 @@ ALL_MODELS = {
     'phobias': Phobia
     }
 
+GEAR_CATEGORIES = (2, 4, 5, 6)
+
+# records title of the model listings, as their __str__, and its columns.
+LISTING_TITLES = {
+    'occupations': ('{}-{}', ('title', 'era')),
+    'spells': ('{} - {}', ('name', 'category')),
+    'items': ('{}-{}', ('title', 'era')),
+    'skills': ('{}-{}', ('title', 'era')),
+    'manias': ('{}', ('title',)),
+    'phobias': ('{}', ('title',)),
+}
+
+
+def int_param(value, default: int, maximum: int = None) -> int:
+    """Integer of a request parameter, eg. a page size, `default` when it is
+    missing, clamped to 1..maximum.
+    Raises:
+        ValidationError -- the value is not an integer.
+    """
+    if value is None or value == '':
+        return default
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise ValidationError(f'{value} is not an integer')
+    value = max(value, 1)
+    return value if maximum is None else min(value, maximum)
+
+
+def seed_param(value):
+    """Generation seed of a request parameter, None when it is missing so a
+    fresh one is drawn.
+    Raises:
+        ValidationError -- the value is not an integer of 0..2**SEED_BITS-1,
+        the range of Investigator.seed.
+    """
+    if value is None or value == '':
+        return None
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise ValidationError(f'{value} is not an integer')
+    if not 0 <= value < 2 ** SEED_BITS:
+        raise ValidationError(f'seed must be between 0 and 2**{SEED_BITS}-1')
+    return value
+
+
+def era_param(value):
+    """Era of a request parameter, None when it is missing.
+    Raises:
+        ValidationError -- the value is not one of the ERA keys.
+    """
+    if value is None or value == '':
+        return None
+    if value not in dict(ERA):
+        raise ValidationError(f'{value} is not an era')
+    return value
+
+
+def listing_rows(model_name, after=None):
+    """uuid and title columns of the model records in uuid order, after the
+    given uuid, the primary key index serves the pages.
+    Raises:
+        ValidationError -- `after` is not a uuid.
+    """
+    model = ALL_MODELS[model_name]
+    fields = LISTING_TITLES[model_name][1]
+    rows = model.objects.order_by('uuid').values_list('uuid', *fields)
+    if after:
+        rows = rows.filter(uuid__gt=model._meta.pk.to_python(after))
+    return rows
+
+
+def stream_listing(model_name, rows, limit):
+    """JSON of a model listing page written row by row, `next` is the
+    uuid the following page starts after, null on the last one.
+    Arguments:
+        rows -- listing_rows queryset, up to limit + 1 rows are read.
+        limit -- positive number of records of the page.
+    """
+    title_format = LISTING_TITLES[model_name][0]
+    yield '{"model_name": %s, "records_title": [' % dumps(model_name)
+    last = following = None
+    for index, (uuid, *columns) in enumerate(rows[:limit + 1].iterator()):
+        if index == limit:
+            following = str(last)
+            break
+        separator = ', ' if index else ''
+        yield separator + dumps([str(uuid), title_format.format(*columns)])
+        last = uuid
+    yield '], "next": %s}' % dumps(following)
+
 
 def skills_sum(skill_list, value_key):
     total = 0
@@ -41,8 +143,7 @@ def generate_basic_info_form(request, inv):
                 inv.occupation = data['occupation']
                 inv.save()
                 # reset skill dict
-                skills=Skills.objects.all()
-                base_skills_generator(skills, inv)
+                base_skills_generator(inv)
                 # assign points to the skills
                 occ_point_assigner(inv.occupation_skill_points, inv)
                 # assign the free skill points
@@ -107,17 +208,251 @@ def skills_sanitizer(investigator):
         )
     return skills_sanitized
 
-def gear_sanitizer(investigator):
-    items = Inventory.objects.filter(
-        investigator=investigator,
-        item__category__in=[2,4,5,6]
-    )
+def gear_sanitizer(investigator, inventory=None):
+    '''Investigator gear, `inventory` is the already loaded inventory of the
+    investigator (with its items), when missing the gear is queried.'''
+    if inventory is None:
+        items = Inventory.objects.filter(
+            investigator=investigator,
+            item__category__in=GEAR_CATEGORIES
+        )
+    else:
+        items = [
+            item for item in inventory
+            if item.item is not None and item.item.category in GEAR_CATEGORIES
+        ]
     gear = [
         {
-            'uuid': item.uuid,
+            'uuid': str(item.uuid),
             'title': item.properties['title'],
             'stock': item.stock,
             'price': item.properties['price']
         } for item in items
     ]
     return gear
+
+
+def inventory_prefetch(**filters):
+    '''Prefetch of the investigators inventory along its items, `filters`
+    narrow the inventory (eg. item__category=1).'''
+    return Prefetch(
+        'inventory_set',
+        queryset=Inventory.objects.filter(
+            **filters).select_related('item').order_by('created')
+    )
+
+
+def manias_prefetch():
+    return Prefetch(
+        'maniainvestigator_set',
+        queryset=ManiaInvestigator.objects.select_related('mania')
+    )
+
+
+def phobias_prefetch():
+    return Prefetch(
+        'phobiainvestigator_set',
+        queryset=PhobiaInvestigator.objects.select_related('phobia')
+    )
+
+
+def spells_prefetch():
+    return Prefetch(
+        'spellinvestigator_set',
+        queryset=SpellInvestigator.objects.select_related('spell')
+    )
+
+
+def sheet_queryset():
+    '''Investigators along every relation the character sheet reads, a sheet
+    costs one query for the investigator, its occupation and portrait plus
+    one per prefetched relation.'''
+    return Investigator.objects.select_related(
+        'occupation', 'portrait'
+    ).prefetch_related(
+        inventory_prefetch(),
+        manias_prefetch(),
+        phobias_prefetch(),
+        spells_prefetch(),
+    )
+
+
+def basic_info_sanitizer(investigator):
+    occupations = [
+        [str(occ.uuid), occ.__str__()] for occ in get_catalog().occupations
+    ]
+    info = {
+        'name': investigator.name,
+        'uuid': str(investigator.uuid),
+        'sex': investigator.sex,
+        'occupation': str(investigator.occupation.uuid)
+        if investigator.occupation else None,
+        'age': investigator.age,
+        'player': investigator.player,
+        'residence': investigator.residence,
+        'birthplace': investigator.birthplace
+    }
+    return {'investigator': info, 'occupations': occupations}
+
+
+def portrait_sanitizer(investigator):
+    try:
+        portrait = investigator.portrait
+    except Portrait.DoesNotExist:
+        portrait = None
+    default_portrait = SILOUETTES[0] if investigator.sex == 'M' else SILOUETTES[1]
+    return {
+        'portrait': portrait.portrait.url if portrait is not None else default_portrait
+    }
+
+
+def attributes_sanitizer(investigator):
+    attributes = investigator.attributes_detail
+    attributes['MOV'] = [investigator.move]
+    attributes['BUILD'] = list(investigator.build)
+    return {'attributes': attributes}
+
+
+def deriv_attrs_sanitizer(investigator):
+    return {
+        'investigator': {
+            'health': investigator.health,
+            'magic_points': investigator.magic_points,
+            'luck': investigator.luck,
+            'sanity': investigator.sanity
+        }
+    }
+
+
+def weapons_sanitizer(investigator, inventory):
+    weapons = []
+    for weapon in inventory:
+        if weapon.item is None or weapon.item.category != ITEM_CATEGORIES[2][0]:
+            continue
+        w_dict = dict(weapon.properties)
+        w_dict['skill_value'] = generate_full_half_fifth_values(
+            investigator.skills[weapon.item.properties['skill']]['value']
+        )
+        w_dict['uuid'] = str(weapon.uuid)
+        weapons.append(w_dict)
+    return {'weapons': weapons}
+
+
+def manias_phobias_sanitizer(investigator):
+    manias = [
+        [str(mania.mania.uuid), mania.mania.title]
+        for mania in investigator.maniainvestigator_set.all()
+    ]
+    phobias = [
+        [str(phobia.phobia.uuid), phobia.phobia.title]
+        for phobia in investigator.phobiainvestigator_set.all()
+    ]
+    return {'manias': manias, 'phobias': phobias}
+
+
+def arcane_sanitizer(investigator, inventory):
+    magic = [
+        item for item in inventory
+        if item.item is not None and item.item.category == ITEM_CATEGORIES[0][0]
+    ]
+
+    def subcategory(name):
+        return [
+            item for item in magic
+            if item.properties.get('subcategory') == ITEM_SUBCATEGORIES[name]
+        ]
+
+    spells = [
+        {
+            'name': spell.spell.name,
+            'uuid': str(spell.spell.uuid),
+            'cost': spell.spell.cost,
+            'casting_time': spell.spell.casting_time,
+            'description': spell.spell.description,
+            'deeper_magic': spell.spell.deeper_magic,
+            'alternative_names': spell.spell.alternative_names
+        }
+        for spell in investigator.spellinvestigator_set.all()
+    ]
+    artifacts = [
+        {
+            'uuid': str(artifact.uuid),
+            'properties': {
+                'title': artifact.properties['title'],
+                'description': artifact.properties['description'],
+                'used_by': artifact.properties['used_by'],
+                'subcategory': artifact.properties['subcategory']
+            }
+        }
+        for artifact in subcategory('artifacts')
+    ]
+    tomes = [
+        {
+            'uuid': str(tome.uuid),
+            'properties': {
+                'title': tome.properties['title'],
+                'author': tome.properties['author'],
+                'mythos_rating': tome.properties['mythos_rating'],
+                'cthulhu_mythos_initial': tome.properties['cthulhu_mythos_initial'],
+                'cthulhu_mythos_full': tome.properties['cthulhu_mythos_full'],
+                'language': tome.properties['language'],
+                'sanity': tome.properties['sanity'],
+                'subheading': tome.properties['subheading'],
+                'subcategory': tome.properties['subcategory']
+            }
+        }
+        for tome in subcategory('tomes')
+    ]
+    occult_books = [
+        {
+            'uuid': str(occult_book.uuid),
+            'properties': {
+                'title': occult_book.properties['title'],
+                'subheading': occult_book.properties['subheading'],
+                'description': occult_book.properties['description'],
+                'sanity': occult_book.properties['sanity'],
+                'occult': occult_book.properties['occult'],
+                'subcategory': occult_book.properties['subcategory']
+            }
+        }
+        for occult_book in subcategory('occult_books')
+    ]
+    return {
+        'artifacts': artifacts,
+        'tomes': tomes,
+        'occult_books': occult_books,
+        'spells': spells,
+        'encounters': investigator.encounters_with_strange_entities
+    }
+
+
+def backstory_sanitizer(investigator):
+    return {
+        'description': investigator.description,
+        'ideologies': investigator.ideologies,
+        'significant_people': investigator.significant_people,
+        'meaningful_locations': investigator.meaningful_locations,
+        'treasured_possessions': investigator.treasured_possessions,
+        'traits': investigator.traits,
+        'injuries_scars': investigator.injure_scars,
+        'encounters_with_strange_entities': investigator.encounters_with_strange_entities
+    }
+
+
+def character_sheet(investigator):
+    '''Whole character sheet of an investigator loaded through
+    `sheet_queryset`, every section holds the payload of its own endpoint.'''
+    inventory = investigator.inventory_set.all()
+    sheet = {
+        'basic_info': basic_info_sanitizer(investigator),
+        'portrait': portrait_sanitizer(investigator),
+        'attributes': attributes_sanitizer(investigator),
+        'derivative_attributes': deriv_attrs_sanitizer(investigator),
+        'skills': {'skills': skills_sanitizer(investigator)},
+        'weapons': weapons_sanitizer(investigator, inventory),
+        'gear': {'gear': gear_sanitizer(investigator, inventory)},
+        'manias_phobias': manias_phobias_sanitizer(investigator),
+        'arcane': arcane_sanitizer(investigator, inventory),
+        'backstory': backstory_sanitizer(investigator)
+    }
+    return sheet
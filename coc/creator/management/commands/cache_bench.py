@@ -0,0 +1,166 @@
+import time
+from random import Random
+from statistics import mean
+from tempfile import TemporaryDirectory
+
+from coc import cache
+from creator.models import Item, Occupation, Skills, Spell
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+GRAPHQL_QUERY = (
+    '{ %s(first: %d) { edges { node { uuid %s } } } }'
+)
+GRAPHQL_FIELDS = (
+    ('allItems', 'title basePrice'),
+    ('allSkills', 'title baseValue'),
+    ('allOccupations', 'title creditRatingMin'),
+    ('allSpells', 'name cost'),
+)
+DETAIL_MODELS = (
+    ('items', Item), ('skills', Skills),
+    ('occupations', Occupation), ('spells', Spell),
+)
+# share of the requests of every kind.
+MIX = {'detail': 0.5, 'listing': 0.25, 'graphql': 0.25}
+
+
+class Command(BaseCommand):
+    help = (
+        'Replay a skewed mix of catalog reads (record details, listings '
+        'and graphql connections) without the response cache '
+        'and with every CACHE_BACKENDS entry that answers, saving a skill '
+        'every --write-every requests. Reports the hit ratio and latencies, '
+        'the listings are streamed uncached and count no lookups.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=2000)
+        parser.add_argument(
+            '--write-every', type=int, default=200,
+            help='Requests between two catalog writes, 0 for none.'
+        )
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument(
+            '--backends', default=','.join(settings.CACHE_BACKENDS),
+            help='Comma separated CACHE_BACKENDS keys.'
+        )
+
+    def requests(self, random) -> dict:
+        """Kind to the list of its distinct (method, path, data) requests,
+        the most popular first."""
+        requests = {kind: [] for kind in MIX}
+        for name, model in DETAIL_MODELS:
+            for uuid in model.objects.values_list('uuid', flat=True)[:50]:
+                requests['detail'].append(
+                    ('get', reverse('detail', args=[uuid, name]), None))
+        for name in ('items', 'skills', 'occupations', 'spells'):
+            for limit in (20, 100):
+                requests['listing'].append(
+                    ('get', reverse('listing', args=[name]),
+                     {'limit': limit}))
+        for field, node_fields in GRAPHQL_FIELDS:
+            for first in (10, 50):
+                requests['graphql'].append(
+                    ('post', '/graphql',
+                     {'query': GRAPHQL_QUERY % (field, first, node_fields)}))
+        for kind_requests in requests.values():
+            random.shuffle(kind_requests)
+        return requests
+
+    def picks(self, requests, count, random):
+        """`count` (kind, method, path, data) drawn by the MIX, and with a
+        Zipf distribution among the requests of a kind."""
+        kinds = random.choices(list(MIX), list(MIX.values()), k=count)
+        for kind in kinds:
+            kind_requests = requests[kind]
+            weights = [1 / (rank + 1) for rank in range(len(kind_requests))]
+            yield (kind, *random.choices(kind_requests, weights)[0])
+
+    def run(self, client, requests, options) -> list:
+        """(kind, latency in ms) of --requests picks."""
+        random = Random(options['seed'])
+        skills = list(Skills.objects.all()[:20])
+        latencies = []
+        for number, (kind, method, path, data) in enumerate(
+                self.picks(requests, options['requests'], random)):
+            if options['write_every'] and number % options['write_every'] == 0:
+                random.choice(skills).save()
+            start = time.perf_counter()
+            if method == 'post':
+                response = client.post(
+                    path, data, content_type='application/json')
+            else:
+                response = client.get(path, data)
+            if response.streaming:
+                # the rows are read while the content is consumed.
+                b''.join(response.streaming_content)
+            latencies.append((kind, (time.perf_counter() - start) * 1000))
+            if response.status_code != 200:
+                raise CommandError(f'{path} answered {response.status_code}')
+        return latencies
+
+    def report(self, name, latencies):
+        total = sorted(latency for _, latency in latencies)
+        self.stdout.write(
+            f"{name:<7} hits {cache.stats.ratio():5.1%}  "
+            f"mean {mean(total):6.2f}ms  "
+            f"p50 {total[len(total) // 2]:6.2f}ms  "
+            f"p95 {total[int(len(total) * 0.95)]:6.2f}ms"
+        )
+        for kind in sorted({kind for kind, _ in latencies}):
+            kind_latencies = [
+                latency for latency_kind, latency in latencies
+                if latency_kind == kind
+            ]
+            self.stdout.write(
+                f"  {kind:<13} {len(kind_latencies):5d} requests  "
+                f"hits {cache.stats.ratio(kind):5.1%}  "
+                f"mean {mean(kind_latencies):6.2f}ms"
+            )
+
+    def handle(self, *args, **options):
+        client = Client(SERVER_NAME='localhost')
+        requests = self.requests(Random(options['seed']))
+        self.stdout.write(
+            f"{options['requests']} requests over "
+            f"{sum(map(len, requests.values()))} distinct, "
+            f"a write every {options['write_every'] or 'never'}"
+        )
+        profiles = [('none', None)] + [
+            (name, settings.CACHE_BACKENDS[name])
+            for name in options['backends'].split(',') if name
+        ]
+        with TemporaryDirectory() as directory:
+            for name, backend in profiles:
+                if backend is None:
+                    overrides = {'CATALOG_CACHE': ''}
+                else:
+                    backend = dict(backend)
+                    if backend['BACKEND'].endswith('FileBasedCache'):
+                        backend['LOCATION'] = directory
+                    overrides = {
+                        'CACHES': {'default': backend},
+                        'CATALOG_CACHE': 'default',
+                    }
+                with override_settings(**overrides):
+                    if backend is not None:
+                        try:
+                            caches['default'].clear()
+                        except Exception as error:
+                            self.stdout.write(f'{name:<7} skipped: {error}')
+                            continue
+                    cache.stats.reset()
+                    # the writes are rolled back, a warm up run first.
+                    with transaction.atomic():
+                        self.run(client, requests, {
+                            **options, 'requests': 200})
+                        cache.stats.reset()
+                        latencies = self.run(client, requests, options)
+                        transaction.set_rollback(True)
+                    self.report(name, latencies)
@@ -0,0 +1,30 @@
+from time import perf_counter
+
+from creator import search
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        'Create the catalog search table of the database SEARCH_BACKEND '
+        'and index every record again.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default')
+
+    def handle(self, *args, **options):
+        if settings.SEARCH_BACKEND != 'database':
+            raise CommandError(
+                'SEARCH_BACKEND is not "database", the memory index is built '
+                'by every process on its first search.'
+            )
+        start = perf_counter()
+        index = search.rebuild(options['database'])
+        search.invalidate()
+        elapsed = perf_counter() - start
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt the {type(index).__name__} in {elapsed:.3f}s")
+        )
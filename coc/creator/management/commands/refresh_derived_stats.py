@@ -0,0 +1,28 @@
+from creator.models import Investigator
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+
+class Command(BaseCommand):
+    help = (
+        'Compute the stored derived stats of the investigators written '
+        'before they existed, or changed by a bulk update.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        investigators = Investigator.objects.select_related('occupation')
+        stale = [
+            investigator for investigator in investigators.iterator()
+            if investigator.refresh_derived_stats()
+        ]
+        with transaction.atomic():
+            Investigator.objects.bulk_update(
+                stale, Investigator.DERIVED_FIELDS,
+                batch_size=options['batch_size']
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"Refreshed {len(stale)} investigators")
+        )
@@ -0,0 +1,70 @@
+from importlib import import_module
+
+from coc.persisted_queries import persisted_queries
+from coc.schema import schema
+from django.core.management.base import BaseCommand, CommandError
+from graphql import parse
+from graphql.error import GraphQLSyntaxError
+from graphql.validation import validate
+
+
+class Command(BaseCommand):
+    help = (
+        'Register graphql queries in the persisted queries allowlist, '
+        'clients can then send them by their sha256 hash.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'sources', nargs='+',
+            help='.graphql files, or dotted python modules whose string '
+                 'constants are queries (eg. creator.tests.graphql.queries).'
+        )
+        parser.add_argument(
+            '--clear', action='store_true',
+            help='Drop the queries registered before.'
+        )
+
+    def read_source(self, source: str) -> list:
+        if source.endswith(('.graphql', '.gql')):
+            try:
+                with open(source, encoding='utf-8') as document:
+                    return [(source, document.read())]
+            except OSError as error:
+                raise CommandError(error)
+        try:
+            module = import_module(source)
+        except ImportError as error:
+            raise CommandError(error)
+        return [
+            (f'{source}.{name}', value)
+            for name, value in vars(module).items()
+            if isinstance(value, str) and not name.startswith('_')
+        ]
+
+    def handle(self, *args, **options):
+        queries = []
+        for source in options['sources']:
+            for name, query in self.read_source(source):
+                try:
+                    errors = validate(schema, parse(query))
+                except GraphQLSyntaxError:
+                    # format templates (eg. "{uuid}" placeholders) and
+                    # other strings that are not queries.
+                    self.stdout.write(f"Skipped {name}, not a query")
+                    continue
+                if errors:
+                    self.stdout.write(self.style.WARNING(
+                        f"Skipped {name}, {errors[0].message}"))
+                    continue
+                queries.append(query)
+        registered = persisted_queries.register(
+            queries, clear=options['clear'])
+        for hash_ in registered:
+            self.stdout.write(hash_)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Registered {len(registered)} queries at "
+                f"{persisted_queries.file_path}"
+            )
+        )
@@ -0,0 +1,145 @@
+import multiprocessing
+import sqlite3
+import time
+from os import path
+from random import Random
+from tempfile import TemporaryDirectory
+
+from creator.helpers.views_helper import character_sheet, sheet_queryset
+from creator.models import Investigator
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connections
+from django.test.utils import override_settings
+
+# pragmas of a stock connection, WAL stays on in a database file once set.
+STOCK_PRAGMAS = {'journal_mode': 'delete'}
+
+
+class Command(BaseCommand):
+    help = (
+        'Mixed load on copies of the SQLite database: readers build '
+        'character sheets while writers update skills, as the skills editor '
+        'does, with the stock pragmas and with SQLITE_TUNED_PRAGMAS.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--readers', type=int, default=8)
+        parser.add_argument('--writers', type=int, default=2)
+        parser.add_argument(
+            '--seconds', type=float, default=5,
+            help='Duration of each run.'
+        )
+
+    def copy_database(self, directory: str, name: str) -> str:
+        """Consistent copy of the default database, even while in WAL."""
+        target = path.join(directory, f'{name}.sqlite3')
+        source = sqlite3.connect(connections['default'].settings_dict['NAME'])
+        copy = sqlite3.connect(target)
+        with copy:
+            source.backup(copy)
+        source.close()
+        copy.close()
+        return target
+
+    def add_alias(self, alias: str, name: str):
+        connections.databases[alias] = {
+            **connections.databases['default'], 'NAME': name}
+        connections.ensure_defaults(alias)
+        connections.prepare_test_settings(alias)
+
+    def worker(self, alias, uuids, operation, deadline, results, seed):
+        random = Random(seed)
+        done = failed = 0
+        try:
+            while time.perf_counter() < deadline:
+                try:
+                    operation(alias, random.choice(uuids), random)
+                    done += 1
+                except DatabaseError:
+                    # "database is locked", the stock busy handler gives up.
+                    failed += 1
+        finally:
+            connections[alias].close()
+            results.put((operation.__name__, done, failed))
+
+    @staticmethod
+    def read(alias, uuid, random):
+        character_sheet(sheet_queryset().using(alias).get(uuid=uuid))
+
+    @staticmethod
+    def write(alias, uuid, random):
+        investigator = Investigator.objects.using(alias).get(uuid=uuid)
+        skill = random.choice(list(investigator.skills))
+        investigator.skills[skill]['value'] = random.randint(1, 90)
+        investigator.save()
+
+    def run_load(self, alias, uuids, options) -> dict:
+        """Readers and writers are processes, so they contend on the
+        database file rather than on the GIL."""
+        context = multiprocessing.get_context('fork')
+        results = context.Queue()
+        deadline = time.perf_counter() + options['seconds']
+        # children must open their own connections.
+        connections.close_all()
+        workers = [
+            context.Process(
+                target=self.worker,
+                args=(alias, uuids, self.read, deadline, results, seed))
+            for seed in range(options['readers'])
+        ] + [
+            context.Process(
+                target=self.worker,
+                args=(alias, uuids, self.write, deadline, results, -seed))
+            for seed in range(1, options['writers'] + 1)
+        ]
+        for worker in workers:
+            worker.start()
+        totals = {'read': 0, 'write': 0, 'locked': 0}
+        for _ in workers:
+            operation, done, failed = results.get()
+            totals[operation] += done
+            totals['locked'] += failed
+        for worker in workers:
+            worker.join()
+        seconds = options['seconds']
+        return {
+            'reads/s': totals['read'] / seconds,
+            'writes/s': totals['write'] / seconds,
+            'locked': totals['locked'],
+        }
+
+    def handle(self, *args, **options):
+        if connections['default'].vendor != 'sqlite':
+            raise CommandError('The default database is not SQLite.')
+        uuids = [
+            uuid for uuid, skills in
+            Investigator.objects.values_list('uuid', 'skills')[:500]
+            if isinstance(skills, dict) and all(
+                isinstance(skill, dict) for skill in skills.values())
+        ]
+        if not uuids:
+            raise CommandError('No investigators, create some first.')
+        self.stdout.write(
+            f"{options['readers']} readers, {options['writers']} writers, "
+            f"{options['seconds']}s per run, {len(uuids)} investigators"
+        )
+        profiles = (
+            ('stock', STOCK_PRAGMAS),
+            ('tuned', settings.SQLITE_TUNED_PRAGMAS),
+        )
+        with TemporaryDirectory() as directory:
+            for name, pragmas in profiles:
+                alias = f'sqlite_bench_{name}'
+                self.add_alias(alias, self.copy_database(directory, name))
+                try:
+                    with override_settings(SQLITE_PRAGMAS=pragmas):
+                        result = self.run_load(alias, uuids, options)
+                finally:
+                    connections[alias].close()
+                    del connections.databases[alias]
+                self.stdout.write(
+                    f"{name:<6} {result['reads/s']:8.1f} reads/s "
+                    f"{result['writes/s']:8.1f} writes/s "
+                    f"{result['locked']:5d} locked"
+                )
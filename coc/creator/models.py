@@ -2,10 +2,12 @@ from uuid import uuid4
 
 import django
 from django.contrib.auth import get_user_model
-from django.db.models import (CASCADE, PROTECT, SET_NULL, BooleanField,
-                              CharField, DateTimeField, FloatField, ForeignKey,
-                              ImageField, IntegerField, JSONField, Model,
-                              OneToOneField, PositiveIntegerField, TextField,
+from django.db.models import (CASCADE, PROTECT, SET_NULL, BigIntegerField,
+                              BooleanField, CharField, DateTimeField,
+                              FloatField, ForeignKey, ImageField, Index,
+                              IntegerField, JSONField, Model, OneToOneField,
+                              PositiveIntegerField, PositiveSmallIntegerField,
+                              SmallIntegerField, TextField, UniqueConstraint,
                               UUIDField)
 from graphene.types.scalars import String
 
@@ -198,9 +200,73 @@ class Investigator(BaseModel):
     cash = IntegerField(default=0)
     assets = IntegerField(default=0)
     spending_level = IntegerField(default=0)
+    # Seed of the random generator run that built the investigator.
+    seed = BigIntegerField(null=True, blank=True, default=None)
+    # Derived stats, recomputed on save when an attribute or the occupation
+    # changed, derived_from holds the values they were computed from.
+    move_rate = PositiveSmallIntegerField(default=0)
+    build_bonus = CharField(max_length=10, default='0')
+    build_value = SmallIntegerField(default=0)
+    max_hit_points = PositiveSmallIntegerField(default=0)
+    occupation_points = PositiveIntegerField(default=0)
+    derived_from = CharField(max_length=100, blank=True, default='')
+
+    DERIVED_SOURCES = (
+        'strength', 'dexterity', 'constitution', 'power', 'size', 'education',
+        'intelligence', 'appearance', 'age', 'occupation_id'
+    )
+    DERIVED_FIELDS = (
+        'move_rate', 'build_bonus', 'build_value', 'max_hit_points',
+        'occupation_points', 'derived_from'
+    )
+
+    class Meta:
+        indexes = [
+            Index(fields=['build_value'], name='investigator_build'),
+            Index(fields=['move_rate'], name='investigator_move'),
+        ]
+
+    def derived_signature(self) -> str:
+        """Values the derived stats are computed from."""
+        return ','.join(
+            str(getattr(self, field)) for field in self.DERIVED_SOURCES)
+
+    @property
+    def derived_fresh(self) -> bool:
+        """Whether the stored derived stats match the current values."""
+        return self.derived_from == self.derived_signature()
+
+    def refresh_derived_stats(self) -> bool:
+        """Recompute the stored derived stats when they are stale.
+        Returns:
+            Whether they were recomputed.
+        """
+        if self.derived_fresh:
+            return False
+        self.move_rate = self._compute_move()
+        self.build_bonus, self.build_value = self._compute_build()
+        self.max_hit_points = self._compute_max_health()
+        self.occupation_points = (
+            self._compute_occupation_skill_points()
+            if self.occupation_id else 0
+        )
+        self.derived_from = self.derived_signature()
+        return True
+
+    def save(self, *args, **kwargs):
+        if self.refresh_derived_stats() and kwargs.get('update_fields'):
+            kwargs['update_fields'] = {
+                *kwargs['update_fields'], *self.DERIVED_FIELDS}
+        super().save(*args, **kwargs)
+
     @property
     def max_health(self):
         """Health property."""
+        if self.derived_fresh:
+            return self.max_hit_points
+        return self._compute_max_health()
+
+    def _compute_max_health(self):
         health = (self.size + self.constitution) // 10
         return health
 
@@ -222,6 +288,11 @@ class Investigator(BaseModel):
     @property
     def move(self):
         """Move rate property, affected by certain conditions."""
+        if self.derived_fresh:
+            return self.move_rate
+        return self._compute_move()
+
+    def _compute_move(self):
         if self.strength > self.size and self.dexterity > self.size:
             mov = 9
         elif self.strength >= self.size or self.dexterity >= self.size:
@@ -232,11 +303,17 @@ class Investigator(BaseModel):
         if self.age // 10 >= 4:
             mov = mov - ((self.age // 10) - 3)
 
-        return mov
+        # the very old do not go below 0, move_rate is unsigned.
+        return max(mov, 0)
 
     @property
     def build(self):
         """Build attribute property."""
+        if self.derived_fresh:
+            return (self.build_bonus, self.build_value)
+        return self._compute_build()
+
+    def _compute_build(self):
         amount = self.strength + self.size
         res = ()
         if amount <= 64:
@@ -267,6 +344,11 @@ class Investigator(BaseModel):
     @property
     def occupation_skill_points(self):
         """Based on the occupation obtain the amount of free skill points."""
+        if self.derived_fresh and self.occupation_id:
+            return self.occupation_points
+        return self._compute_occupation_skill_points()
+
+    def _compute_occupation_skill_points(self):
         skill_points = 0
         occupation_points_formula = self.occupation.points
         inv_attrs = self.attributes_detail
@@ -294,7 +376,7 @@ class Investigator(BaseModel):
         magic_points = self.sanity // 5
         return magic_points
 
-    def set_credit_status(self):
+    def set_credit_status(self, commit: bool = True):
         '''Initialize cash, assets and set spending level of investigator, given its
         CR.'''
         value = self.skills.get('Credit Rating', {}).get('value', 0)
@@ -313,7 +395,8 @@ class Investigator(BaseModel):
                     self.assets = cat_config['assets']
                     
                 break
-        self.save()
+        if commit:
+            self.save()
 
 
     def __str__(self):
@@ -338,6 +421,12 @@ class InvestigatorTags(BaseModel):
 
     class Meta:
         verbose_name_plural = 'investigator tags'
+        constraints = [
+            UniqueConstraint(
+                fields=['investigator', 'tag'],
+                name='unique_investigator_tag'
+            ),
+        ]
 
     def __str__(self):
         """String representation of the object."""
@@ -386,6 +475,12 @@ class Item(BaseModel):
     )
     properties = JSONField()
 
+    class Meta:
+        # faceted search filters and groups by them.
+        indexes = [
+            Index(fields=['category', 'era'], name='item_category_era'),
+        ]
+
     def __str__(self):
         """String representation of the object."""
         return f"{self.title}-{self.era}"
@@ -437,6 +532,13 @@ class Inventory(BaseModel):
 
     class Meta:
         verbose_name_plural = 'Inventories'
+        # an item can be stacked apart with other properties, not unique.
+        indexes = [
+            Index(
+                fields=['investigator', 'item'],
+                name='inventory_investigator_item'
+            ),
+        ]
 
     def __str__(self):
         """String representation of the object."""
@@ -462,6 +564,14 @@ class CampaignInvestigator(BaseModel):
     campaign = ForeignKey(Game, on_delete=CASCADE)
     timestamp = DateTimeField(auto_now_add=True)
 
+    class Meta:
+        constraints = [
+            UniqueConstraint(
+                fields=['investigator', 'campaign'],
+                name='unique_investigator_campaign'
+            ),
+        ]
+
     def __str__(self):
         """String representation of the object."""
         title = '{} - {}'.format(self.campaign.title, self.investigator.name)
@@ -493,6 +603,14 @@ class ManiaInvestigator(BaseModel):
     # Undefined limit 999999
     duration = PositiveIntegerField(default=1)
 
+    class Meta:
+        constraints = [
+            UniqueConstraint(
+                fields=['investigator', 'mania'],
+                name='unique_investigator_mania'
+            ),
+        ]
+
     def __str__(self):
         """String representation of the object."""
         title = '{} - {} - {}'.format(
@@ -525,6 +643,14 @@ class PhobiaInvestigator(BaseModel):
     # Undefined limit 999999
     duration = PositiveIntegerField(default=1)
 
+    class Meta:
+        constraints = [
+            UniqueConstraint(
+                fields=['investigator', 'phobia'],
+                name='unique_investigator_phobia'
+            ),
+        ]
+
     def __str__(self):
         """String representation of the object."""
         title = '{} - {} - {}'.format(
@@ -536,3 +662,11 @@ class SpellInvestigator(BaseModel):
     """Spell  Investigator Relationship"""
     investigator = ForeignKey(Investigator, on_delete=CASCADE)
     spell = ForeignKey(Spell, on_delete=CASCADE)
+
+    class Meta:
+        constraints = [
+            UniqueConstraint(
+                fields=['investigator', 'spell'],
+                name='unique_investigator_spell'
+            ),
+        ]
@@ -1,67 +1,83 @@
 # '''
 # random investigator generator module.
 # '''
-from os import path
-from random import choice, randint, shuffle
+import random
+from bisect import bisect_right
+from collections import Counter
+from random import Random
+from secrets import randbits
 
-from creator.helpers.fixtures.first_names import FIRST_NAMES
-from creator.helpers.fixtures.last_names import LAST_NAMES
 from creator.helpers.model_helpers import roller_stats
-from creator.models import (Inventory, Investigator, Item, Occupation, Skills,
-                            Spell, SpellInvestigator)
+from creator.catalog import get_catalog
+from creator.models import Inventory, Investigator, SpellInvestigator
+from creator.random_inv.names import sample_names
 from django.contrib.auth import get_user_model
-from django.db.models import Q
-from simplejson import load
+from django.db import transaction
 
 User = get_user_model()
 
 
-def random_names(gender, decade, amount_of_names, amount_of_surnames):
+# Seeds are kept positive and under 63 bits so they fit a BigIntegerField.
+SEED_BITS = 63
+
+
+def new_seed(rng=None) -> int:
+    """Obtain a generation seed.
+    Arguments:
+        rng -- None for a fresh seed, an int seed that is used as is, or a
+        random.Random/numpy Generator the seed is drawn from.
+    Raises:
+        ValueError -- the int seed is out of the 0..2**SEED_BITS-1 range.
+    """
+    if rng is None:
+        seed = randbits(SEED_BITS)
+    elif isinstance(rng, Random):
+        seed = rng.getrandbits(SEED_BITS)
+    elif hasattr(rng, 'integers'):
+        # a numpy Generator, numpy is only imported by the allocations.
+        seed = int(rng.integers(2 ** SEED_BITS))
+    else:
+        seed = int(rng)
+        if not 0 <= seed < 2 ** SEED_BITS:
+            raise ValueError(f'seed {seed} out of the {SEED_BITS} bits range')
+    return seed
+
+
+def numpy_rng(rng=random):
+    """Numpy generator for the allocations, derived from a random.Random."""
+    import numpy as np
+    return np.random.default_rng(rng.getrandbits(64))
+
+
+def random_names(gender, decade, amount_of_names, amount_of_surnames,
+                 rng=random):
     """Randoms name generator.
     Parameters:
         gender - Male or female sex
         decade - Decade of the 20 'or 00'
         amount_of_names - Number of first names
         amount_of_surnames - Number of surnames
+        rng - random.Random instance
     """
-
-    first_names = FIRST_NAMES
-    surnames_list = LAST_NAMES
-    names_list = []
-    random_surname = choice(surnames_list).capitalize()
-
-    if amount_of_surnames == 2:
-        random_surname = random_surname + ' ' + choice(
-            surnames_list).capitalize()
-
-    for name in first_names:
-        if name['decade'] == decade and name['gender'] == gender:
-            names_list.append(name['first_name'])
-
-    random_name = choice(names_list)
-
-    if amount_of_names == 2:
-        random_name = random_name + ' ' + choice(names_list)
-
-    random_name = random_name + ' ' + random_surname
+    random_name = sample_names(
+        1, gender, decade,
+        amount_of_names=amount_of_names,
+        amount_of_surnames=amount_of_surnames,
+        rng=rng
+    )[0]
     return random_name
 
 
-def amount(points_available: int, limit: int):
-    """Generate an adequate random value for the points assignment."""
-    upper_limit = 91-limit
-    upper_limit = upper_limit if upper_limit > 0 else 0
-    limit = min(points_available, upper_limit)
-    val = randint(1, limit)
-    return val
-
-
-def get_occupation_skills(inv: Investigator):
-    """Based on the investigators occupation determine the list of skills."""
+def get_occupation_skills(inv: Investigator, rng=random, templates=None):
+    """Based on the investigators occupation determine the list of skills,
+    `templates` are the catalog skill templates by era, read when None."""
     # Generate list of skills
     occupation_skills = []
     # obtain list of all basic skills
     all_skills = list(inv.skills.keys())
+    if templates is None:
+        templates = get_catalog().skill_templates
+    categories = templates[inv.era].categories
     # assign the mandatories
     occupation_skills.extend(inv.occupation.skills.get('basics'))
     # assign extra categories with their limits
@@ -82,17 +98,14 @@ def get_occupation_skills(inv: Investigator):
             )
             for skill in raw_skills:
                 # validate they are skills and not skill categories
-                if skill in all_skills:
+                if skill in inv.skills:
                     skills_by_category.append(skill)
                 else:
-                    skills = [
-                        sk for sk in all_skills if skill in sk
-                    ]
-                    skills_by_category.extend(skills)
+                    skills_by_category.extend(categories.get(skill, ()))
             
         for _ in range(limit):
-            if skills_by_category is not None:
-                skill = choice(skills_by_category) 
+            if skills_by_category:
+                skill = rng.choice(skills_by_category)
                 occupation_skills.append(
                     skill
                 )
@@ -106,10 +119,46 @@ def get_occupation_skills(inv: Investigator):
     return occupation_skills
 
 
-def occ_point_assigner(max_points: int, inv: Investigator):
-    """Assign points for the skills related to occupations."""
-    # Assing profession points
-    occupation_skills = get_occupation_skills(inv)
+def skill_point_assigner(investigators: list, skill_weights: list,
+                         points: list, rng=None):
+    """Distribute points over many investigators skills with a single
+    batched allocation, no skill is raised to 90 or above.
+    Arguments:
+        investigators -- investigators whose skill sheets receive the points.
+        skill_weights -- per investigator dict of skill name to its relative
+        chance, skills left out don't receive points.
+        points -- per investigator amount of points to distribute.
+        rng -- numpy Generator or seed, or a list with one per investigator.
+    """
+    if not investigators:
+        return
+    # numpy takes ~80ms to import, only the processes generating
+    # investigators pay for it.
+    import numpy as np
+    from creator.random_inv.allocator import SKILL_CAP, allocate
+    names = [list(inv.skills) for inv in investigators]
+    width = max(len(inv_names) for inv_names in names)
+    values = np.zeros((len(investigators), width), dtype=np.int64)
+    weights = np.zeros((len(investigators), width))
+    for row, inv in enumerate(investigators):
+        inv_names = names[row]
+        inv_weights = skill_weights[row]
+        values[row, :len(inv_names)] = [
+            inv.skills[name]['value'] for name in inv_names]
+        weights[row, :len(inv_names)] = [
+            inv_weights.get(name, 0) for name in inv_names]
+
+    increments = allocate(SKILL_CAP - values, weights, points, rng)
+    for row, inv in enumerate(investigators):
+        for col in np.flatnonzero(increments[row]):
+            inv.skills[names[row][col]]['value'] += int(increments[row, col])
+
+
+def occ_base_assigner(max_points: int, inv: Investigator, rng=random,
+                      templates=None):
+    """Spread half of the occupation points evenly and roll the credit
+    rating, returns the occupation skills and the points left."""
+    occupation_skills = get_occupation_skills(inv, rng, templates)
     val = (max_points // 2) // len(occupation_skills)
     for occ_skill in occupation_skills:
         inv.skills[occ_skill]['value'] += val
@@ -118,7 +167,7 @@ def occ_point_assigner(max_points: int, inv: Investigator):
     cr_max_limit = max_points if max_points < inv.occupation.credit_rating_max \
         else inv.occupation.credit_rating_max
     
-    credit_rating_value = randint(
+    credit_rating_value = rng.randint(
         inv.occupation.credit_rating_min,
         cr_max_limit
     )
@@ -126,150 +175,245 @@ def occ_point_assigner(max_points: int, inv: Investigator):
     max_points -= credit_rating_value
     
     inv.skills['Credit Rating']['value'] = credit_rating_value
+    return occupation_skills, max_points
 
-    shuffle(occupation_skills)
-    while max_points:
-        occ_skill = choice(occupation_skills)
-        skill = inv.skills[occ_skill]
-        base_value = skill.get('value')
-        val = amount(max_points, base_value)
-        if (base_value + val) < 90 and (max_points - val) >= 0:
-            inv.skills[occ_skill]['value'] += val
-            max_points -= val
 
-    
+def own_skills_assigner(inv: Investigator):
+    """Language(Own) and Dodge are given by the attributes."""
     inv.skills['Language(Own)']['value'] = inv.education
     inv.skills['Language(Own)']['base_value'] = inv.education
     inv.skills['Dodge']['value'] = inv.dexterity // 2
     inv.skills['Dodge']['base_value'] = inv.dexterity // 2
-    inv.save()
 
 
-def free_point_assigner(max_points: int, inv: Investigator):
+def free_skill_weights(inv: Investigator) -> dict:
+    """Free points can go to any skill but the Credit Rating."""
+    return {name: 1 for name in inv.skills if name != 'Credit Rating'}
+
+
+def occ_point_assigner(max_points: int, inv: Investigator, commit: bool = True,
+                       rng=random):
+    """Assign points for the skills related to occupations."""
+    # Assing profession points
+    occupation_skills, max_points = occ_base_assigner(max_points, inv, rng)
+    skill_point_assigner(
+        [inv], [Counter(occupation_skills)], [max_points], numpy_rng(rng))
+    own_skills_assigner(inv)
+    if commit:
+        inv.save()
+
+
+def free_point_assigner(max_points: int, inv: Investigator, commit: bool = True,
+                        rng=random):
     """Assign points to any skill."""
-    skills = list(inv.skills.keys())
-    while max_points:
-        skill = choice(skills)
-        if skill == "Credit Rating":
-            continue
-        base_value = inv.skills[skill]['value']
-        val = amount(max_points, base_value)
-        if (base_value + val) < 90 and (max_points - val) >= 0:
-            inv.skills[skill]['value'] += val
-            max_points -= val
-    inv.save()
-
-
-def base_skills_generator(skills: list, inv: Investigator):
-    '''Generate a default skill dict for the investigator.'''
-    for skill in skills:
-        sub_skills = skill.sub_skills
-        if sub_skills:
-            #category skills
-            for sub_skill in sub_skills:
-                skill_name = f"{skill.title}({sub_skill})"
-                sub_skill_val = skill.sub_skills[sub_skill].get('base_value')
-                if sub_skill_val is None:
-                    inv.skills[skill_name] = {
-                        'base_value': skill.base_value,
-                        'value': skill.base_value
-                    }
-                else:
-                    inv.skills[skill_name] = {
-                        'base_value': sub_skill_val,
-                        'value': sub_skill_val
-                    }
-        else:
-            inv.skills[skill.title] = {
-                'base_value': skill.base_value,
-                'value': skill.base_value
-            }
-    
-    inv.save()
+    skill_point_assigner(
+        [inv], [free_skill_weights(inv)], [max_points], numpy_rng(rng))
+    if commit:
+        inv.save()
+
+
+def skills_assigner(investigators: list, rngs: list, templates=None):
+    """Assign occupation and free skill points to many investigators, each
+    step is a single batched allocation.
+    Arguments:
+        investigators -- investigators with their base skills generated.
+        rngs -- random.Random instance of each investigator, every sheet
+        draws only from its own so it comes out the same built alone or in
+        a batch.
+        templates -- catalog skill templates by era, read when None.
+    """
+    occupation_weights = []
+    occupation_points = []
+    for inv, rng in zip(investigators, rngs):
+        occupation_skills, points = occ_base_assigner(
+            inv.occupation_skill_points, inv, rng, templates)
+        occupation_weights.append(Counter(occupation_skills))
+        occupation_points.append(points)
+    skill_point_assigner(
+        investigators, occupation_weights, occupation_points,
+        [numpy_rng(rng) for rng in rngs]
+    )
+    for inv in investigators:
+        own_skills_assigner(inv)
+    skill_point_assigner(
+        investigators,
+        [free_skill_weights(inv) for inv in investigators],
+        [inv.free_skill_points for inv in investigators],
+        [numpy_rng(rng) for rng in rngs]
+    )
+
+
+def base_skills_generator(inv: Investigator, commit: bool = True,
+                          templates=None):
+    '''Generate a default skill dict for the investigator, `templates` are
+    the catalog skill templates by era, read when None.'''
+    if templates is None:
+        templates = get_catalog().skill_templates
+    inv.skills.update(templates[inv.era].new_sheet())
+
+    if commit:
+        inv.save()
+
+
+def load_reference_data(user=None) -> dict:
+    """Gather, once, every catalog entry the random generator picks from.
+    Arguments:
+        user -- owner of the generated investigators, defaults to pk=1.
+    """
+    reference_catalog = get_catalog()
+    # un appraised items (base_price=None) can't be bought.
+    items = sorted(
+        (
+            item for category in (2, 5)
+            for item in reference_catalog.items_by_category.get(category, ())
+            if item.base_price is not None
+        ),
+        key=lambda item: item.base_price
+    )
+    items_by_era = {}
+    for item in items:
+        items_by_era.setdefault(item.era, []).append(item)
+    weapons = [
+        weapon for subcategory in ('Handguns', 'Hand-to-Hand')
+        for weapon in reference_catalog.items_by_subcategory.get(
+            (3, subcategory), ())
+    ]
+    occupations = [
+        occ for occ in reference_catalog.occupations_by_era.get('1920', ())
+        if not occ.modern
+    ]
+    reference = {
+        'user': user if user is not None else User.objects.get(pk=1),
+        'occupations': occupations,
+        'items': {
+            era: (era_items, [item.base_price for item in era_items])
+            for era, era_items in items_by_era.items()
+        },
+        'weapons': weapons,
+        'spells': reference_catalog.spells,
+        # read once, every get_catalog checks the shared version.
+        'skill_templates': reference_catalog.skill_templates
+    }
+    return reference
 
 
 class RandomInvestigator:
-    '''Wrapper class for random investigators.'''
-    def __init__(self, *args, **kwargs):
-        self.lucky_gen = randint(1, 20) == 20
+    '''Wrapper class for random investigators.
+    Arguments:
+        seed -- int seed, random.Random or numpy Generator, the same seed
+        (and catalog) always produces the same investigator.
+    '''
+    def __init__(self, *args, seed=None, **kwargs):
+        self.seed = new_seed(seed)
+        self.rng = Random(self.seed)
+        self.lucky_gen = self.rng.randint(1, 20) == 20
+        self.inventory = []
+        self.spells = []
 
     def build(self):
-        self.investigator = self.base_build()
-        self.roll_attributes()
-        self.skills_assigner()
-        self.seed_weapons()
-        self.seed_spells()
-        self.investigator.set_credit_status()
-        self.seed_inventory()
+        self.assemble_many([self], load_reference_data())
+        with transaction.atomic():
+            self.investigator.save()
+            Inventory.objects.bulk_create(self.inventory)
+            SpellInvestigator.objects.bulk_create(self.spells)
+
+    @classmethod
+    def build_many(cls, amount: int, user=None, seed=None) -> list:
+        '''Assemble `amount` investigators in memory and persist them,
+        with their inventory and spells, in a single transaction.
+        Every investigator gets its own seed drawn from `seed`.'''
+        if amount < 1:
+            return []
+        batch_rng = Random(new_seed(seed))
+        builds = [cls(seed=new_seed(batch_rng)) for _ in range(amount)]
+        cls.assemble_many(builds, load_reference_data(user))
+
+        investigators = [rand.investigator for rand in builds]
+        # bulk_create skips save(), compute the stored derived stats here.
+        for investigator in investigators:
+            investigator.refresh_derived_stats()
+        with transaction.atomic():
+            Investigator.objects.bulk_create(investigators)
+            Inventory.objects.bulk_create(
+                [inventory for rand in builds for inventory in rand.inventory]
+            )
+            SpellInvestigator.objects.bulk_create(
+                [spell for rand in builds for spell in rand.spells]
+            )
+        return investigators
+
+    @staticmethod
+    def assemble_many(builds: list, reference: dict):
+        '''Build the investigators and their belongings without touching the
+        database, skill points of every sheet are allocated together.'''
+        for rand in builds:
+            rand.investigator = rand.base_build(reference)
+            rand.roll_attributes()
+            base_skills_generator(
+                rand.investigator, commit=False,
+                templates=reference['skill_templates'])
+        skills_assigner(
+            [rand.investigator for rand in builds],
+            [rand.rng for rand in builds],
+            reference['skill_templates']
+        )
+        for rand in builds:
+            rand.seed_weapons(reference['weapons'])
+            rand.seed_spells(reference['spells'])
+            rand.investigator.set_credit_status(commit=False)
+            rand.seed_inventory(reference['items'])
 
     def destroy():
         pass
 
-    def base_build(self):
+    def base_build(self, reference: dict):
         '''Basic information required to build de model.'''
-        occupations = Occupation.objects.filter(era="1920", modern=False)
-        occupation = choice(list(occupations))
+        occupation = self.rng.choice(reference['occupations'])
         genders = [('M', 'male'), ('F', 'female')]
-        gender_pick = choice(genders)
-        name = random_names(gender_pick[1], "20'", 1, 1)
+        gender_pick = self.rng.choice(genders)
+        name = random_names(gender_pick[1], "20'", 1, 1, self.rng)
         attrs = {
-            "user": User.objects.get(pk=1),
+            "user": reference['user'],
             "name": name,
             "player": f"{name} player",
             "sex": gender_pick[0],
             "residence": "Providence",
             "birthplace": "Misissippi",
-            "age": randint(15, 90),
+            "age": self.rng.randint(15, 90),
             "occupation": occupation,
             "ideologies": "Atheist",
-            "luck": roller_stats(3),
-            "skills": {}
+            "luck": roller_stats(3, self.rng),
+            "skills": {},
+            "seed": self.seed
         }
         inv = Investigator(**attrs)
-        inv.save()
         return inv
 
     def roll_attributes(self):
         '''Seed the attributes for the investigator.'''
          # Produce attributes
-        self.investigator.strength = roller_stats(3)
-        self.investigator.dexterity = roller_stats(3)
-        self.investigator.constitution = roller_stats(3)
-        self.investigator.power = roller_stats(3)
-        self.investigator.size = roller_stats(2)
-        self.investigator.education = roller_stats(2)
-        self.investigator.intelligence = roller_stats(2)
-        self.investigator.appearance = roller_stats(3)
+        self.investigator.strength = roller_stats(3, self.rng)
+        self.investigator.dexterity = roller_stats(3, self.rng)
+        self.investigator.constitution = roller_stats(3, self.rng)
+        self.investigator.power = roller_stats(3, self.rng)
+        self.investigator.size = roller_stats(2, self.rng)
+        self.investigator.education = roller_stats(2, self.rng)
+        self.investigator.intelligence = roller_stats(2, self.rng)
+        self.investigator.appearance = roller_stats(3, self.rng)
         # Load derivative statuses
         self.investigator.health = self.investigator.max_health
         self.investigator.sanity = self.investigator.init_sanity()
         self.investigator.magic_points = self.investigator.init_magic_points()
-        self.investigator.save()
     
-    def skills_assigner(self):
-        '''Assign skills to investigator entity.'''
-        # Gerenarte base skills
-        skills = list(Skills.objects.all())
-        base_skills_generator(skills, self.investigator)
-        # Assign points to occupation skills
-        proff_points = self.investigator.occupation_skill_points
-        occ_point_assigner(proff_points, self.investigator)
-        # Assign free skill points
-        free_point_assigner(self.investigator.free_skill_points, self.investigator)
-
-    def seed_inventory(self):
+    def seed_inventory(self, items: dict):
         '''Give the investigator 5 random tools or consumables.'''
         if self.investigator.assets:
-            items = Item.objects.filter(
-                category__in=[2, 5]
-            ).filter(
-                ~Q(title='Generic Editable Item', base_price=None)
-            ).filter(
-                base_price__lte=self.investigator.cash + self.investigator.spending_level,
-                era=self.investigator.era
-            )
+            budget = self.investigator.cash + self.investigator.spending_level
+            # items are sorted by price, keep the affordable ones
+            era_items, prices = items.get(self.investigator.era, ([], []))
+            items = era_items[:bisect_right(prices, budget)]
             for _ in range(5):
-                item = choice(items)
+                item = self.rng.choice(items)
                 props = item.properties.copy()
                 props['title'] = item.title
                 props['era'] = item.era
@@ -280,20 +424,12 @@ class RandomInvestigator:
                     item=item,
                     properties=props
                 )
-                inventory.save()
+                self.inventory.append(inventory)
     
-    def seed_weapons(self):
+    def seed_weapons(self, weapons: list):
         '''Give the investigator 1 weapon from the handguns or
         hand-to-hand category.'''
-        weapons = Item.objects.filter(
-            category=3,
-            properties__subcategory__in=[
-                'Handguns',
-                'Hand-to-Hand'
-            ]
-        )
-
-        weapon = choice(weapons)
+        weapon = self.rng.choice(weapons)
         weapon_props = weapon.properties.copy()
         weapon_props['ammo'] = weapon.properties["bullets_in_gun_mag"]
         weapon_props['title'] = weapon.title
@@ -307,17 +443,16 @@ class RandomInvestigator:
             properties=weapon_props
         )
         
-        weapon_inventory.save()
+        self.inventory.append(weapon_inventory)
     
-    def seed_spells(self):
+    def seed_spells(self, spells: list):
         '''If its a lucky build (5% chance) give the
         investigator a spell.
         '''
         if self.lucky_gen:
-            spells = Spell.objects.all()
-            spell = choice(spells)
+            spell = self.rng.choice(spells)
             spell_inv = SpellInvestigator(
                 investigator=self.investigator,
                 spell=spell
             )
-            spell_inv.save()
+            self.spells.append(spell_inv)
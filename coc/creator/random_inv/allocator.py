@@ -0,0 +1,113 @@
+# '''
+# vectorized skill point allocation module.
+# '''
+import numpy as np
+
+# Random assignment never takes a skill to 90 or above.
+SKILL_CAP = 89
+# Dirichlet concentration of the shares, lower values produce the uneven
+# "a few strong skills" sheets the dice based assignment used to give.
+CONCENTRATION = 0.5
+# Capped rounds before the leftovers are filled greedily.
+MAX_ROUNDS = 4
+
+
+def _apportion(points: np.ndarray, shares: np.ndarray) -> np.ndarray:
+    """Split each row points proportionally to its shares using the largest
+    remainder method, the result rows sum exactly to points.
+    Arguments:
+        points -- (n,) points to split per row.
+        shares -- (n, k) non negative weights, rows with points must have
+        at least one positive share.
+    """
+    totals = shares.sum(axis=1, keepdims=True)
+    exact = points[:, None] * np.divide(
+        shares, totals, out=np.zeros_like(shares), where=totals > 0)
+    portions = np.floor(exact).astype(np.int64)
+    leftover = points - portions.sum(axis=1)
+    # rank every column by its fractional part and give one more point to
+    # the first `leftover` of them.
+    fractions = np.where(shares > 0, exact - portions, -1.0)
+    ranks = np.argsort(np.argsort(-fractions, axis=1), axis=1)
+    portions += ranks < leftover[:, None]
+    return portions
+
+
+def _draws(rng, shape: tuple, concentration: float):
+    """Draw the skill shares and the greedy fill order keys up front, a
+    generator is consumed the same way whatever the rest of the batch.
+    Arguments:
+        rng -- numpy Generator or seed for the whole batch, or a sequence
+        with one per row.
+        shape -- (n, k) shape of the batch.
+        concentration -- Dirichlet concentration of the shares.
+    """
+    if isinstance(rng, (list, tuple)):
+        generators = [np.random.default_rng(row_rng) for row_rng in rng]
+        shares = np.array(
+            [gen.gamma(concentration, size=shape[1]) for gen in generators])
+        keys = np.array([gen.random(shape[1]) for gen in generators])
+    else:
+        generator = np.random.default_rng(rng)
+        shares = generator.gamma(concentration, size=shape)
+        keys = generator.random(shape)
+    return shares.reshape(shape), keys.reshape(shape)
+
+
+def allocate(capacity, weights, points, rng=None,
+             concentration: float = CONCENTRATION,
+             rounds: int = MAX_ROUNDS) -> np.ndarray:
+    """Distribute points over the skills of many sheets at once.
+    Each row is a sheet, the share of every skill is drawn from a Dirichlet
+    distribution and the points are apportioned accordingly, whatever
+    overflows a skill capacity is re distributed among the skills that
+    still have room. The amount of work is bounded regardless of the sheet.
+
+    Arguments:
+        capacity -- (n, k) points each skill can still receive.
+        weights -- (n, k) relative chance of each skill, 0 excludes it.
+        points -- (n,) points to distribute per sheet, points that do not
+        fit in the eligible capacity are dropped.
+        rng -- numpy Generator or seed, for reproducible allocations, or a
+        sequence with one per row so each sheet depends only on its own.
+        concentration -- Dirichlet concentration of the skill shares.
+        rounds -- amount of capped proportional rounds.
+    Returns:
+        (n, k) array of points assigned to each skill.
+    """
+    capacity = np.atleast_2d(np.asarray(capacity, dtype=np.int64))
+    weights = np.atleast_2d(np.asarray(weights, dtype=np.float64))
+    capacity = np.where(weights > 0, np.maximum(capacity, 0), 0)
+    remaining = np.minimum(
+        np.asarray(points, dtype=np.int64).reshape(-1),
+        capacity.sum(axis=1)
+    )
+    remaining = np.maximum(remaining, 0)
+    increments = np.zeros_like(capacity)
+    shares, keys = _draws(rng, capacity.shape, concentration)
+    shares = shares * weights
+    # gamma draws may underflow to 0, never leave an eligible skill out
+    shares = np.where(
+        (shares <= 0) & (weights > 0), np.finfo(np.float64).tiny, shares)
+
+    for _ in range(rounds):
+        if not remaining.any():
+            break
+        room = capacity - increments
+        portions = _apportion(remaining, np.where(room > 0, shares, 0.0))
+        taken = np.minimum(portions, room)
+        increments += taken
+        remaining -= taken.sum(axis=1)
+
+    if remaining.any():
+        # greedy fill of the leftovers following a random skill order
+        room = capacity - increments
+        order = np.argsort(keys, axis=1)
+        room_sorted = np.take_along_axis(room, order, axis=1)
+        before = np.cumsum(room_sorted, axis=1) - room_sorted
+        fill_sorted = np.clip(remaining[:, None] - before, 0, room_sorted)
+        fill = np.zeros_like(room)
+        np.put_along_axis(fill, order, fill_sorted, axis=1)
+        increments += fill
+
+    return increments
@@ -0,0 +1,114 @@
+# '''
+# pre indexed random name sampling module.
+# '''
+import random
+from csv import DictReader
+from itertools import accumulate
+from os import path
+from threading import Lock
+
+FIXTURES_DIR = path.join(
+    path.dirname(path.dirname(path.abspath(__file__))), 'helpers', 'fixtures')
+# tab separated decade, gender and first_name, most popular first.
+FIRST_NAMES_FILE = path.join(FIXTURES_DIR, 'first_names.tsv')
+# one surname per line, most popular first.
+LAST_NAMES_FILE = path.join(FIXTURES_DIR, 'last_names.txt')
+
+
+def rank_weights(amount: int) -> tuple:
+    """Cumulative weights for a list sorted by popularity, the weight of a
+    name is inversely proportional to its rank (Zipf)."""
+    return tuple(accumulate(1 / rank for rank in range(1, amount + 1)))
+
+
+class NameSampler:
+    """Samples names from the first and last names fixtures.
+    The fixtures are read from disk and indexed by (decade, gender) the
+    first time a name is requested, uniform draws are then O(1) and weighted
+    ones O(log n).
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._first_names = None
+        self._first_names_weights = None
+        self._surnames = None
+        self._surnames_weights = None
+
+    def _load(self):
+        with self._lock:
+            if self._first_names is not None:
+                return
+            groups = {}
+            with open(FIRST_NAMES_FILE, encoding='utf-8', newline='') as names:
+                for name in DictReader(names, delimiter='\t'):
+                    key = (name['decade'], name['gender'])
+                    groups.setdefault(key, []).append(name['first_name'])
+            with open(LAST_NAMES_FILE, encoding='utf-8') as surnames:
+                self._surnames = tuple(
+                    surname.strip().capitalize() for surname in surnames
+                    if surname.strip()
+                )
+            self._surnames_weights = rank_weights(len(self._surnames))
+            self._first_names_weights = {
+                key: rank_weights(len(names))
+                for key, names in groups.items()
+            }
+            self._first_names = {
+                key: tuple(names) for key, names in groups.items()
+            }
+
+    def first_names(self, gender: str, decade: str) -> tuple:
+        """All first names of a gender and decade, most popular first."""
+        if self._first_names is None:
+            self._load()
+        return self._first_names[(decade, gender)]
+
+    def surnames(self) -> tuple:
+        """All surnames, most popular first."""
+        if self._surnames is None:
+            self._load()
+        return self._surnames
+
+    def _pick(self, names: tuple, weights: tuple, rng, k: int,
+              weighted: bool) -> list:
+        if weighted:
+            return rng.choices(names, cum_weights=weights, k=k)
+        return [rng.choice(names) for _ in range(k)]
+
+    def sample_names(self, amount: int, gender: str, decade: str,
+                     amount_of_names: int = 1, amount_of_surnames: int = 1,
+                     rng=random, weighted: bool = False) -> list:
+        """Generate many full names at once.
+        Parameters:
+            amount - Number of full names
+            gender - Male or female sex
+            decade - Decade of the 20 'or 00'
+            amount_of_names - Number of first names of each full name
+            amount_of_surnames - Number of surnames of each full name
+            rng - random.Random instance
+            weighted - Favor popular names instead of uniform draws
+        """
+        first_names = self.first_names(gender, decade)
+        first_names_weights = self._first_names_weights[(decade, gender)]
+        surnames = self.surnames()
+        full_names = []
+        for _ in range(amount):
+            random_surname = ' '.join(self._pick(
+                surnames, self._surnames_weights, rng, amount_of_surnames,
+                weighted
+            ))
+            random_name = ' '.join(self._pick(
+                first_names, first_names_weights, rng, amount_of_names,
+                weighted
+            ))
+            full_names.append(random_name + ' ' + random_surname)
+        return full_names
+
+
+names_sampler = NameSampler()
+
+
+def sample_names(amount: int, gender: str, decade: str, **kwargs) -> list:
+    """Generate many full names at once, see NameSampler.sample_names."""
+    return names_sampler.sample_names(amount, gender, decade, **kwargs)
@@ -1,26 +1,38 @@
+from creator.helpers.views_helper import character_sheet, sheet_queryset
 from creator.models import Investigator
 
-from creator.schemas.schema_nodes import (CampaignInvNode, DiaryInvNode,
+from creator.schemas.schema_nodes import (CampaignInvNode,
+                                  CharacterSheetNode, DiaryInvNode,
                                   GameNode, InventoryInvNode, InvestigatorNode,
                                   ItemNode, ManiaInvNode, ManiaNode,
                                   OccupationNode, PhobiaInvNode, PhobiaNode,
                                   PortraitNode, SkillNode,
                                   SpellNode, TagInvNode, TagNode, UserNode)
 
-from creator.schemas.schema_mutations import (CampaignInvMutation,
-                                      DiaryInvMutation, GameMutation,
+from creator.schemas.schema_mutations import (CampaignInvBulkMutation,
+                                      CampaignInvMutation,
+                                      DiaryInvBulkMutation, DiaryInvMutation,
+                                      GameBulkMutation, GameMutation,
+                                      InventoryInvBulkMutation,
                                       InventoryInvMutation,
-                                      InvestigatorMutation, ItemMutation,
-                                      ManiaInvMutation, ManiaMutation,
-                                      OccupationMutation, PhobiaInvMutation,
-                                      PhobiaMutation,
-                                      SkillMutation, SpellMutation,
+                                      InvestigatorBulkMutation,
+                                      InvestigatorMutation, ItemBulkMutation,
+                                      ItemMutation, ManiaBulkMutation,
+                                      ManiaInvBulkMutation, ManiaInvMutation,
+                                      ManiaMutation, OccupationBulkMutation,
+                                      OccupationMutation,
+                                      PhobiaBulkMutation,
+                                      PhobiaInvBulkMutation,
+                                      PhobiaInvMutation, PhobiaMutation,
+                                      SkillBulkMutation, SkillMutation,
+                                      SpellBulkMutation, SpellMutation,
+                                      TagBulkMutation, TagInvBulkMutation,
                                       TagInvMutation, TagMutation,
                                       UserMutation)
 
 # from creator.helpers.random_investigator import random_inv
 
-from graphene import Field, relay
+from graphene import Field, String, relay
 from graphene_django.filter import DjangoFilterConnectionField
 
 
@@ -45,6 +57,7 @@ class Query(object):
 
     investigator = relay.Node.Field(InvestigatorNode)
     all_investigators = DjangoFilterConnectionField(InvestigatorNode)
+    character_sheet = Field(CharacterSheetNode, uuid=String(required=True))
 
     all_spells = DjangoFilterConnectionField(SpellNode)
     spell = relay.Node.Field(SpellNode)
@@ -82,6 +95,12 @@ class Query(object):
     all_inventorys_inv = DjangoFilterConnectionField(InventoryInvNode)
     inventory_inv = relay.Node.Field(InventoryInvNode)
 
+    def resolve_character_sheet(self, info, uuid):
+        investigator = sheet_queryset().filter(uuid=uuid).first()
+        if investigator is None:
+            return None
+        return character_sheet(investigator)
+
     # random_investigator = Field(InvestigatorNode)
 
     # def resolve_random_investigator(self, info):
@@ -107,3 +126,19 @@ class Mutation(object):
     tag_inv_mutate = TagInvMutation.Field()
     game_mutate = GameMutation.Field()
     user_mutate = UserMutation.Field()
+    # bulk variants, one transaction per batch
+    tag_bulk_mutate = TagBulkMutation.Field()
+    item_bulk_mutate = ItemBulkMutation.Field()
+    occupation_bulk_mutate = OccupationBulkMutation.Field()
+    skill_bulk_mutate = SkillBulkMutation.Field()
+    investigator_bulk_mutate = InvestigatorBulkMutation.Field()
+    spell_bulk_mutate = SpellBulkMutation.Field()
+    mania_bulk_mutate = ManiaBulkMutation.Field()
+    mania_inv_bulk_mutate = ManiaInvBulkMutation.Field()
+    phobia_bulk_mutate = PhobiaBulkMutation.Field()
+    phobia_inv_bulk_mutate = PhobiaInvBulkMutation.Field()
+    campaign_inv_bulk_mutate = CampaignInvBulkMutation.Field()
+    inventory_inv_bulk_mutate = InventoryInvBulkMutation.Field()
+    diary_inv_bulk_mutate = DiaryInvBulkMutation.Field()
+    tag_inv_bulk_mutate = TagInvBulkMutation.Field()
+    game_bulk_mutate = GameBulkMutation.Field()
@@ -0,0 +1,86 @@
+# '''
+# graphql queryset optimization module.
+# '''
+from django.core.exceptions import FieldDoesNotExist
+from graphene.utils.str_converters import to_snake_case
+from graphql.language.ast import Field, FragmentSpread, InlineFragment
+
+# relay connection wrappers walked through to reach the node fields.
+CONNECTION_FIELDS = ('edges', 'node')
+
+
+def _selected_fields(selection_set, fragments: dict):
+    """Yield the Field nodes of a selection set, fragments are expanded."""
+    if selection_set is None:
+        return
+    for selection in selection_set.selections:
+        if isinstance(selection, Field):
+            yield selection
+        elif isinstance(selection, InlineFragment):
+            yield from _selected_fields(selection.selection_set, fragments)
+        elif isinstance(selection, FragmentSpread):
+            fragment = fragments.get(selection.name.value)
+            if fragment is not None:
+                yield from _selected_fields(fragment.selection_set, fragments)
+
+
+def _node_fields(field_ast, fragments: dict):
+    """Fields selected on the node of a field, connections are unwrapped."""
+    for field in _selected_fields(field_ast.selection_set, fragments):
+        if field.name.value in CONNECTION_FIELDS:
+            yield from _node_fields(field, fragments)
+        else:
+            yield field
+
+
+def _related_model(model, name: str):
+    """Model reached through a single valued relation of model, None when
+    the field is not one (plain columns, reverse FKs, m2m)."""
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+    if field.is_relation and (field.many_to_one or field.one_to_one):
+        return field.related_model
+    return None
+
+
+def select_related_paths(model, fields, fragments: dict, prefix: str = ''):
+    """Lookup paths of every single valued relation selected on the query,
+    nested selections give chained paths (eg. "investigator__occupation").
+    Arguments:
+        model -- Django model the fields are selected on.
+        fields -- iterable of graphql Field nodes.
+        fragments -- fragment definitions of the operation.
+        prefix -- lookup path leading to model.
+    """
+    paths = []
+    for field in fields:
+        name = to_snake_case(field.name.value)
+        related_model = _related_model(model, name)
+        if related_model is None:
+            continue
+        path = f'{prefix}{name}'
+        nested = select_related_paths(
+            related_model,
+            _selected_fields(field.selection_set, fragments),
+            fragments,
+            f'{path}__'
+        )
+        paths.extend(nested or [path])
+    return paths
+
+
+def optimize_queryset(queryset, info):
+    """Join every ForeignKey and OneToOne edge the query selects on the
+    queryset nodes, so the edges resolve from the same query instead of one
+    query per node."""
+    fields = [
+        field
+        for field_ast in info.field_asts
+        for field in _node_fields(field_ast, info.fragments)
+    ]
+    paths = select_related_paths(queryset.model, fields, info.fragments)
+    if paths:
+        queryset = queryset.select_related(*paths)
+    return queryset
@@ -1,4 +1,4 @@
-from coc.utils import mutation_flow
+from coc.utils import bulk_mutation_flow, mutation_flow
 from creator.models import (CampaignInvestigator, Game, Inventory,
                             Investigator, InvestigatorsDiary, InvestigatorTags,
                             Item, Mania, ManiaInvestigator, Occupation, Phobia,
@@ -11,7 +11,8 @@ from creator.schemas.schema_nodes import (CampaignInvNode, DiaryInvNode,
                                           PhobiaNode, SkillNode, SpellNode,
                                           TagInvNode, TagNode, UserNode)
 from django.contrib.auth.models import User
-from graphene import (Boolean, ClientIDMutation, Field, Float, Int, JSONString,
+from graphene import (Boolean, ClientIDMutation, Field, Float, InputField,
+                      InputObjectType, Int, JSONString, List, NonNull,
                       ObjectType, String, relay)
 
 
@@ -24,6 +25,8 @@ class TagMutation(ClientIDMutation):
         uuid = String()
         title = String()
 
+    relations = {'user': User}
+
     @classmethod
     def mutate(cls, *args, **kwargs):
         """Generates mutation which is an instance of the Node class which
@@ -33,15 +36,14 @@ class TagMutation(ClientIDMutation):
             Input class (title, user).
         """
         input_ = kwargs.get('input')
-        usr = User.objects.get(pk=input_['user'])
-        input_['user'] = usr
         method = input_.pop('method')
         ret = mutation_flow(
             TagMutation,
             Tag,
             method,
             input_,
-            'tag'
+            'tag',
+            cls.relations
         )
         return ret
 
@@ -189,6 +191,8 @@ class InvestigatorMutation(ClientIDMutation):
         luck = Int()
         health = Int()
 
+    relations = {'user': User, 'occupation': Occupation}
+
     @classmethod
     def mutate(cls, *args, **kwargs):
         """Generates mutation which is an instance of the Node class which
@@ -199,16 +203,13 @@ class InvestigatorMutation(ClientIDMutation):
         """
         input_ = kwargs.get('input')
         method = input_.pop('method')
-        input_['user'] = User.objects.filter(pk=input_.get('user')).first()
-        input_['occupation'] = Occupation.objects.filter(
-            pk=input_.get('occupation')
-        ).first()
         ret = mutation_flow(
             InvestigatorMutation,
             Investigator,
             method,
             input_,
-            'investigator'
+            'investigator',
+            cls.relations
         )
 
         return ret
@@ -288,6 +289,8 @@ class ManiaInvMutation(ClientIDMutation):
         mania = String()
         duration = Int()
 
+    relations = {'investigator': Investigator, 'mania': Mania}
+
     @classmethod
     def mutate(cls, *args, **kwargs):
         """Generates mutation which is an instance of the Node class which
@@ -298,17 +301,13 @@ class ManiaInvMutation(ClientIDMutation):
         """
         input_ = kwargs.get('input')
         method = input_.pop('method')
-        input_['investigator'] = Investigator.objects.filter(
-            uuid=input_.get('investigator')).first()
-        input_['mania'] = Mania.objects.filter(
-            uuid=input_.get('mania')
-        ).first()
         ret = mutation_flow(
             ManiaInvMutation,
             ManiaInvestigator,
             method,
             input_,
-            'mania_inv'
+            'mania_inv',
+            cls.relations
         )
         return ret
 
@@ -352,6 +351,8 @@ class PhobiaInvMutation(ClientIDMutation):
         phobia = String()
         duration = Int()
 
+    relations = {'investigator': Investigator, 'phobia': Phobia}
+
     @classmethod
     def mutate(cls, *args, **kwargs):
         """Generates mutation which is an instance of the Node class which
@@ -362,17 +363,13 @@ class PhobiaInvMutation(ClientIDMutation):
         """
         input_ = kwargs.get('input')
         method = input_.pop('method')
-        input_['investigator'] = Investigator.objects.filter(
-            uuid=input_.get('investigator')).first()
-        input_['phobia'] = Phobia.objects.filter(
-            uuid=input_.get('phobia')
-        ).first()
         ret = mutation_flow(
             PhobiaInvMutation,
             PhobiaInvestigator,
             method,
             input_,
-            'phobia_inv'
+            'phobia_inv',
+            cls.relations
         )
         return ret
 
@@ -386,6 +383,8 @@ class CampaignInvMutation(ClientIDMutation):
         investigator = String()
         campaign = String()
 
+    relations = {'investigator': Investigator, 'campaign': Game}
+
     @classmethod
     def mutate(cls, *args, **kwargs):
         """Generates mutation which is an instance of the Node class which
@@ -396,16 +395,13 @@ class CampaignInvMutation(ClientIDMutation):
         """
         input_ = kwargs.get('input')
         method = input_.pop('method')
-        input_['investigator'] = Investigator.objects.filter(
-            uuid=input_.get('investigator')).first()
-        input_['campaign'] = Game.objects.filter(
-            uuid=input_.get('campaign')).first()
         ret = mutation_flow(
             CampaignInvMutation,
             CampaignInvestigator,
             method,
             input_,
-            'campaign_inv'
+            'campaign_inv',
+            cls.relations
         )
         return ret
 
@@ -421,6 +417,8 @@ class InventoryInvMutation(ClientIDMutation):
         stock = Int()
         properties = JSONString()
 
+    relations = {'investigator': Investigator, 'item': Item}
+
     @classmethod
     def mutate(cls, *args, **kwargs):
         """Generates mutation which is an instance of the Node class which
@@ -431,17 +429,13 @@ class InventoryInvMutation(ClientIDMutation):
         """
         input_ = kwargs.get('input')
         method = input_.pop('method')
-        input_['investigator'] = Investigator.objects.filter(
-            uuid=input_.get('investigator')).first()
-        input_['item'] = Item.objects.filter(
-            uuid=input_.get('item')
-        ).first()
         ret = mutation_flow(
             InventoryInvMutation,
             Inventory,
             method,
             input_,
-            'inventory_inv'
+            'inventory_inv',
+            cls.relations
         )
 
         return ret
@@ -457,6 +451,8 @@ class DiaryInvMutation(ClientIDMutation):
         title = String()
         notes = String()
 
+    relations = {'investigator': Investigator}
+
     @classmethod
     def mutate(cls, *args, **kwargs):
         """Generates mutation which is an instance of the Node class which
@@ -467,14 +463,13 @@ class DiaryInvMutation(ClientIDMutation):
         """
         input_ = kwargs.get('input')
         method = input_.pop('method')
-        input_['investigator'] = Investigator.objects.filter(
-            uuid=input_.get('investigator')).first()
         ret = mutation_flow(
             DiaryInvMutation,
             InvestigatorsDiary,
             method,
             input_,
-            'diary_inv'
+            'diary_inv',
+            cls.relations
         )
 
         return ret
@@ -489,6 +484,8 @@ class TagInvMutation(ClientIDMutation):
         tag = String()
         investigator = String()
 
+    relations = {'investigator': Investigator, 'tag': Tag}
+
     @classmethod
     def mutate(cls, *args, **kwargs):
         """Generates mutation which is an instance of the Node class which
@@ -499,17 +496,13 @@ class TagInvMutation(ClientIDMutation):
         """
         input_ = kwargs.get('input')
         method = input_.pop('method')
-        input_['investigator'] = Investigator.objects.filter(
-            uuid=input_.get('investigator')).first()
-        input_['tag'] = Tag.objects.filter(
-            uuid=input_.get('tag')
-        ).first()
         ret = mutation_flow(
             TagInvMutation,
             InvestigatorTags,
             method,
             input_,
-            'tag_inv'
+            'tag_inv',
+            cls.relations
         )
 
         return ret
@@ -526,6 +519,8 @@ class GameMutation(ClientIDMutation):
         description = String()
         game_type = String()
 
+    relations = {'user': User}
+
     @classmethod
     def mutate(cls, *args, **kwargs):
         """Generates mutation which is an instance of the Node class which
@@ -535,15 +530,14 @@ class GameMutation(ClientIDMutation):
             Input class (title, user).
         """
         input_ = kwargs.get('input')
-        usr = User.objects.get(pk=input_['user'])
-        input_['user'] = usr
         method = input_.pop('method')
         ret = mutation_flow(
             GameMutation,
             Game,
             method,
             input_,
-            'game'
+            'game',
+            cls.relations
         )
         return ret
 
@@ -593,3 +587,224 @@ class UserMutation(ClientIDMutation):
             ret = UserMutation(user=user)
 
         return ret
+
+
+def record_input(mutation):
+    """Input type of one record of a bulk mutation, the input fields of the
+    single record mutation without its method."""
+    fields = {
+        name: InputField(input_field.type)
+        for name, input_field in mutation.Input._meta.fields.items()
+        if name not in ('method', 'client_mutation_id')
+    }
+    name = mutation.__name__.replace('Mutation', 'Record')
+    return type(name, (InputObjectType,), fields)
+
+
+class BulkMutation(ClientIDMutation):
+    """Base of the bulk mutations, every record of the batch is validated
+    before any is written and all of them are written in one transaction.
+    Subclasses set:
+        model -- Django model of the records.
+        field -- name of the list field returning the records.
+        relations -- dict of input keys holding the pk of a related record
+        to its model.
+    """
+    model = None
+    field = None
+    relations = {}
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def mutate(cls, *args, **kwargs):
+        """Generates the mutation with a list of instances of the model.
+        Arguments:
+            input -- (dict) dictionary with the method (CREATE, UPDATE or
+            DELETE) and the records list.
+        """
+        input_ = kwargs.get('input')
+        ret = bulk_mutation_flow(
+            cls,
+            cls.model,
+            input_['method'],
+            input_['records'],
+            cls.field,
+            cls.relations
+        )
+        return ret
+
+
+class TagBulkMutation(BulkMutation):
+    tags = List(TagNode)
+
+    class Input:
+        method = String(required=True)
+        records = List(NonNull(record_input(TagMutation)), required=True)
+
+    model = Tag
+    field = 'tags'
+    relations = TagMutation.relations
+
+
+class ItemBulkMutation(BulkMutation):
+    items = List(ItemNode)
+
+    class Input:
+        method = String(required=True)
+        records = List(NonNull(record_input(ItemMutation)), required=True)
+
+    model = Item
+    field = 'items'
+
+
+class OccupationBulkMutation(BulkMutation):
+    occupations = List(OccupationNode)
+
+    class Input:
+        method = String(required=True)
+        records = List(NonNull(record_input(OccupationMutation)), required=True)
+
+    model = Occupation
+    field = 'occupations'
+
+
+class SkillBulkMutation(BulkMutation):
+    skills = List(SkillNode)
+
+    class Input:
+        method = String(required=True)
+        records = List(NonNull(record_input(SkillMutation)), required=True)
+
+    model = Skills
+    field = 'skills'
+
+
+class InvestigatorBulkMutation(BulkMutation):
+    investigators = List(InvestigatorNode)
+
+    class Input:
+        method = String(required=True)
+        records = List(NonNull(record_input(InvestigatorMutation)), required=True)
+
+    model = Investigator
+    field = 'investigators'
+    relations = InvestigatorMutation.relations
+
+
+class SpellBulkMutation(BulkMutation):
+    spells = List(SpellNode)
+
+    class Input:
+        method = String(required=True)
+        records = List(NonNull(record_input(SpellMutation)), required=True)
+
+    model = Spell
+    field = 'spells'
+
+
+class ManiaBulkMutation(BulkMutation):
+    manias = List(ManiaNode)
+
+    class Input:
+        method = String(required=True)
+        records = List(NonNull(record_input(ManiaMutation)), required=True)
+
+    model = Mania
+    field = 'manias'
+
+
+class ManiaInvBulkMutation(BulkMutation):
+    mania_invs = List(ManiaInvNode)
+
+    class Input:
+        method = String(required=True)
+        records = List(NonNull(record_input(ManiaInvMutation)), required=True)
+
+    model = ManiaInvestigator
+    field = 'mania_invs'
+    relations = ManiaInvMutation.relations
+
+
+class PhobiaBulkMutation(BulkMutation):
+    phobias = List(PhobiaNode)
+
+    class Input:
+        method = String(required=True)
+        records = List(NonNull(record_input(PhobiaMutation)), required=True)
+
+    model = Phobia
+    field = 'phobias'
+
+
+class PhobiaInvBulkMutation(BulkMutation):
+    phobia_invs = List(PhobiaInvNode)
+
+    class Input:
+        method = String(required=True)
+        records = List(NonNull(record_input(PhobiaInvMutation)), required=True)
+
+    model = PhobiaInvestigator
+    field = 'phobia_invs'
+    relations = PhobiaInvMutation.relations
+
+
+class CampaignInvBulkMutation(BulkMutation):
+    campaign_invs = List(CampaignInvNode)
+
+    class Input:
+        method = String(required=True)
+        records = List(NonNull(record_input(CampaignInvMutation)), required=True)
+
+    model = CampaignInvestigator
+    field = 'campaign_invs'
+    relations = CampaignInvMutation.relations
+
+
+class InventoryInvBulkMutation(BulkMutation):
+    inventory_invs = List(InventoryInvNode)
+
+    class Input:
+        method = String(required=True)
+        records = List(NonNull(record_input(InventoryInvMutation)), required=True)
+
+    model = Inventory
+    field = 'inventory_invs'
+    relations = InventoryInvMutation.relations
+
+
+class DiaryInvBulkMutation(BulkMutation):
+    diary_invs = List(DiaryInvNode)
+
+    class Input:
+        method = String(required=True)
+        records = List(NonNull(record_input(DiaryInvMutation)), required=True)
+
+    model = InvestigatorsDiary
+    field = 'diary_invs'
+    relations = DiaryInvMutation.relations
+
+
+class TagInvBulkMutation(BulkMutation):
+    tag_invs = List(TagInvNode)
+
+    class Input:
+        method = String(required=True)
+        records = List(NonNull(record_input(TagInvMutation)), required=True)
+
+    model = InvestigatorTags
+    field = 'tag_invs'
+    relations = TagInvMutation.relations
+
+
+class GameBulkMutation(BulkMutation):
+    games = List(GameNode)
+
+    class Input:
+        method = String(required=True)
+        records = List(NonNull(record_input(GameMutation)), required=True)
+
+    model = Game
+    field = 'games'
+    relations = GameMutation.relations
@@ -7,10 +7,23 @@ from creator.models import (CampaignInvestigator, Game, Inventory,
 from django.contrib.auth.models import User
 from django.core.serializers import serialize
 from graphene import ObjectType, String, relay
+from graphene.types.generic import GenericScalar
 from graphene_django.types import DjangoObjectType
 
+from creator.schemas.optimizer import optimize_queryset
 
-class UserNode(DjangoObjectType):
+
+class OptimizedNode(DjangoObjectType):
+    """Node whose querysets join the ForeignKey edges selected by the query."""
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def get_queryset(cls, queryset, info):
+        return optimize_queryset(queryset, info)
+
+
+class UserNode(OptimizedNode):
     class Meta:
         model = User
         filter_fields = {
@@ -19,7 +32,7 @@ class UserNode(DjangoObjectType):
         interfaces = (relay.Node, )
 
 
-class TagNode(DjangoObjectType):
+class TagNode(OptimizedNode):
     class Meta:
         model = Tag
         filter_fields = {
@@ -32,7 +45,7 @@ class TagNode(DjangoObjectType):
         interfaces = (relay.Node, )
 
 
-class ItemNode(DjangoObjectType):
+class ItemNode(OptimizedNode):
     class Meta:
         model = Item
         filter_fields = {
@@ -47,7 +60,7 @@ class ItemNode(DjangoObjectType):
         interfaces = (relay.Node, )
 
 
-class OccupationNode(DjangoObjectType):
+class OccupationNode(OptimizedNode):
     class Meta:
         model = Occupation
         filter_fields = {
@@ -63,7 +76,7 @@ class OccupationNode(DjangoObjectType):
         interfaces = (relay.Node, )
 
 
-class SkillNode(DjangoObjectType):
+class SkillNode(OptimizedNode):
     class Meta:
         model = Skills
         filter_fields = {
@@ -74,7 +87,7 @@ class SkillNode(DjangoObjectType):
         interfaces = (relay.Node, )
 
 
-class InvestigatorNode(DjangoObjectType):
+class InvestigatorNode(OptimizedNode):
     class Meta:
         model = Investigator
         filter_fields = {
@@ -85,11 +98,13 @@ class InvestigatorNode(DjangoObjectType):
             'sex': ['exact'],
             'age': ['exact', 'gt', 'lt', 'gte', 'lte'],
             'occupation': ['exact'],
+            'build_value': ['exact', 'gte', 'lte'],
+            'move_rate': ['exact', 'gte', 'lte'],
         }
         interfaces = (relay.Node, )
 
 
-class PortraitNode(DjangoObjectType):
+class PortraitNode(OptimizedNode):
     class Meta:
         model = Portrait
         filter_fields = {
@@ -98,7 +113,7 @@ class PortraitNode(DjangoObjectType):
         interfaces = (relay.Node, )
 
 
-class SpellNode(DjangoObjectType):
+class SpellNode(OptimizedNode):
     class Meta:
         model = Spell
         filter_fields = {
@@ -111,7 +126,7 @@ class SpellNode(DjangoObjectType):
         interfaces = (relay.Node, )
 
 
-class ManiaNode(DjangoObjectType):
+class ManiaNode(OptimizedNode):
     class Meta:
         model = Mania
         filter_fields = {
@@ -121,7 +136,7 @@ class ManiaNode(DjangoObjectType):
         interfaces = (relay.Node, )
 
 
-class ManiaInvNode(DjangoObjectType):
+class ManiaInvNode(OptimizedNode):
     class Meta:
         model = ManiaInvestigator
         filter_fields = {
@@ -133,7 +148,7 @@ class ManiaInvNode(DjangoObjectType):
         interfaces = (relay.Node, )
 
 
-class PhobiaNode(DjangoObjectType):
+class PhobiaNode(OptimizedNode):
     class Meta:
         model = Phobia
         filter_fields = {
@@ -143,7 +158,7 @@ class PhobiaNode(DjangoObjectType):
         interfaces = (relay.Node, )
 
 
-class PhobiaInvNode(DjangoObjectType):
+class PhobiaInvNode(OptimizedNode):
     class Meta:
         model = PhobiaInvestigator
         filter_fields = {
@@ -155,7 +170,7 @@ class PhobiaInvNode(DjangoObjectType):
         interfaces = (relay.Node, )
 
 
-class CampaignInvNode(DjangoObjectType):
+class CampaignInvNode(OptimizedNode):
     class Meta:
         model = CampaignInvestigator
         filter_fields = {
@@ -166,7 +181,7 @@ class CampaignInvNode(DjangoObjectType):
         interfaces = (relay.Node, )
 
 
-class InventoryInvNode(DjangoObjectType):
+class InventoryInvNode(OptimizedNode):
     class Meta:
         model = Inventory
         filter_fields = {
@@ -178,7 +193,7 @@ class InventoryInvNode(DjangoObjectType):
         interfaces = (relay.Node, )
 
 
-class DiaryInvNode(DjangoObjectType):
+class DiaryInvNode(OptimizedNode):
     class Meta:
         model = InvestigatorsDiary
         filter_fields = {
@@ -189,7 +204,7 @@ class DiaryInvNode(DjangoObjectType):
         interfaces = (relay.Node, )
 
 
-class TagInvNode(DjangoObjectType):
+class TagInvNode(OptimizedNode):
     class Meta:
         model = InvestigatorTags
         filter_fields = {
@@ -200,7 +215,7 @@ class TagInvNode(DjangoObjectType):
         interfaces = (relay.Node, )
 
 
-class GameNode(DjangoObjectType):
+class GameNode(OptimizedNode):
     class Meta:
         model = Game
         filter_fields = {
@@ -212,3 +227,18 @@ class GameNode(DjangoObjectType):
             'game_type': ['exact']
         }
         interfaces = (relay.Node, )
+
+
+class CharacterSheetNode(ObjectType):
+    """Whole character sheet of an investigator, every section holds the
+    payload of its REST endpoint."""
+    basic_info = GenericScalar()
+    portrait = GenericScalar()
+    attributes = GenericScalar()
+    derivative_attributes = GenericScalar()
+    skills = GenericScalar()
+    weapons = GenericScalar()
+    gear = GenericScalar()
+    manias_phobias = GenericScalar()
+    arcane = GenericScalar()
+    backstory = GenericScalar()
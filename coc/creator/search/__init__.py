@@ -0,0 +1,181 @@
+# '''
+# catalog full text search module.
+# '''
+import re
+import unicodedata
+from collections import namedtuple
+from threading import Lock
+
+from django.conf import settings
+from django.db import connections
+
+from coc import cache
+from creator.models import Item, Mania, Occupation, Phobia, Skills, Spell
+from creator.search.backends import (MemoryIndex, PostgresIndex, SearchDocument,
+                                     SearchHit, SQLiteIndex)
+
+Searchable = namedtuple('Searchable', ['model', 'title_fields', 'body_fields'])
+
+# indexed models by their ALL_MODELS key.
+SEARCHABLE = {
+    'items': Searchable(Item, ('title',), ('description',)),
+    'skills': Searchable(Skills, ('title',), ('description',)),
+    'occupations': Searchable(Occupation, ('title',), ('description',)),
+    'manias': Searchable(Mania, ('title',), ('description',)),
+    'phobias': Searchable(Phobia, ('title',), ('description',)),
+    'spells': Searchable(
+        Spell, ('name', 'alternative_names'), ('description',)),
+}
+MODEL_NAMES = {
+    searchable.model: name for name, searchable in SEARCHABLE.items()
+}
+DATABASE_INDEXES = {
+    'sqlite': SQLiteIndex,
+    'postgresql': PostgresIndex,
+}
+
+_TOKEN = re.compile(r'\w+')
+_lock = Lock()
+_index = None
+# shared version (coc.cache) the memory index was built at.
+_loaded_at = None
+
+
+def tokenize(text: str) -> list:
+    """Lower case words of the text, without accents."""
+    text = unicodedata.normalize('NFKD', text or '')
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return _TOKEN.findall(text.lower())
+
+
+def document(record) -> SearchDocument:
+    """Searchable text of a catalog record."""
+    name = MODEL_NAMES[type(record)]
+    searchable = SEARCHABLE[name]
+    title = getattr(record, searchable.title_fields[0])
+    names = ' '.join(
+        getattr(record, field) or '' for field in searchable.title_fields)
+    body = ' '.join(
+        getattr(record, field) or '' for field in searchable.body_fields)
+    return SearchDocument(
+        model=name,
+        uuid=str(record.uuid),
+        title=title,
+        names=names,
+        body=body,
+        title_tokens=tuple(tokenize(names)),
+        body_tokens=tuple(tokenize(body))
+    )
+
+
+def documents(using: str = 'default'):
+    """Documents of every searchable record, a query per model."""
+    for searchable in SEARCHABLE.values():
+        fields = ('uuid', *searchable.title_fields, *searchable.body_fields)
+        for record in searchable.model.objects.using(using).only(*fields):
+            yield document(record)
+
+
+def new_index(using: str = 'default'):
+    """Index of the SEARCH_BACKEND setting: 'memory', or 'database' for the
+    FTS5 table on SQLite and the tsvector one on PostgreSQL (the other
+    databases get the memory index)."""
+    if getattr(settings, 'SEARCH_BACKEND', 'memory') == 'database':
+        index_class = DATABASE_INDEXES.get(connections[using].vendor)
+        if index_class is not None:
+            return index_class(using)
+    return MemoryIndex()
+
+
+def _stale(index, shared) -> bool:
+    """Whether the index must be (re)built, the memory index is rebuilt
+    once the reference data changed in another process, the database ones
+    are shared."""
+    return index is None or (
+        isinstance(index, MemoryIndex) and _loaded_at != shared)
+
+
+def get_index():
+    """Return the index, the memory one is filled on first use and after
+    the writes of the other processes."""
+    shared = cache.version()
+    index = _index
+    if _stale(index, shared):
+        index = _load(shared)
+    return index
+
+
+def _load(shared):
+    global _index, _loaded_at
+    with _lock:
+        if _stale(_index, shared):
+            index = new_index()
+            if isinstance(index, MemoryIndex):
+                index.rebuild(documents())
+            _index = index
+            _loaded_at = shared
+        return _index
+
+
+def followed(version):
+    """The writes of this process that started `version` are in the
+    memory index already (update, remove), keep it instead of rebuilding it
+    unless another process wrote since it was built.
+    Arguments:
+        version -- shared version returned by coc.cache.bump.
+    """
+    global _loaded_at
+    with _lock:
+        if version is not None and _loaded_at == version - 1:
+            _loaded_at = version
+
+
+def invalidate():
+    """Drop the index, the next access builds it again."""
+    global _index
+    with _lock:
+        _index = None
+
+
+def _current_index():
+    """Index to keep current, the memory one only once it was filled."""
+    backend = getattr(settings, 'SEARCH_BACKEND', 'memory')
+    if _index is None and backend == 'database':
+        return get_index()
+    return _index
+
+
+def update(record):
+    """Index the current text of a saved record."""
+    index = _current_index()
+    if index is not None:
+        index.add(document(record))
+
+
+def remove(record):
+    """Remove a deleted record from the index."""
+    index = _current_index()
+    if index is not None:
+        index.remove(f'{MODEL_NAMES[type(record)]}:{record.uuid}')
+
+
+def rebuild(using: str = 'default'):
+    """Create the index of a database backend and fill it again."""
+    index = new_index(using)
+    if not isinstance(index, MemoryIndex):
+        index.create()
+    index.rebuild(documents(using))
+    return index
+
+
+def search(query: str, models=None) -> list:
+    """Ranked SearchHits of the records matching every word of the query,
+    as a whole word or the start of one (typeahead).
+    Arguments:
+        query -- text searched at the titles and descriptions.
+        models -- iterable of SEARCHABLE keys to search, all by default.
+    """
+    terms = list(dict.fromkeys(tokenize(query)))
+    if not terms:
+        return []
+    return get_index().search(terms, models)
@@ -0,0 +1,140 @@
+# '''
+# catalog titles autocomplete module.
+# '''
+from bisect import bisect_left
+from threading import Lock
+
+from coc import cache
+from creator.constants import ERA
+from creator.search import SEARCHABLE, tokenize
+
+
+class PrefixArray:
+    """Sorted array of normalized keys, the values of the keys starting
+    with a prefix are a contiguous run found with a binary search.
+    Arguments:
+        entries -- iterable of (key, uuid, title).
+    """
+
+    def __init__(self, entries):
+        entries = sorted(entries)
+        self.keys = [key for key, _, _ in entries]
+        self.values = [(uuid, title) for _, uuid, title in entries]
+
+    def matches(self, prefix: str):
+        """(uuid, title) of the keys starting with the prefix, in order."""
+        index = bisect_left(self.keys, prefix)
+        while index < len(self.keys) and self.keys[index].startswith(prefix):
+            yield self.values[index]
+            index += 1
+
+
+class Completions:
+    """Prefix arrays of a model (and era): titles holds the whole titles,
+    words the titles from each of their following words, so "revol" also
+    completes ".45 Revolver" after the titles starting with it."""
+
+    def __init__(self, records):
+        titles = []
+        words = []
+        for uuid, title in records:
+            tokens = tokenize(title)
+            if not tokens:
+                continue
+            titles.append((' '.join(tokens), uuid, title))
+            for start in range(1, len(tokens)):
+                words.append((' '.join(tokens[start:]), uuid, title))
+        self.titles = PrefixArray(titles)
+        self.words = PrefixArray(words)
+
+    def complete(self, prefix: str, limit: int) -> list:
+        results = []
+        seen = set()
+        for array in (self.titles, self.words):
+            for uuid, title in array.matches(prefix):
+                if uuid in seen:
+                    continue
+                seen.add(uuid)
+                results.append((uuid, title))
+                if len(results) == limit:
+                    return results
+        return results
+
+
+ERAS = frozenset(era for era, _ in ERA)
+
+_lock = Lock()
+_completions = None
+# shared version (coc.cache) the completions were loaded at.
+_loaded_at = None
+
+
+def _load() -> dict:
+    """Completions by (model, era), era is None for every era and for the
+    models without one. A query per model."""
+    completions = {}
+    for name, searchable in SEARCHABLE.items():
+        model = searchable.model
+        title_field = searchable.title_fields[0]
+        has_era = any(field.name == 'era' for field in model._meta.fields)
+        fields = ('uuid', title_field, 'era') if has_era else (
+            'uuid', title_field)
+        records = {era: [] for era, _ in ERA} if has_era else {}
+        records[None] = []
+        for row in model.objects.values_list(*fields):
+            uuid, title = str(row[0]), row[1]
+            records[None].append((uuid, title))
+            if has_era:
+                records.setdefault(row[2], []).append((uuid, title))
+        for era, era_records in records.items():
+            completions[(name, era)] = Completions(era_records)
+    return completions
+
+
+def get_completions() -> dict:
+    """Return the loaded completions, reading the database only the first
+    time, after an invalidation or after the writes of another process."""
+    shared = cache.version()
+    completions = _completions
+    if completions is None or _loaded_at != shared:
+        completions = _reload(shared)
+    return completions
+
+
+def _reload(shared) -> dict:
+    global _completions, _loaded_at
+    with _lock:
+        if _completions is None or _loaded_at != shared:
+            _completions = _load()
+            _loaded_at = shared
+        return _completions
+
+
+def invalidate():
+    """Drop the loaded completions, the next access reloads them."""
+    global _completions
+    with _lock:
+        _completions = None
+
+
+def complete(model: str, query: str, era: str = None, limit: int = 10) -> list:
+    """Up to `limit` (uuid, title) of the model whose title, or one of its
+    words, starts with the query. An empty query returns the first titles.
+    Arguments:
+        model -- SEARCHABLE key, eg. items.
+        query -- typed text, matched without case and accents.
+        era -- only the titles of the era, for the models with eras, an
+        unknown one matches nothing.
+    """
+    if era is not None and era not in ERAS:
+        return []
+    completions = get_completions()
+    model_completions = completions.get(
+        (model, era), completions.get((model, None)))
+    if model_completions is None:
+        return []
+    prefix = ' '.join(tokenize(query))
+    # a trailing space completes the next word only.
+    if query[-1:].isspace() and prefix:
+        prefix += ' '
+    return model_completions.complete(prefix, limit)
@@ -0,0 +1,261 @@
+# '''
+# search index backends module.
+# '''
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections import namedtuple
+from threading import Lock
+
+from django.db import connections, transaction
+
+# a search result, model is its key at ALL_MODELS.
+SearchHit = namedtuple('SearchHit', ['model', 'uuid', 'title'])
+
+
+class SearchDocument(namedtuple('SearchDocument', [
+        'model', 'uuid', 'title', 'names', 'body', 'title_tokens',
+        'body_tokens'])):
+    """Indexed text of a catalog record, names are the title and the
+    alternative names of the record."""
+    __slots__ = ()
+
+    @property
+    def key(self) -> str:
+        return f'{self.model}:{self.uuid}'
+
+    @property
+    def hit(self) -> SearchHit:
+        return SearchHit(self.model, self.uuid, self.title)
+
+
+class MemoryIndex:
+    """Inverted index held in the process, built from the catalog tables.
+    Every token maps its documents to a weight, title tokens weigh
+    TITLE_WEIGHT, the others 1. The tokens are also kept sorted so the
+    prefixes of a query are expanded with a binary search.
+    The saves of its own process update it, it is rebuilt after the
+    writes of the other ones, see creator.search.get_index.
+    """
+    TITLE_WEIGHT = 3
+
+    def __init__(self):
+        self._lock = Lock()
+        self.documents = {}
+        self.postings = {}
+        self.tokens = []
+
+    def _postings(self, document) -> dict:
+        weights = {}
+        for token in document.body_tokens:
+            weights[token] = 1
+        for token in document.title_tokens:
+            weights[token] = self.TITLE_WEIGHT
+        return weights
+
+    def rebuild(self, documents):
+        with self._lock:
+            self.documents = {}
+            self.postings = {}
+            for document in documents:
+                self.documents[document.key] = document
+                for token, weight in self._postings(document).items():
+                    self.postings.setdefault(token, {})[document.key] = weight
+            self.tokens = sorted(self.postings)
+
+    def add(self, document):
+        with self._lock:
+            self._remove(document.key)
+            self.documents[document.key] = document
+            for token, weight in self._postings(document).items():
+                if token not in self.postings:
+                    self.postings[token] = {}
+                    self.tokens.insert(bisect_left(self.tokens, token), token)
+                self.postings[token][document.key] = weight
+
+    def remove(self, key: str):
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key: str):
+        # emptied tokens stay in the sorted list, they match nothing.
+        document = self.documents.pop(key, None)
+        if document is None:
+            return
+        for token in self._postings(document):
+            self.postings[token].pop(key, None)
+
+    def _expand(self, term: str):
+        """Indexed tokens starting with the term."""
+        index = bisect_left(self.tokens, term)
+        while index < len(self.tokens) and self.tokens[index].startswith(term):
+            yield self.tokens[index]
+            index += 1
+
+    def search(self, terms: list, models=None) -> list:
+        """Documents holding every term, as a word or a word prefix, ranked
+        by the weight of their matches, exact words count twice."""
+        with self._lock:
+            scores = None
+            for term in terms:
+                matches = {}
+                for token in self._expand(term):
+                    boost = 2 if token == term else 1
+                    for key, weight in self.postings[token].items():
+                        matches[key] = max(matches.get(key, 0), weight * boost)
+                if scores is not None:
+                    matches = {
+                        key: scores[key] + score
+                        for key, score in matches.items() if key in scores
+                    }
+                scores = matches
+                if not scores:
+                    return []
+            documents = [
+                self.documents[key] for key in scores
+                if models is None or self.documents[key].model in models
+            ]
+        documents.sort(key=lambda document: (
+            -scores[document.key], document.title))
+        return [document.hit for document in documents]
+
+
+class DatabaseIndex(ABC):
+    """Index stored in a table of the database, shared by every process.
+    The table is created and filled after migrating, see
+    creator.signals.create_search_table. Every vendor implements the table
+    creation, its rows and the ranked query.
+    """
+    table = 'creator_search'
+
+    def __init__(self, using: str = 'default'):
+        self.using = using
+
+    @property
+    def connection(self):
+        return connections[self.using]
+
+    @abstractmethod
+    def create(self):
+        """Create the table of the index if it is missing."""
+
+    def rebuild(self, documents):
+        with transaction.atomic(using=self.using):
+            with self.connection.cursor() as cursor:
+                cursor.execute(f'DELETE FROM {self.table}')
+                for document in documents:
+                    cursor.execute(self.insert_sql, self._row(document))
+
+    def add(self, document):
+        with transaction.atomic(using=self.using):
+            with self.connection.cursor() as cursor:
+                cursor.execute(
+                    f'DELETE FROM {self.table} WHERE key = %s',
+                    [document.key]
+                )
+                cursor.execute(self.insert_sql, self._row(document))
+
+    def remove(self, key: str):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table} WHERE key = %s', [key])
+
+    @property
+    @abstractmethod
+    def insert_sql(self) -> str:
+        """INSERT of a row, its parameters are the ones of _row."""
+
+    @abstractmethod
+    def _row(self, document) -> list:
+        """Parameters of the insert_sql of a document."""
+
+    @abstractmethod
+    def _query(self, terms: list, condition: str, params: list) -> tuple:
+        """SQL and parameters of the ranked (model, uuid, title) rows,
+        `condition` and its `params` filter the model column."""
+
+    def search(self, terms: list, models=None) -> list:
+        params = []
+        condition = ''
+        if models is not None:
+            models = list(models)
+            if not models:
+                return []
+            condition = f"AND model IN ({', '.join(['%s'] * len(models))})"
+            params = models
+        sql, params = self._query(terms, condition, params)
+        with self.connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return [SearchHit(*row) for row in cursor.fetchall()]
+
+
+class SQLiteIndex(DatabaseIndex):
+    """FTS5 table ranked by bm25, names weigh three times the
+    descriptions."""
+
+    def create(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} USING fts5("
+                "key UNINDEXED, model UNINDEXED, uuid UNINDEXED, "
+                "title UNINDEXED, names, body, "
+                "tokenize = 'unicode61 remove_diacritics 2')"
+            )
+
+    @property
+    def insert_sql(self) -> str:
+        return (
+            f'INSERT INTO {self.table} (key, model, uuid, title, names, body) '
+            'VALUES (%s, %s, %s, %s, %s, %s)'
+        )
+
+    def _row(self, document) -> list:
+        return [document.key, document.model, document.uuid, document.title,
+                document.names, document.body]
+
+    def _query(self, terms: list, condition: str, params: list) -> tuple:
+        # terms are made of word characters only, quoting them is safe.
+        match = ' '.join(f'"{term}"*' for term in terms)
+        sql = (
+            f'SELECT model, uuid, title FROM {self.table} '
+            f'WHERE {self.table} MATCH %s {condition} '
+            f'ORDER BY bm25({self.table}, 0, 0, 0, 0, 3.0, 1.0), title'
+        )
+        return sql, [match, *params]
+
+
+class PostgresIndex(DatabaseIndex):
+    """tsvector column with a GIN index, names are weighted A and the
+    descriptions B."""
+
+    def create(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE TABLE IF NOT EXISTS {self.table} ('
+                'key varchar(64) PRIMARY KEY, model varchar(16) NOT NULL, '
+                'uuid varchar(36) NOT NULL, title text NOT NULL, '
+                'document tsvector NOT NULL)'
+            )
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS {self.table}_document_idx '
+                f'ON {self.table} USING gin (document)'
+            )
+
+    @property
+    def insert_sql(self) -> str:
+        return (
+            f'INSERT INTO {self.table} (key, model, uuid, title, document) '
+            "VALUES (%s, %s, %s, %s, setweight(to_tsvector('simple', %s), 'A')"
+            " || setweight(to_tsvector('simple', %s), 'B'))"
+        )
+
+    def _row(self, document) -> list:
+        return [document.key, document.model, document.uuid, document.title,
+                ' '.join(document.title_tokens), ' '.join(document.body_tokens)]
+
+    def _query(self, terms: list, condition: str, params: list) -> tuple:
+        query = ' & '.join(f'{term}:*' for term in terms)
+        sql = (
+            f"SELECT model, uuid, title FROM {self.table}, "
+            f"to_tsquery('simple', %s) query WHERE document @@ query "
+            f"{condition} ORDER BY ts_rank(document, query) DESC, title"
+        )
+        return sql, [query, *params]
@@ -0,0 +1,162 @@
+# '''
+# catalog faceted search module.
+# '''
+from collections import namedtuple
+from json import dumps
+
+from django.core.exceptions import ValidationError
+from django.db.models import BooleanField, Count, Q
+
+from creator.search import SEARCHABLE
+
+# name -- key of the facet counts and of the filter parameter.
+# lookup -- field filtered and grouped by.
+Facet = namedtuple('Facet', ['name', 'lookup'])
+# name -- the min_<name> and max_<name> parameters bound the field.
+Range = namedtuple('Range', ['name', 'field'])
+
+FACETS = {
+    'items': (
+        Facet('era', 'era'),
+        Facet('category', 'category'),
+        Facet('subcategory', 'properties__subcategory'),
+        Facet('rare', 'rare'),
+    ),
+    'skills': (Facet('era', 'era'), Facet('uncommon', 'uncommon')),
+    'occupations': (Facet('era', 'era'),),
+    'spells': (Facet('spell_category', 'category'),),
+    'manias': (),
+    'phobias': (),
+}
+RANGES = {
+    'items': (Range('price', 'base_price'),),
+}
+
+
+def _to_python(model, lookup: str, value: str):
+    """Value of a filter parameter as the field holds it, the keys of the
+    JSON fields are compared as strings."""
+    if '__' in lookup:
+        return value
+    field = model._meta.get_field(lookup)
+    if isinstance(field, BooleanField):
+        # true/false as the facets name them.
+        value = value.capitalize()
+    return field.to_python(value)
+
+
+def _facet_value(value) -> str:
+    """Facet count key of a field value, as it is filtered by."""
+    if isinstance(value, bool) or value is None:
+        return dumps(value)
+    return str(value)
+
+
+def compile_filters(model_name: str, params: dict):
+    """Compile the filter parameters into one Q of the model.
+    Arguments:
+        model_name -- SEARCHABLE key.
+        params -- dict of parameter names to their list of values, values
+        of a facet are alternatives (OR), the facets and ranges are all
+        required (AND).
+    Returns:
+        the Q, or None when a parameter does not apply to the model (the
+        price range leaves out everything but the items).
+    Raises:
+        ValidationError -- a value does not fit its field.
+    """
+    model = SEARCHABLE[model_name].model
+    facets = {facet.name: facet for facet in FACETS[model_name]}
+    ranges = {
+        f'{bound}_{range_.name}': (range_.field, lookup)
+        for range_ in RANGES.get(model_name, ())
+        for bound, lookup in (('min', 'gte'), ('max', 'lte'))
+    }
+    filters = Q()
+    for name, values in params.items():
+        values = [value for value in values if value != '']
+        if not values:
+            continue
+        if name in facets:
+            lookup = facets[name].lookup
+            filters &= Q(**{f'{lookup}__in': [
+                _to_python(model, lookup, value) for value in values]})
+        elif name in ranges:
+            field, lookup = ranges[name]
+            filters &= Q(**{f'{field}__{lookup}': _to_python(
+                model, field, values[0])})
+        else:
+            return None
+    return filters
+
+
+def faceted_search(model_name: str, filters: Q, offset: int = 0,
+                   limit: int = 20) -> dict:
+    """Records of the model matching the filters and the facet counts of
+    the matches, in two queries: a single aggregate grouped by every facet
+    of the model, folded into one count per facet value, and the page of
+    records.
+    Returns:
+        dict of count, facets and records (safe_dict with the uuid).
+    """
+    model = SEARCHABLE[model_name].model
+    facets = FACETS[model_name]
+    queryset = model.objects.filter(filters)
+    counts = {facet.name: {} for facet in facets}
+    if facets:
+        total = 0
+        groups = queryset.values(
+            *[facet.lookup for facet in facets]
+        ).annotate(count=Count('pk')).order_by()
+        for group in groups:
+            total += group['count']
+            for facet in facets:
+                value = _facet_value(group[facet.lookup])
+                counts[facet.name][value] = \
+                    counts[facet.name].get(value, 0) + group['count']
+    else:
+        total = queryset.count()
+    records = []
+    if total > offset:
+        title_field = SEARCHABLE[model_name].title_fields[0]
+        records = [
+            {'uuid': str(record.uuid), **record.safe_dict()}
+            for record in queryset.order_by(title_field, 'uuid')[
+                offset:offset + limit]
+        ]
+    return {'count': total, 'facets': counts, 'records': records}
+
+
+def search(params: dict, models=None, uuids: dict = None, offset: int = 0,
+           limit: int = 20) -> dict:
+    """Faceted search over every model the parameters apply to.
+    Arguments:
+        params -- filter parameters, see compile_filters.
+        models -- SEARCHABLE keys searched, all by default.
+        uuids -- optional dict of model name to the uuids the records are
+        restricted to, eg. the full text search hits.
+    Returns:
+        dict of model name to its faceted_search result.
+    Raises:
+        ValidationError -- unknown parameter or a value that does not fit.
+    """
+    known = {facet.name for facets in FACETS.values() for facet in facets}
+    known.update(
+        f'{bound}_{range_.name}' for ranges in RANGES.values()
+        for range_ in ranges for bound in ('min', 'max')
+    )
+    unknown = sorted(set(params) - known)
+    if unknown:
+        raise ValidationError(f"Unknown filters {', '.join(unknown)}")
+    results = {}
+    for model_name in models or SEARCHABLE:
+        filters = compile_filters(model_name, params)
+        if filters is None:
+            continue
+        if uuids is not None:
+            if not uuids.get(model_name):
+                continue
+            filters &= Q(uuid__in=uuids[model_name])
+        results[model_name] = faceted_search(
+            model_name, filters, offset, limit)
+    return results
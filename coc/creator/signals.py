@@ -0,0 +1,150 @@
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.db.models.signals import (post_delete, post_migrate, post_save,
+                                      pre_migrate)
+from django.dispatch import receiver
+
+from coc import cache
+from coc.utils import mutated
+from creator import catalog, search
+from creator.helpers.upserts import remove_duplicates
+from creator.search import autocomplete
+from creator.models import (CampaignInvestigator, Inventory, Investigator,
+                            InvestigatorTags, Item, Mania, ManiaInvestigator,
+                            Occupation, Phobia, PhobiaInvestigator, Skills,
+                            Spell, SpellInvestigator)
+
+# PostgreSQL indexes of the JSON lookups, (model, name, expression, method).
+# Django filters a key as `properties -> 'subcategory'` compared with jsonb
+# values (properties__subcategory, properties__subcategory__in), the btree
+# indexes are on that same expression so the planner can match them.
+JSON_INDEXES = (
+    (Item, 'creator_item_subcategory_idx',
+     "(properties -> 'subcategory')", 'btree'),
+    (Inventory, 'creator_inventory_subcategory_idx',
+     "(properties -> 'subcategory')", 'btree'),
+    # key lookups and containment of the skills, eg. skills__has_key.
+    (Investigator, 'creator_investigator_skills_gin', 'skills', 'gin'),
+)
+
+# Relations held once per investigator, (model, unique fields, merged
+# fields), see remove_relation_duplicates.
+UNIQUE_RELATIONS = (
+    (InvestigatorTags, ('investigator', 'tag'), ()),
+    (CampaignInvestigator, ('investigator', 'campaign'), ()),
+    (ManiaInvestigator, ('investigator', 'mania'), ('duration',)),
+    (PhobiaInvestigator, ('investigator', 'phobia'), ('duration',)),
+    (SpellInvestigator, ('investigator', 'spell'), ()),
+)
+
+
+@receiver(post_save, sender=Item)
+@receiver(post_save, sender=Skills)
+@receiver(post_save, sender=Occupation)
+@receiver(post_save, sender=Mania)
+@receiver(post_save, sender=Phobia)
+@receiver(post_save, sender=Spell)
+def index_record(sender, instance, **kwargs):
+    """Keep the search index current with the saved record."""
+    search.update(instance)
+    autocomplete.invalidate()
+
+
+@receiver(post_delete, sender=Item)
+@receiver(post_delete, sender=Skills)
+@receiver(post_delete, sender=Occupation)
+@receiver(post_delete, sender=Mania)
+@receiver(post_delete, sender=Phobia)
+@receiver(post_delete, sender=Spell)
+def unindex_record(sender, instance, **kwargs):
+    """Drop the deleted record from the search index."""
+    search.remove(instance)
+    autocomplete.invalidate()
+
+
+# connected after index_record and unindex_record, the record is in the
+# search index by the time the version it starts is followed.
+@receiver([post_save, post_delete], sender=Item)
+@receiver([post_save, post_delete], sender=Occupation)
+@receiver([post_save, post_delete], sender=Skills)
+@receiver([post_save, post_delete], sender=Spell)
+@receiver([post_save, post_delete], sender=Mania)
+@receiver([post_save, post_delete], sender=Phobia)
+def invalidate_catalog(sender, **kwargs):
+    """Reference data changed, drop the in process catalog (manias and
+    phobias are not loaded but count in its version) and start a new
+    version of the cached responses. The search index already has the
+    change and is kept."""
+    catalog.invalidate()
+    search.followed(cache.bump())
+
+
+@receiver(mutated)
+def catalog_mutated(sender, method, records, **kwargs):
+    """Keep the caches current with the mutations of the reference data,
+    their updates and bulk writes skip the model signals."""
+    if sender not in search.MODEL_NAMES:
+        return
+    for record in records:
+        if method == 'delete':
+            search.remove(record)
+        else:
+            search.update(record)
+    autocomplete.invalidate()
+    catalog.invalidate()
+    search.followed(cache.bump())
+
+
+@receiver(pre_migrate)
+def remove_relation_duplicates(sender, using='default', **kwargs):
+    """Merge the UNIQUE_RELATIONS an investigator holds more than once
+    before migrating, their unique constraints can not be added over
+    duplicates. The earliest row is kept, with the longest duration of
+    the manias and phobias."""
+    if sender.name != 'creator':
+        return
+    tables = connections[using].introspection.table_names()
+    for model, fields, merge in UNIQUE_RELATIONS:
+        if model._meta.db_table in tables:
+            remove_duplicates(model, fields, merge, using)
+
+
+@receiver(post_migrate)
+def create_search_table(sender, using='default', **kwargs):
+    """Create and fill the search table of the database SEARCH_BACKEND."""
+    if sender.name != 'creator':
+        return
+    if getattr(settings, 'SEARCH_BACKEND', 'memory') != 'database':
+        return
+    if connections[using].vendor in search.DATABASE_INDEXES:
+        search.rebuild(using)
+
+
+@receiver(post_migrate)
+def create_json_indexes(sender, using='default', **kwargs):
+    """Create the JSON_INDEXES after migrating on PostgreSQL, expression
+    indexes can not be declared in the models. The other databases go
+    without them."""
+    if sender.name != 'creator':
+        return
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        for model, name, expression, method in JSON_INDEXES:
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {connection.ops.quote_name(name)} "
+                f"ON {connection.ops.quote_name(model._meta.db_table)} "
+                f"USING {method} ({expression})"
+            )
+
+
+@receiver(connection_created)
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """Run the SQLITE_PRAGMAS setting on every new SQLite connection."""
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for pragma, value in getattr(settings, 'SQLITE_PRAGMAS', {}).items():
+            cursor.execute(f'PRAGMA {pragma} = {value}')
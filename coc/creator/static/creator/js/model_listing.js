@@ -74,6 +74,42 @@ export function getListingData (url) {
 };
 
 
+export function autocompleteListing(model_name){
+    //lists the first records of the model, narrowed down while typing on the search box
+    let timer = null;
+    let request = null;
+    function complete(){
+        let query = $('#mod-search').val() || '';
+        if (request !== null){
+            //the previous query was typed past, drop its answer
+            request.abort();
+        }
+        request = $.ajax({
+            url: "autocomplete/" + model_name,
+            data: {'q': query, 'limit': 50},
+            success: function (res) {
+                if (res.query !== ($('#mod-search').val() || '')){
+                    return;
+                }
+                $('#mod-list').empty();
+                list_model(res);
+            },
+            error: function (res, status) {
+                if (status !== 'abort'){
+                    console.log(res);
+                }
+            }
+        })
+    }
+    //debounced, a request once the typing pauses
+    $('#mod-search').on('input', function(){
+        clearTimeout(timer);
+        timer = setTimeout(complete, 150);
+    })
+    complete();
+};
+
+
 export function createOverlay(){
     //creates an overlay for the sidebar + disables buttons for listing
     $('.wrapper').append('<div class="overlay"></div>');
@@ -82,6 +118,7 @@ export function createOverlay(){
         //when the overlay is clicked it removes all appended elements of the sidebar and removes the overlay
         $('.overlay').remove();
         $('#mod-list').remove();
+        $('#mod-search').remove();
         $('#sidebar-header').remove()
         $('.listing-btn').prop('disabled', false);
     })
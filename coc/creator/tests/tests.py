@@ -1,3 +1,1134 @@
-from django.test import TestCase
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from datetime import timedelta
+from io import StringIO
+from json import loads
+from os import path
+from random import Random
+from tempfile import TemporaryDirectory
+from uuid import uuid4
 
-# Create your tests here.
+import numpy as np
+from django.apps import apps
+from django.core.cache import caches
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from graphql import parse
+
+from coc import cache
+from coc.backends import (CostAnalysisBackend, LRUCachedBackend,
+                          ResultCachedBackend)
+from coc.persisted_queries import query_hash
+from coc.query_cost import QueryCostError, check_query_cost
+from coc.schema import schema
+from creator import catalog, search
+from creator.helpers.upserts import remove_duplicates
+from creator.models import (Inventory, Investigator, Item, Mania,
+                            ManiaInvestigator, Phobia, PhobiaInvestigator,
+                            Skills, Spell, SpellInvestigator)
+from creator.random_inv import (RandomInvestigator, load_reference_data,
+                                skill_point_assigner)
+from creator.random_inv.allocator import SKILL_CAP, allocate
+from creator.random_inv.names import names_sampler, sample_names
+from creator.search import autocomplete
+from creator.search.autocomplete import Completions
+from creator.search.backends import DatabaseIndex
+from creator.signals import apply_sqlite_pragmas, remove_relation_duplicates
+
+User = get_user_model()
+
+CORE_FIXTURES = [
+    'core/skills.json',
+    'core/occupations.json',
+    'items/items_tool.json',
+    'items/items_consumable.json',
+    'items/items_weapons_handguns.json',
+    'items/items_weapons_hand_to_hand.json',
+    'spells/spells_contact.json',
+]
+
+
+class RandomInvestigatorTest(TestCase):
+    """Random investigator generator tests."""
+    fixtures = CORE_FIXTURES
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(pk=1, username='keeper')
+
+    def test_build(self):
+        rand = RandomInvestigator()
+        rand.build()
+        investigator = Investigator.objects.get(uuid=rand.investigator.uuid)
+        assert investigator.skills
+        assert Inventory.objects.filter(investigator=investigator).exists()
+
+    def test_build_many(self):
+        investigators = RandomInvestigator.build_many(25, user=self.user)
+        assert Investigator.objects.count() == 25
+        # one weapon per investigator at least
+        assert Inventory.objects.count() >= 25
+        assert all(inv.skills for inv in investigators)
+
+    def test_build_none(self):
+        assert RandomInvestigator.build_many(0, user=self.user) == []
+        skill_point_assigner([], [], [])
+        with self.assertRaises(CommandError):
+            call_command('generate_investigators', 0, stdout=StringIO())
+        assert not Investigator.objects.exists()
+
+    def test_seeded_build_is_reproducible(self):
+        reference = load_reference_data(self.user)
+        alone = RandomInvestigator(seed=1234)
+        RandomInvestigator.assemble_many([alone], reference)
+        batch = [RandomInvestigator(seed=seed) for seed in (99, 1234, 7)]
+        RandomInvestigator.assemble_many(batch, reference)
+        investigator = alone.investigator
+        replayed = batch[1].investigator
+        assert investigator.seed == replayed.seed == 1234
+        assert investigator.name == replayed.name
+        assert investigator.occupation == replayed.occupation
+        assert investigator.skills == replayed.skills
+        assert [inv.item for inv in alone.inventory] == \
+            [inv.item for inv in batch[1].inventory]
+
+    def test_build_many_records_seeds(self):
+        first = RandomInvestigator.build_many(3, user=self.user, seed=5)
+        second = RandomInvestigator.build_many(3, user=self.user, seed=5)
+        assert [inv.seed for inv in first] == [inv.seed for inv in second]
+        assert Investigator.objects.filter(seed=first[0].seed).count() == 2
+
+    def test_invalid_seed(self):
+        investigator = RandomInvestigator.build_many(1, user=self.user)[0]
+        for seed in ('abc', '1.5', str(2 ** 63), '-1'):
+            response = self.client.get('/creator/random', {'seed': seed})
+            assert response.status_code == 400
+            response = self.client.get(
+                reverse('inv_skills_shuffle', args=[investigator.uuid]),
+                {'seed': seed}
+            )
+            assert response.status_code == 400
+        assert Investigator.objects.count() == 1
+        response = self.client.get('/creator/random', {'seed': 2 ** 63 - 1})
+        assert response.status_code == 302
+        assert Investigator.objects.filter(seed=2 ** 63 - 1).exists()
+        with self.assertRaises(ValueError):
+            RandomInvestigator(seed=2 ** 63)
+
+
+class DerivedStatsTest(TestCase):
+    """Stored derived stats of the investigators."""
+    fixtures = CORE_FIXTURES
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(pk=1, username='keeper')
+        RandomInvestigator.build_many(5, user=cls.user)
+
+    def test_stored_on_write(self):
+        for investigator in Investigator.objects.select_related('occupation'):
+            assert investigator.derived_fresh
+            assert investigator.move_rate == investigator._compute_move()
+            assert (investigator.build_bonus, investigator.build_value) == \
+                investigator._compute_build()
+            assert investigator.occupation_points == \
+                investigator._compute_occupation_skill_points()
+
+    def test_read_without_occupation_query(self):
+        investigator = Investigator.objects.first()
+        with self.assertNumQueries(0):
+            investigator.occupation_skill_points
+            investigator.move
+            investigator.build
+
+    def test_recomputed_on_change(self):
+        investigator = Investigator.objects.first()
+        investigator.strength, investigator.size = 90, 90
+        investigator.save(update_fields=['strength', 'size'])
+        investigator.refresh_from_db()
+        assert investigator.build_value == 2
+        # queryset updates leave them stale until the next save
+        Investigator.objects.filter(pk=investigator.pk).update(strength=20)
+        investigator.refresh_from_db()
+        assert not investigator.derived_fresh
+        assert investigator.build == ('0', 0)
+        call_command('refresh_derived_stats', stdout=StringIO())
+        assert Investigator.objects.order_by('build_value').filter(
+            pk=investigator.pk, build_value=0).exists()
+
+    def test_move_at_edge_ages(self):
+        investigator = Investigator.objects.first()
+        investigator.strength = investigator.dexterity = 90
+        investigator.size = 40
+        for age, move in ((39, 9), (40, 8), (110, 1), (120, 0), (130, 0)):
+            investigator.age = age
+            investigator.save()
+            investigator.refresh_from_db()
+            assert investigator.move_rate == move
+        # stale rows refreshed in bulk
+        Investigator.objects.update(age=150)
+        call_command('refresh_derived_stats', stdout=StringIO())
+        assert not Investigator.objects.exclude(move_rate=0).exists()
+
+
+class CharacterSheetTest(TestCase):
+    """Aggregate character sheet tests."""
+    fixtures = CORE_FIXTURES + [
+        'core/manias.json',
+        'core/phobias.json',
+        'items/items_artifacts.json',
+        'items/items_tomes.json',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(pk=1, username='keeper')
+        cls.investigator = RandomInvestigator.build_many(1, user=cls.user)[0]
+        for mania in Mania.objects.all()[:3]:
+            ManiaInvestigator.objects.create(
+                investigator=cls.investigator, mania=mania)
+        for phobia in Phobia.objects.all()[:3]:
+            PhobiaInvestigator.objects.create(
+                investigator=cls.investigator, phobia=phobia)
+        # lucky investigators already know a spell.
+        for spell in Spell.objects.exclude(
+                spellinvestigator__investigator=cls.investigator)[:3]:
+            SpellInvestigator.objects.create(
+                investigator=cls.investigator, spell=spell)
+        artifacts = Item.objects.filter(
+            properties__subcategory='Artifacts')[:3]
+        tomes = Item.objects.filter(
+            properties__subcategory='Tomes of Eldritch Lore')[:3]
+        for item in [*artifacts, *tomes]:
+            properties = item.properties.copy()
+            properties.update(title=item.title, description=item.description)
+            Inventory.objects.create(
+                investigator=cls.investigator, item=item,
+                properties=properties)
+
+    def test_sheet(self):
+        uuid = self.investigator.uuid
+        catalog.get_catalog()
+        # investigator, inventory, manias, phobias and spells
+        with self.assertNumQueries(5):
+            sheet = self.client.get(reverse('inv_sheet', args=[uuid])).json()
+        for section, name in [
+                ('skills', 'inv_skills'), ('weapons', 'inv_weapons'),
+                ('gear', 'inv_gear'), ('arcane', 'inv_arcane'),
+                ('manias_phobias', 'inv_manias_phobias'),
+                ('backstory', 'inv_backstory'),
+                ('portrait', 'inv_portrait'),
+                ('attributes', 'inv_attrs'),
+                ('derivative_attributes', 'inv_deriv_attrs')]:
+            response = self.client.get(reverse(name, args=[uuid]))
+            assert sheet[section] == response.json(), section
+        assert sheet['basic_info']['investigator']['name'] == \
+            self.investigator.name
+        assert len(sheet['manias_phobias']['manias']) == 3
+        assert len(sheet['arcane']['spells']) >= 3
+
+    def test_endpoint_query_budgets(self):
+        uuid = self.investigator.uuid
+        budgets = [
+            # investigator and its filtered inventory
+            ('inv_weapons', 2),
+            ('inv_gear', 2),
+            # investigator, magic inventory and spells
+            ('inv_arcane', 3),
+            # investigator, manias and phobias
+            ('inv_manias_phobias', 3),
+        ]
+        for name, queries in budgets:
+            with self.assertNumQueries(queries):
+                response = self.client.get(reverse(name, args=[uuid]))
+            assert response.status_code == 200, name
+        arcane = self.client.get(reverse('inv_arcane', args=[uuid])).json()
+        assert arcane['artifacts'] and arcane['tomes']
+
+    def post_counting_queries(self, name, data):
+        """Response and queries of a post, savepoints of the test
+        transaction are not counted."""
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(reverse(name), data)
+        queries = [
+            query for query in context.captured_queries
+            if not query['sql'].startswith(('SAVEPOINT', 'RELEASE'))
+        ]
+        return response, len(queries)
+
+    def test_add_once(self):
+        mania = Mania.objects.exclude(
+            maniainvestigator__investigator=self.investigator).first()
+        data = {'inv': self.investigator.uuid, 'mania': mania.uuid}
+        response, queries = self.post_counting_queries('mania_add', data)
+        assert response.status_code == 201
+        assert response.json()['title'] == mania.title
+        # the insert and the read of the row
+        assert queries == 2
+        response, queries = self.post_counting_queries('mania_add', data)
+        assert response.status_code == 304
+        assert queries == 2
+        assert ManiaInvestigator.objects.filter(
+            investigator=self.investigator, mania=mania).count() == 1
+
+    def test_remove_duplicates(self):
+        # the constraints are in place, the manias held by the investigator
+        # are duplicates of the (investigator,) group.
+        manias = ManiaInvestigator.objects.filter(
+            investigator=self.investigator).order_by('pk')
+        first, *others = manias
+        ManiaInvestigator.objects.filter(pk=first.pk).update(
+            created=first.created - timedelta(days=1))
+        ManiaInvestigator.objects.filter(pk=others[-1].pk).update(
+            duration=30)
+        deleted = remove_duplicates(
+            ManiaInvestigator, ('investigator',), ('duration',))
+        assert deleted == len(others)
+        kept = ManiaInvestigator.objects.get(investigator=self.investigator)
+        assert kept.pk == first.pk
+        assert kept.duration == 30
+        assert remove_duplicates(
+            ManiaInvestigator, ('investigator',), ('duration',)) == 0
+        # nothing repeats the unique fields of the relations.
+        spells = SpellInvestigator.objects.count()
+        remove_relation_duplicates(apps.get_app_config('creator'))
+        assert SpellInvestigator.objects.count() == spells
+
+    def test_add_item_stacks(self):
+        catalog.get_catalog()
+        # a weapon, its response carries the investigator skill value
+        item = Item.objects.filter(category=3).exclude(
+            inventory__investigator=self.investigator).first()
+        data = {'inv': self.investigator.uuid, 'item': item.uuid}
+        response, queries = self.post_counting_queries('item_add', data)
+        assert response.status_code == 201
+        assert response.json()['item']['properties']['skill_value']
+        # stock update, investigator (locked first on postgres) and insert
+        assert queries == 3
+        response, queries = self.post_counting_queries('item_add', data)
+        assert response.status_code == 200
+        assert queries <= 2
+        inventory = Inventory.objects.get(
+            investigator=self.investigator, item=item)
+        assert inventory.stock == 2
+        # other items skip the investigator, the update and the insert
+        item = Item.objects.exclude(category=3).exclude(
+            inventory__investigator=self.investigator).first()
+        data = {'inv': self.investigator.uuid, 'item': item.uuid}
+        response, queries = self.post_counting_queries('item_add', data)
+        assert response.status_code == 201
+        assert queries == 2
+        response, queries = self.post_counting_queries('item_add', data)
+        assert response.status_code == 200
+        assert queries <= 2
+        assert Inventory.objects.get(
+            investigator=self.investigator, item=item).stock == 2
+
+    def test_add_item_missing_from_catalog(self):
+        catalog.get_catalog()
+        # inserted without signals, as seen by a process that did not save it
+        item = Item.objects.exclude(category=3).first()
+        item.uuid = uuid4()
+        Item.objects.bulk_create([item])
+        data = {'inv': self.investigator.uuid, 'item': item.uuid}
+        response = self.client.post(reverse('item_add'), data)
+        assert response.status_code == 201
+        data['item'] = uuid4()
+        assert self.client.post(reverse('item_add'), data).status_code == 404
+
+    def test_sheet_graphql(self):
+        query = """
+        query {
+            characterSheet(uuid: "%s") {
+                skills
+                weapons
+                manias_phobias: maniasPhobias
+            }
+        }
+        """ % self.investigator.uuid
+        response = self.client.post(
+            '/graphql', {'query': query}, content_type='application/json')
+        data = response.json()['data']['characterSheet']
+        sheet = self.client.get(
+            reverse('inv_sheet', args=[self.investigator.uuid])).json()
+        assert data['skills'] == sheet['skills']
+        assert data['weapons'] == sheet['weapons']
+        assert data['manias_phobias'] == sheet['manias_phobias']
+
+
+class GraphQLOptimizationTest(TestCase):
+    """ForeignKey edges of the graphql nodes resolve without extra queries."""
+    fixtures = CORE_FIXTURES
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(pk=1, username='keeper')
+        RandomInvestigator.build_many(10, user=cls.user)
+
+    def graphql(self, query):
+        response = self.client.post(
+            '/graphql', {'query': query}, content_type='application/json')
+        return response.json()
+
+    def test_investigators_edges(self):
+        query = """
+        query {
+            allInvestigators {
+                edges { node { name ...Relations } }
+            }
+        }
+        fragment Relations on InvestigatorNode {
+            occupation { title }
+            user { username }
+        }
+        """
+        # count and page of the connection
+        with self.assertNumQueries(2):
+            res = self.graphql(query)
+        edges = res['data']['allInvestigators']['edges']
+        assert len(edges) == 10
+        assert all(edge['node']['occupation']['title'] for edge in edges)
+        assert res['extensions']['queries'] == 2
+
+    def test_nested_edges(self):
+        query = """
+        query {
+            allInventorysInv {
+                edges {
+                    node {
+                        item { title }
+                        investigator { name occupation { title } }
+                    }
+                }
+            }
+        }
+        """
+        res = self.graphql(query)
+        assert len(res['data']['allInventorysInv']['edges']) >= 10
+        assert res['extensions']['queries'] == 2
+        assert res['extensions']['cost'] == 501
+
+    def test_query_over_budget(self):
+        query = """
+        {
+            allInvestigators {
+                edges { node { inventorySet { edges { node { uuid } } } } }
+            }
+        }
+        """
+        response = self.client.post(
+            '/graphql', {'query': query}, content_type='application/json')
+        assert response.status_code == 400
+        assert 'exceeds the maximum cost' in \
+            response.json()['errors'][0]['message']
+        # rejected before touching the database
+        assert response.json()['extensions']['queries'] == 0
+
+
+class BulkMutationTest(TestCase):
+    """Bulk graphql mutations tests."""
+    fixtures = CORE_FIXTURES
+
+    bulk_inventory = """
+    mutation ($method: String!, $records: [InventoryInvRecord!]!) {
+        inventoryInvBulkMutate(input: {method: $method, records: $records}) {
+            inventoryInvs { uuid stock item { title } }
+        }
+    }
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(pk=1, username='keeper')
+        cls.investigator = RandomInvestigator.build_many(1, user=cls.user)[0]
+
+    def bulk(self, method, records):
+        response = self.client.post(
+            '/graphql',
+            {
+                'query': self.bulk_inventory,
+                'variables': {'method': method, 'records': records}
+            },
+            content_type='application/json'
+        )
+        return response.json()
+
+    def test_bulk_inventory(self):
+        items = Item.objects.all()[:20]
+        records = [
+            {
+                'investigator': str(self.investigator.uuid),
+                'item': str(item.uuid),
+                'stock': 2,
+                'properties': '{"title": "bulk"}'
+            }
+            for item in items
+        ]
+        before = Inventory.objects.count()
+        res = self.bulk('CREATE', records)
+        created = res['data']['inventoryInvBulkMutate']['inventoryInvs']
+        assert len(created) == 20
+        assert created[0]['item']['title'] == items[0].title
+        # investigators, items and the insert, regardless of the batch size
+        assert res['extensions']['queries'] <= 5
+        assert Inventory.objects.count() == before + 20
+
+        res = self.bulk('UPDATE', [
+            {'uuid': record['uuid'], 'stock': 7} for record in created])
+        assert res['extensions']['queries'] <= 4
+        assert Inventory.objects.filter(stock=7).count() == 20
+
+        res = self.bulk('DELETE', [{'uuid': record['uuid']} for record in created])
+        assert Inventory.objects.count() == before
+
+    def test_bulk_validates_whole_batch(self):
+        item = Item.objects.first()
+        records = [
+            {'investigator': str(self.investigator.uuid), 'item': str(item.uuid),
+             'properties': '{}'},
+            {'investigator': str(self.investigator.uuid),
+             'item': '00000000-0000-0000-0000-000000000000',
+             'properties': '{}'},
+        ]
+        before = Inventory.objects.count()
+        res = self.bulk('CREATE', records)
+        assert 'records[1] Item' in res['errors'][0]['message']
+        assert Inventory.objects.count() == before
+
+
+class MutationQueryCountTest(TestCase):
+    """Related records of the single mutations are assigned by id."""
+    fixtures = CORE_FIXTURES + ['core/manias.json']
+
+    mania_inv = """
+    mutation ($input: ManiaInvMutationInput!) {
+        maniaInvMutate(input: $input) { maniaInv { uuid duration } }
+    }
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(pk=1, username='keeper')
+        cls.investigator = RandomInvestigator.build_many(1, user=cls.user)[0]
+        cls.mania = Mania.objects.first()
+
+    def mutate(self, **input_):
+        response = self.client.post(
+            '/graphql',
+            {'query': self.mania_inv, 'variables': {'input': input_}},
+            content_type='application/json'
+        )
+        return response.json()
+
+    def test_mutation_queries(self):
+        relations = {
+            'investigator': str(self.investigator.uuid),
+            'mania': str(self.mania.uuid),
+        }
+        res = self.mutate(method='CREATE', duration=2, **relations)
+        uuid = res['data']['maniaInvMutate']['maniaInv']['uuid']
+        # one existence check for both relations and the insert
+        assert res['extensions']['queries'] == 2
+        res = self.mutate(method='UPDATE', uuid=uuid, duration=3, **relations)
+        assert res['data']['maniaInvMutate']['maniaInv']['duration'] == 3
+        assert res['extensions']['queries'] == 3
+        # relations left out of an update are not touched
+        res = self.mutate(method='UPDATE', uuid=uuid, duration=4)
+        assert res['extensions']['queries'] == 2
+        mania_inv = ManiaInvestigator.objects.get(uuid=uuid)
+        assert mania_inv.mania_id == self.mania.uuid
+        assert mania_inv.duration == 4
+
+    def test_missing_relation(self):
+        before = ManiaInvestigator.objects.count()
+        res = self.mutate(
+            method='CREATE',
+            investigator=str(self.investigator.uuid),
+            mania='00000000-0000-0000-0000-000000000000'
+        )
+        assert 'Mania 00000000-0000-0000-0000-000000000000 does not exist' \
+            in res['errors'][0]['message']
+        assert ManiaInvestigator.objects.count() == before
+
+
+class QueryCostTest(SimpleTestCase):
+    """GraphQL query cost analysis tests."""
+
+    def score(self, query, **kwargs):
+        return check_query_cost(parse(query), **kwargs)
+
+    def test_connection_multiplier(self):
+        query = """
+        query ($amount: Int) {
+            allInvestigators(first: $amount) {
+                edges { node { name occupation { title } } }
+            }
+        }
+        """
+        # connection + page * (edges + node + occupation)
+        assert self.score(query, variables={'amount': 10}).cost == 31
+        assert self.score(query, default_page_size=100).cost == 301
+        assert self.score(query).depth == 5
+
+    def test_fragments_and_introspection(self):
+        query = """
+        { allItems { edges { node { ...Item } } } __schema { types { name } } }
+        fragment Item on ItemNode { title }
+        """
+        score = self.score(query, default_page_size=50)
+        assert score.cost == 101
+        assert score.depth == 4
+
+    def test_budget(self):
+        query = """
+        {
+            allInvestigators {
+                edges { node { inventorySet { edges { node { uuid } } } } }
+            }
+        }
+        """
+        with self.assertRaises(QueryCostError):
+            self.score(query, max_cost=5000)
+        with self.assertRaises(QueryCostError):
+            self.score(query, max_depth=5)
+        narrowed = query.replace('inventorySet', 'inventorySet(first: 5)')
+        assert self.score(narrowed, max_cost=5000, max_depth=7).cost == 1301
+
+
+class PersistedQueriesTest(TestCase):
+    """Persisted graphql queries and document cache tests."""
+    fixtures = ['core/skills.json']
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.settings = override_settings(
+            GRAPHQL_PERSISTED_QUERIES=path.join(
+                self.directory.name, 'queries.json'))
+        self.settings.enable()
+        call_command(
+            'register_queries', 'creator.tests.graphql.queries',
+            stdout=StringIO())
+
+    def tearDown(self):
+        self.settings.disable()
+        self.directory.cleanup()
+
+    def graphql(self, data):
+        return self.client.post(
+            '/graphql', data, content_type='application/json')
+
+    def test_query_by_hash(self):
+        from creator.tests.graphql.queries import all_skills
+        persisted = {'persistedQuery': {
+            'version': 1, 'sha256Hash': query_hash(all_skills)}}
+        response = self.graphql({'extensions': persisted})
+        assert response.status_code == 200
+        assert response.json()['data']['allSkills']['edges']
+        unknown = {'persistedQuery': {'version': 1, 'sha256Hash': 'f00'}}
+        response = self.graphql({'extensions': unknown})
+        assert response.status_code == 400
+        assert response.json()['errors'][0]['message'] == \
+            'PersistedQueryNotFound'
+
+    def test_persisted_queries_only(self):
+        from creator.tests.graphql.queries import all_skills
+        with override_settings(GRAPHQL_PERSISTED_QUERIES_ONLY=True):
+            assert self.graphql({'query': all_skills}).status_code == 200
+            response = self.graphql({'query': '{ allSkills { edges { node { title } } } }'})
+            assert response.status_code == 400
+
+    def test_document_cache(self):
+        backend = LRUCachedBackend(CostAnalysisBackend(), maxsize=2)
+        first = backend.document_from_string(schema, '{ allSkills { edges { node { uuid } } } }')
+        again = backend.document_from_string(schema, '{ allSkills { edges { node { uuid } } } }')
+        assert first is again
+        assert (backend.hits, backend.misses) == (1, 1)
+        backend.document_from_string(schema, '{ allItems { edges { node { uuid } } } }')
+        backend.document_from_string(schema, '{ allSpells { edges { node { uuid } } } }')
+        # least recently used evicted
+        assert len(backend.documents) == 2
+        assert backend.document_from_string(
+            schema, '{ allSkills { edges { node { uuid } } } }') is not first
+        invalid = backend.document_from_string(schema, '{ allSkills { nope } }')
+        assert invalid.execute().invalid
+
+
+class SQLitePragmasTest(TestCase):
+    """SQLite tuning applied on new connections."""
+
+    def pragma(self, name):
+        with connection.cursor() as cursor:
+            cursor.execute(f'PRAGMA {name}')
+            return cursor.fetchone()[0]
+
+    def test_pragmas(self):
+        cache_size = self.pragma('cache_size')
+        with override_settings(SQLITE_PRAGMAS={'cache_size': -1024}):
+            apply_sqlite_pragmas(sender=None, connection=connection)
+            assert self.pragma('cache_size') == -1024
+        with override_settings(SQLITE_PRAGMAS={'cache_size': cache_size}):
+            apply_sqlite_pragmas(sender=None, connection=connection)
+        assert self.pragma('cache_size') == cache_size
+
+
+class CatalogTest(TestCase):
+    """Reference data cache tests."""
+    fixtures = CORE_FIXTURES
+
+    def test_catalog_loaded_once(self):
+        catalog.invalidate()
+        loaded = catalog.get_catalog()
+        with self.assertNumQueries(0):
+            assert catalog.get_catalog() is loaded
+        assert loaded.skills_by_era['1920']
+        assert loaded.items_by_subcategory[(3, 'Handguns')]
+
+    def test_catalog_invalidated_on_save(self):
+        loaded = catalog.get_catalog()
+        skill = Skills.objects.first()
+        skill.base_value += 1
+        skill.save()
+        reloaded = catalog.get_catalog()
+        assert reloaded is not loaded
+        assert reloaded.version > loaded.version
+
+    def test_catalog_follows_shared_version(self):
+        loaded = catalog.get_catalog()
+        assert catalog.get_catalog() is loaded
+        # a write of another process bumps the shared version only
+        cache.bump()
+        assert catalog.get_catalog() is not loaded
+
+    def test_skill_template(self):
+        template = catalog.get_catalog().skill_templates['1920']
+        sheet = template.new_sheet()
+        assert 'Science(Biology)' in template.categories['Science']
+        assert 'Science' not in sheet
+        assert sheet['Science(Mathematics)'] == {
+            'base_value': 10, 'value': 10}
+        # sheets are independent copies
+        sheet['Dodge']['value'] = 50
+        assert template.new_sheet()['Dodge']['value'] == 0
+
+
+class SearchTest(TestCase):
+    """Catalog search index tests."""
+    fixtures = CORE_FIXTURES
+
+    def setUp(self):
+        # the memory index outlives the rolled back test data.
+        search.invalidate()
+        self.addCleanup(search.invalidate)
+
+    def test_prefix_search_ranks_titles(self):
+        hits = search.search('revol')
+        assert hits
+        assert all(hit.model == 'items' for hit in hits)
+        assert all('revolver' in hit.title.lower() for hit in hits)
+        hits = search.search('first ai')
+        assert hits[0].title in ('First Aid', 'Complete First Aid Kit')
+        assert not search.search('xyzzy')
+
+    def test_models_filter(self):
+        hits = search.search('acc', ['skills'])
+        assert hits
+        assert {hit.model for hit in hits} == {'skills'}
+
+    def test_index_follows_saves(self):
+        index = search.get_index()
+        mania = Mania.objects.create(title='Zzyzxomania', description='x')
+        assert [hit.uuid for hit in search.search('zzyzx')] == [str(mania.uuid)]
+        mania.delete()
+        assert not search.search('zzyzx')
+        # updated in place, the versions of its own writes don't rebuild it
+        assert search.get_index() is index
+
+    def test_index_follows_other_processes(self):
+        index = search.get_index()
+        # inserted without signals, then the shared version bumped, as by
+        # the write of another process
+        Mania.objects.bulk_create(
+            [Mania(title='Zzyzxomania', description='x')])
+        assert not search.search('zzyzx')
+        cache.bump()
+        assert search.search('zzyzx')
+        assert search.get_index() is not index
+        # a local save after the write of another process rebuilds it too
+        index = search.get_index()
+        Mania.objects.bulk_create(
+            [Mania(title='Zzyzxophobia', description='x')])
+        cache.bump()
+        Mania.objects.create(title='Qwxyzmania', description='x')
+        assert len(search.search('zzyzx')) == 2
+        assert search.get_index() is not index
+
+    def test_search_view(self):
+        response = self.client.get(
+            reverse('search'), {'q': 'revolver', 'page_size': 2})
+        res = response.json()
+        assert res['count'] > 2
+        assert res['pages'] == -(-res['count'] // 2)
+        assert len(res['results']) == 2
+        assert res['results'][0]['record']['title'] == \
+            res['results'][0]['title']
+
+    def test_search_view_page_size(self):
+        url = reverse('search')
+        assert self.client.get(
+            url, {'q': 'a', 'page_size': 'x'}).status_code == 400
+        res = self.client.get(url, {'q': 'a', 'page_size': 100000}).json()
+        assert res['count'] > 100
+        assert len(res['results']) == 100
+        res = self.client.get(url, {'q': 'revolver', 'page_size': -1}).json()
+        assert len(res['results']) == 1
+
+    @override_settings(SEARCH_BACKEND='database')
+    def test_database_index(self):
+        index = search.rebuild()
+        search.invalidate()
+        assert search.get_index().__class__ is index.__class__
+        expected = {hit.uuid for hit in search.search('first aid')}
+        assert expected
+        with override_settings(SEARCH_BACKEND='memory'):
+            search.invalidate()
+            assert {hit.uuid for hit in search.search('first aid')} == \
+                expected
+        search.invalidate()
+        mania = Mania.objects.create(title='Zzyzxomania', description='x')
+        assert [hit.uuid for hit in search.search('zzyzx')] == [str(mania.uuid)]
+
+    def test_database_index_vendor_methods(self):
+        class PartialIndex(DatabaseIndex):
+            def create(self):
+                pass
+
+        # the missing methods fail on instantiation, not on the first search
+        with self.assertRaises(TypeError):
+            PartialIndex()
+
+
+class AutocompleteTest(TestCase):
+    """Catalog titles autocomplete tests."""
+    fixtures = CORE_FIXTURES
+
+    def setUp(self):
+        autocomplete.invalidate()
+        self.addCleanup(autocomplete.invalidate)
+
+    def test_completions(self):
+        completions = Completions([
+            ('1', '.45 Revolver'), ('2', 'Revolving Door'), ('3', 'Rope')])
+        assert completions.complete('revol', 10) == [
+            ('2', 'Revolving Door'), ('1', '.45 Revolver')]
+        assert completions.complete('re', 1) == [('2', 'Revolving Door')]
+        assert completions.complete('', 10)[0] == ('1', '.45 Revolver')
+
+    def test_complete_loaded_once(self):
+        autocomplete.get_completions()
+        with self.assertNumQueries(0):
+            results = autocomplete.complete('items', 'revol', limit=3)
+        assert len(results) == 3
+        assert all('Revolver' in title for _, title in results)
+        eras = set(Item.objects.filter(
+            uuid__in=[uuid for uuid, _ in autocomplete.complete(
+                'items', 'r', era='1920', limit=50)]
+        ).values_list('era', flat=True))
+        assert eras == {'1920'}
+
+    def test_invalidated_on_save(self):
+        assert not autocomplete.complete('manias', 'zzyzx')
+        Mania.objects.create(title='Zzyzxomania', description='x')
+        assert autocomplete.complete('manias', 'zzyzx')[0][1] == 'Zzyzxomania'
+
+    def test_follows_other_processes(self):
+        autocomplete.get_completions()
+        Mania.objects.bulk_create(
+            [Mania(title='Zzyzxomania', description='x')])
+        assert not autocomplete.complete('manias', 'zzyzx')
+        cache.bump()
+        assert autocomplete.complete('manias', 'zzyzx')
+
+    def test_autocomplete_view(self):
+        url = reverse('autocomplete', args=['skills'])
+        res = self.client.get(url, {'q': 'first', 'limit': 5}).json()
+        assert res['query'] == 'first'
+        assert {'First Aid'} == {title for _, title in res['records_title']}
+        assert self.client.get(
+            reverse('autocomplete', args=['investigators'])).status_code == 404
+
+    def test_autocomplete_limit(self):
+        url = reverse('autocomplete', args=['skills'])
+        assert self.client.get(url, {'limit': 'x'}).status_code == 400
+        for limit, expected in (('0', 1), ('-3', 1), ('500', 50)):
+            res = self.client.get(url, {'q': '', 'limit': limit}).json()
+            assert len(res['records_title']) == expected
+
+    def test_autocomplete_era(self):
+        url = reverse('autocomplete', args=['skills'])
+        res = self.client.get(url, {'q': 'first', 'era': '1920'}).json()
+        assert {'First Aid'} == {title for _, title in res['records_title']}
+        assert self.client.get(
+            url, {'q': 'first', 'era': 'victorian'}).status_code == 400
+        assert not autocomplete.complete('skills', 'first', era='victorian')
+
+
+class FacetedSearchTest(TestCase):
+    """Filtered POST search tests."""
+    fixtures = CORE_FIXTURES
+
+    def setUp(self):
+        search.invalidate()
+        self.addCleanup(search.invalidate)
+
+    def test_facets_of_the_matches(self):
+        with self.assertNumQueries(2):
+            res = self.client.post(
+                reverse('search'), {'category': '3', 'page_size': 5}).json()
+        items = res['results']['items']
+        weapons = Item.objects.filter(category=3)
+        assert list(res['results']) == ['items']
+        assert items['count'] == weapons.count()
+        assert items['facets']['category'] == {'3': weapons.count()}
+        assert items['facets']['subcategory']['Handguns'] == weapons.filter(
+            properties__subcategory='Handguns').count()
+        assert len(items['records']) == 5
+
+    def test_filters_apply_to_their_models(self):
+        res = self.client.post(reverse('search'), {
+            'min_price': 1, 'max_price': 10, 'rare': 'false'}).json()
+        assert list(res['results']) == ['items']
+        assert res['count'] == Item.objects.filter(
+            base_price__gte=1, base_price__lte=10, rare=False).count()
+        res = self.client.post(reverse('search'), {'spell_category': 3}).json()
+        assert list(res['results']) == ['spells']
+
+    def test_text_and_filters(self):
+        res = self.client.post(
+            reverse('search'), {'q': 'revolver', 'era': '1920'}).json()
+        items = res['results']['items']
+        assert items['count']
+        assert items['facets']['era'] == {'1920': items['count']}
+        assert all('Revolver' in item['title'] for item in items['records'])
+
+    def test_invalid_filters(self):
+        response = self.client.post(reverse('search'), {'bogus': 1})
+        assert response.status_code == 400
+        response = self.client.post(reverse('search'), {'min_price': 'x'})
+        assert response.status_code == 400
+        response = self.client.post(reverse('search'), {'page': 'x'})
+        assert response.status_code == 400
+        response = self.client.post(reverse('search'), {'page_size': 'x'})
+        assert response.status_code == 400
+
+
+class ModelListTest(TestCase):
+    """Paginated catalog listing tests."""
+    fixtures = CORE_FIXTURES
+
+    def get_page(self, **params):
+        response = self.client.get(
+            reverse('listing', args=['items']), params)
+        return response, loads(response.getvalue())
+
+    def test_keyset_pages(self):
+        response, page = self.get_page(limit=300)
+        assert response['Cache-Control'] == f'max-age={settings.CATALOG_MAX_AGE}'
+        uuids = [uuid for uuid, _ in page['records_title']]
+        while page['next']:
+            _, page = self.get_page(limit=300, after=page['next'])
+            uuids.extend(uuid for uuid, _ in page['records_title'])
+        assert uuids == sorted(
+            str(uuid) for uuid in Item.objects.values_list('uuid', flat=True))
+        item = Item.objects.get(uuid=uuids[0])
+        assert self.get_page(limit=1)[1]['records_title'] == \
+            [[uuids[0], str(item)]]
+
+    def test_invalid_parameters(self):
+        listing = reverse('listing', args=['items'])
+        assert self.client.get(listing, {'limit': 'abc'}).status_code == 400
+        assert self.client.get(listing, {'after': 'abc'}).status_code == 400
+        # sizes out of 1..500 are clamped
+        assert len(self.get_page(limit=-5)[1]['records_title']) == 1
+        assert len(self.get_page(limit=0)[1]['records_title']) == 1
+
+    def test_not_modified(self):
+        response, _ = self.get_page(limit=10)
+        with self.assertNumQueries(0):
+            cached = self.client.get(
+                reverse('listing', args=['items']), {'limit': 10},
+                HTTP_IF_NONE_MATCH=response['ETag'])
+        assert cached.status_code == 304
+        item = Item.objects.first()
+        item.save()
+        changed, _ = self.get_page(limit=10)
+        assert changed['ETag'] != response['ETag']
+
+
+class ResponseCacheTest(TestCase):
+    """Versioned response cache of the catalog endpoints."""
+    fixtures = CORE_FIXTURES
+
+    skills_query = '{ allSkills(first: 5) { edges { node { uuid title } } } }'
+    update_skill = """
+    mutation ($uuid: String, $title: String) {
+        skillMutate(input: {method: "UPDATE", uuid: $uuid, title: $title}) {
+            skill { uuid }
+        }
+    }
+    """
+
+    def setUp(self):
+        caches['default'].clear()
+        cache.stats.reset()
+
+    def graphql(self, query, variables=None):
+        return self.client.post(
+            '/graphql', {'query': query, 'variables': variables},
+            content_type='application/json'
+        ).json()
+
+    def test_detail_cached_until_mutated(self):
+        skill = Skills.objects.first()
+        url = reverse('detail', args=[skill.uuid, 'skills'])
+        assert self.client.get(url).json()['record']['title'] == skill.title
+        with self.assertNumQueries(0):
+            assert self.client.get(url).json()['record']['title'] == skill.title
+        assert cache.stats.ratio('detail') == 0.5
+        # updates skip the model signals, the mutation layer bumps
+        self.graphql(self.update_skill, {
+            'uuid': str(skill.uuid), 'title': 'Cached lore'})
+        assert self.client.get(url).json()['record']['title'] == 'Cached lore'
+
+    def test_listing_streamed_uncached(self):
+        listing = reverse('listing', args=['items'])
+        first = self.client.get(listing, {'limit': 5})
+        assert first.streaming
+        again = self.client.get(listing, {'limit': 5})
+        assert again.streaming
+        assert b''.join(again.streaming_content) == \
+            b''.join(first.streaming_content)
+        assert not cache.stats.counts
+        # unchanged pages are revalidated before any query
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                listing, {'limit': 5}, HTTP_IF_NONE_MATCH=first['ETag'])
+        assert response.status_code == 304
+
+    def test_graphql_cached_until_mutated(self):
+        res = self.graphql(self.skills_query)
+        assert 'cached' not in res['extensions']
+        cached = self.graphql(self.skills_query)
+        assert cached['data'] == res['data']
+        assert cached['extensions']['cached'] is True
+        assert cached['extensions']['queries'] == 0
+        node = res['data']['allSkills']['edges'][0]['node']
+        self.graphql(self.update_skill, {
+            'uuid': node['uuid'], 'title': 'Cached lore'})
+        res = self.graphql(self.skills_query)
+        assert 'cached' not in res['extensions']
+        assert res['data']['allSkills']['edges'][0]['node']['title'] == \
+            'Cached lore'
+
+    def test_graphql_cacheable_operations(self):
+        backend = ResultCachedBackend(
+            CostAnalysisBackend(), fields=settings.GRAPHQL_CACHED_FIELDS,
+            types=settings.GRAPHQL_CACHED_TYPES)
+
+        def cacheable(query):
+            document_ast = parse(query)
+            return backend.cacheable(document_ast.definitions[0]) and \
+                backend.reads_cached_types(schema, document_ast)
+        assert cacheable('{ allSkills { edges { node { title } } } __typename }')
+        assert not cacheable(
+            '{ allSkills { edges { node { title } } } allInvestigators { '
+            'edges { node { name } } } }')
+        assert not cacheable(
+            'mutation { tagMutate(input: {}) { tag { uuid } } }')
+        # reverse relations reach the investigators, fragments included.
+        assert not cacheable(
+            '{ allItems { edges { node { inventorySet { edges { node { '
+            'uuid } } } } } } }')
+        assert not cacheable(
+            '{ allOccupations { edges { node { ...occupation } } } } '
+            'fragment occupation on OccupationNode { investigatorSet { '
+            'edges { node { name } } } }')
+
+    def test_graphql_reverse_relation_not_cached(self):
+        user = User.objects.create(pk=1, username='keeper')
+        investigator = RandomInvestigator.build_many(1, user=user)[0]
+        query = (
+            '{ allOccupations(first: 5, title: "%s") { edges { node { '
+            'investigatorSet(first: 5) { edges { node { name } } } } } } }'
+        ) % investigator.occupation.title
+
+        def names(res):
+            return [
+                edge['node']['name']
+                for occupation in res['data']['allOccupations']['edges']
+                for edge in occupation['node']['investigatorSet']['edges']
+            ]
+        assert investigator.name in names(self.graphql(query))
+        investigator.name = 'Renamed investigator'
+        investigator.save()
+        res = self.graphql(query)
+        assert 'cached' not in res['extensions']
+        assert 'Renamed investigator' in names(res)
+
+    def test_disabled(self):
+        item = Item.objects.first()
+        url = reverse('detail', args=[item.uuid, 'items'])
+        with override_settings(CATALOG_CACHE=''):
+            self.client.get(url)
+            with self.assertNumQueries(1):
+                self.client.get(url)
+        assert cache.stats.ratio() == 0.0
+
+
+class AllocatorTest(SimpleTestCase):
+    """Vectorized skill point allocation tests."""
+
+    def test_allocate_respects_cap_and_points(self):
+        values = np.array([[5, 20, 85, 0], [40, 40, 40, 40]])
+        weights = np.array([[1, 1, 1, 0], [1, 2, 1, 1]])
+        increments = allocate(SKILL_CAP - values, weights, [150, 60], rng=3)
+        assert (values + increments <= SKILL_CAP).all()
+        assert increments[0, 3] == 0
+        assert increments.sum(axis=1).tolist() == [150, 60]
+
+    def test_allocate_drops_what_does_not_fit(self):
+        increments = allocate([[4, 5]], [[1, 1]], [100], rng=1)
+        assert increments.tolist() == [[4, 5]]
+
+    def test_allocate_seeded(self):
+        capacity = np.full((3, 40), SKILL_CAP)
+        weights = np.ones((3, 40))
+        first = allocate(capacity, weights, [300, 200, 100], rng=7)
+        second = allocate(capacity, weights, [300, 200, 100], rng=7)
+        assert (first == second).all()
+
+
+class NamesTest(SimpleTestCase):
+    """Name sampler tests."""
+
+    def test_sample_names(self):
+        names = sample_names(50, 'female', "20'", rng=Random(1))
+        first_names = names_sampler.first_names('female', "20'")
+        surnames = names_sampler.surnames()
+        assert len(names) == 50
+        for name in names:
+            first_name, surname = name.split(' ', 1)
+            assert first_name in first_names
+            assert surname in surnames
+
+    def test_sample_names_weighted(self):
+        names = sample_names(
+            20, 'male', "00'", amount_of_names=2, amount_of_surnames=2,
+            rng=Random(3), weighted=True)
+        again = sample_names(
+            20, 'male', "00'", amount_of_names=2, amount_of_surnames=2,
+            rng=Random(3), weighted=True)
+        assert names == again
+        assert all(len(name.split(' ')) >= 4 for name in names)
@@ -15,6 +15,11 @@ urlpatterns = [
         views.GenericViews.generic_model_list,
         name="listing"
     ),
+    path(
+        'autocomplete/<str:model_type>',
+        views.GenericViews.autocomplete,
+        name='autocomplete'
+    ),
     path(
         'search',
         views.GenericViews.generic_search,
@@ -65,6 +70,11 @@ urlpatterns = [
         views.GeneralInvestigatorViews.get_investigators_data,
         name="inv_data"
     ),
+    path(
+        '<slug:inv>/sheet',
+        views.GeneralInvestigatorViews.get_investigators_sheet,
+        name="inv_sheet"
+    ),
     path(
         '<slug:inv>/info',
         views.GeneralInvestigatorViews.investigators_basic_info,
@@ -1,26 +1,47 @@
 from ast import literal_eval as leval
 from json import dumps, loads
-from random import choice
+from random import Random
+from uuid import UUID
 
-from django.http import HttpResponse, JsonResponse
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.db.models import Q
 from django.shortcuts import redirect, render
 from django.template.loader import render_to_string
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import etag
 
+from coc import cache
+from creator import catalog, search
 from creator.constants import SILOUETTES as silouettes
-from creator.constants import ITEM_CATEGORIES as item_categories, ITEM_SUBCATEGORIES as item_subcategories
+from creator.constants import ITEM_CATEGORIES as item_categories
 from creator.helpers.investigator import generate_full_half_fifth_values
+from creator.helpers.upserts import add_once, stack
 from creator.helpers.views_helper import ALL_MODELS as all_models
-from creator.helpers.views_helper import (gear_sanitizer,
+from creator.helpers.views_helper import GEAR_CATEGORIES, LISTING_TITLES
+from creator.helpers.views_helper import (arcane_sanitizer, character_sheet,
+                                          era_param, gear_sanitizer,
                                           generate_attributes_form,
                                           generate_basic_info_form,
                                           generate_derivative_attributes_form,
-                                          skills_sanitizer, skills_sum)
+                                          int_param, inventory_prefetch,
+                                          listing_rows,
+                                          manias_prefetch,
+                                          manias_phobias_sanitizer,
+                                          phobias_prefetch, seed_param,
+                                          sheet_queryset,
+                                          skills_sanitizer, skills_sum,
+                                          spells_prefetch, stream_listing,
+                                          weapons_sanitizer)
 from creator.models import (Inventory, Investigator, Item, ManiaInvestigator,
                             Occupation, PhobiaInvestigator, Portrait, Skills,
                             SpellInvestigator, Mania, Phobia, Spell)
 from creator.random_inv import (RandomInvestigator, base_skills_generator,
-                                free_point_assigner, occ_point_assigner)
+                                free_point_assigner, new_seed,
+                                occ_point_assigner)
+from creator.search import autocomplete, filters
 
 # Create your views here.
 
@@ -43,6 +64,15 @@ class GeneralInvestigatorViews:
         )
 
 
+    def get_investigators_sheet(request, inv):
+        '''Retrieve the whole character sheet of an investigator in a
+        single response.'''
+        investigator = sheet_queryset().get(
+            uuid=inv
+        )
+        return JsonResponse(character_sheet(investigator), status=200)
+
+
     def investigators_basic_info(request, inv):
         '''Generate investigator basic information form.'''
         investigator = generate_basic_info_form(
@@ -85,7 +115,13 @@ class GeneralInvestigatorViews:
 
 
     def generate_random_investigator(request):
-        rand = RandomInvestigator()
+        '''Build a random investigator, an optional `seed` GET parameter
+        reproduces a previous build.'''
+        try:
+            seed = seed_param(request.GET.get('seed'))
+        except ValidationError as error:
+            return JsonResponse({'errors': error.messages}, status=400)
+        rand = RandomInvestigator(seed=seed)
         rand.build()
 
         return redirect(
@@ -120,6 +156,8 @@ class AttributesInvestigatorViews:
             inv.update(**{attr: attr_value})
             attributes = {attr: generate_full_half_fifth_values(attr_value)}
             inv = inv.first()
+            if inv.refresh_derived_stats():
+                inv.save(update_fields=Investigator.DERIVED_FIELDS)
             attributes['MOV'] = [inv.move]
             attributes["BUILD"] = list(inv.build)
             return JsonResponse(attributes, status=200)
@@ -204,23 +242,26 @@ class SkillsInvestigatorViews:
         investigator = Investigator.objects.get(
             uuid=inv
         )
-        skills = list(Skills.objects.all())
-        base_skills_generator(skills, investigator)
+        base_skills_generator(investigator)
         skills_sanitized = skills_sanitizer(investigator)
         res = {'skills': skills_sanitized}
         return JsonResponse(res, status=200)
 
 
     def investigators_skills_shuffle(request, inv):
+        try:
+            seed = seed_param(request.GET.get('seed'))
+        except ValidationError as error:
+            return JsonResponse({'errors': error.messages}, status=400)
         investigator = Investigator.objects.get(
             uuid=inv
         )
-        skills = list(Skills.objects.all())
-        base_skills_generator(skills, investigator)
+        rng = Random(new_seed(seed))
+        base_skills_generator(investigator)
         proff_points = investigator.occupation_skill_points
-        occ_point_assigner(proff_points, investigator)
+        occ_point_assigner(proff_points, investigator, rng=rng)
         # Assign free skill points
-        free_point_assigner(investigator.free_skill_points, investigator)
+        free_point_assigner(investigator.free_skill_points, investigator, rng=rng)
         skills = sorted(investigator.skills)
         skills_sanitized = []
         for skill in skills:
@@ -241,29 +282,24 @@ class ItemsInvestigatorViews:
 
     def get_investigators_weapons(request, inv):
         '''Retrieve investigators weapons.'''
-        investigator = Investigator.objects.get(
+        investigator = Investigator.objects.prefetch_related(
+            inventory_prefetch(item__category=item_categories[2][0])
+        ).get(
             uuid=inv
         )
-        weapons = Inventory.objects.filter(
-            investigator=investigator,
-            item__category=3)
-        weapons_results = []
-        for weapon in weapons:
-            w_dict = weapon.properties
-            w_dict['skill_value'] = generate_full_half_fifth_values(
-                investigator.skills[weapon.item.properties['skill']]['value']
-            )
-            w_dict['uuid'] = weapon.uuid
-            weapons_results.append(w_dict)
-        return JsonResponse({'weapons': weapons_results}, status=200)
+        weapons = weapons_sanitizer(
+            investigator, investigator.inventory_set.all())
+        return JsonResponse(weapons, status=200)
 
 
     def get_investigators_gear(request, inv):
         '''Retrieve investigators gear.'''
-        investigator = Investigator.objects.get(
+        investigator = Investigator.objects.prefetch_related(
+            inventory_prefetch(item__category__in=GEAR_CATEGORIES)
+        ).get(
             uuid=inv
         )
-        gear = gear_sanitizer(investigator)
+        gear = gear_sanitizer(investigator, investigator.inventory_set.all())
         return JsonResponse({'gear': gear}, status=200)
 
 
@@ -296,35 +332,40 @@ class ItemsInvestigatorViews:
             sanitize_data = {
                 k: data[k][0] for k in data.keys()
             }
-            inv = Investigator.objects.get(uuid=sanitize_data['inv'])
-            item = all_models['items'].objects.get(uuid=sanitize_data['item'])
+            uuid = UUID(sanitize_data['item'])
+            item = catalog.get_catalog().items_by_uuid.get(uuid)
+            if item is None:
+                # created after the catalog was loaded
+                item = Item.objects.filter(uuid=uuid).first()
+                if item is None:
+                    return JsonResponse({'response': 'Not found'}, status=404)
+            weapon = item.category == item_categories[2][0]
             props = item.properties.copy()
             props['title'] = item.title
             props['era'] = item.era
             props['price'] = item.base_price
             props['rare'] = item.rare
             props['description'] = item.description
-            if item.category == item_categories[2][0]:
+            if weapon:
                 props['ammo'] = item.properties["bullets_in_gun_mag"]
-            inventory = Inventory.objects.filter(investigator=inv, item=item, properties=props).first()
-            #checks if the investigator already has the item, if not it adds it
-            if inventory is None:
-                inventory = Inventory(
-                    investigator=inv,
-                    item=item,
-                    properties=props
-                    )
-                inventory.save()
-                if item.category == item_categories[2][0]:
+            # adds the item or increases its stock if the investigator has
+            # it, the investigator skills are only read for the weapons.
+            inv, inventory, created = stack(
+                Inventory,
+                Investigator.objects.filter(uuid=sanitize_data['inv']),
+                read_owner=weapon,
+                investigator_id=sanitize_data['inv'],
+                item=item,
+                properties=props
+            )
+            if created:
+                if weapon:
                     props['skill_value'] = generate_full_half_fifth_values(
                     inv.skills[item.properties['skill']]['value'])
                 return JsonResponse(
                     {'item': {'uuid': inventory.uuid, 'properties': props, 'stock': inventory.stock },
                      'category': item.category}, status=201)
             else:
-                stock = inventory.stock
-                inventory.stock = stock + 1
-                inventory.save()
                 return JsonResponse({'response': 'Stock Increased'}, status=200)
         return JsonResponse({'response': 'Unauthorized'}, status=401)
 
@@ -333,112 +374,25 @@ class BackstoryInvestigatorViews:
 
     def get_investigators_manias_and_phobias(request, inv):
         '''Retrieve investigators manias and phobias.'''
-        investigator = Investigator.objects.get(
+        investigator = Investigator.objects.prefetch_related(
+            manias_prefetch(), phobias_prefetch()
+        ).get(
             uuid=inv
         )
-        manias = ManiaInvestigator.objects.filter(
-            investigator=investigator
-        )
-        phobias = PhobiaInvestigator.objects.filter(
-            investigator=investigator
-        )
-        phobias = [[phobia.phobia.uuid, phobia.phobia.title] for phobia in phobias]
-        manias = [[mania.mania.uuid, mania.mania.title] for mania in manias]
-        res = {
-            'manias': manias,
-            'phobias': phobias
-        }
+        res = manias_phobias_sanitizer(investigator)
         return JsonResponse(res, status=200)
 
 
     def get_investigators_arcane(request, inv):
         '''Retrieve arcane artifacts and spells from investigator.'''
-        investigator = Investigator.objects.get(
+        # a single inventory query, split by subcategory in memory
+        investigator = Investigator.objects.prefetch_related(
+            inventory_prefetch(item__category=item_categories[0][0]),
+            spells_prefetch()
+        ).get(
             uuid=inv
         )
-        # Retrieve arcane
-        artifacts = Inventory.objects.filter(
-            investigator=investigator,
-            item__category=item_categories[0][0],
-            properties__subcategory=item_subcategories['artifacts']
-
-        )
-        tomes = Inventory.objects.filter(
-            investigator=investigator, 
-            item__category=item_categories[0][0],
-            properties__subcategory=item_subcategories['tomes']
-            )
-        occult_books= Inventory.objects.filter(
-            investigator=investigator, 
-            item__category=item_categories[0][0],
-            properties__subcategory=item_subcategories['occult_books']
-            )
-        spells = SpellInvestigator.objects.filter(
-            investigator=investigator
-        )
-        spells = [
-            {
-                'name': spell.spell.name,
-                'uuid': spell.spell.uuid,
-                'cost': spell.spell.cost,
-                'casting_time': spell.spell.casting_time,
-                'description': spell.spell.description,
-                'deeper_magic': spell.spell.deeper_magic,
-                'alternative_names': spell.spell.alternative_names
-            }
-            for spell in spells
-        ]
-        artifacts = [
-            {
-                'uuid': artifact.uuid,
-                'properties':{
-                    'title': artifact.properties['title'],
-                    'description': artifact.properties['description'],
-                    'used_by': artifact.properties['used_by'],
-                    'subcategory': artifact.properties['subcategory']
-                }
-            }
-            for artifact in artifacts
-        ]
-        tomes = [
-            {
-                'uuid': tome.uuid,
-                'properties': {
-                    'title': tome.properties['title'],
-                    'author': tome.properties['author'],
-                    'mythos_rating': tome.properties['mythos_rating'],
-                    'cthulhu_mythos_initial': tome.properties['cthulhu_mythos_initial'],
-                    'cthulhu_mythos_full': tome.properties['cthulhu_mythos_full'],
-                    'language': tome.properties['language'],
-                    'sanity': tome.properties['sanity'],
-                    'subheading': tome.properties['subheading'],
-                    'subcategory': tome.properties['subcategory']
-                }
-            }
-            for tome in tomes
-        ]
-        occult_books = [
-            {
-                'uuid': occult_book.uuid,
-                'properties': {
-                    'title': occult_book.properties['title'],
-                    'subheading': occult_book.properties['subheading'],
-                    'description': occult_book.properties['description'],
-                    'sanity': occult_book.properties['sanity'],
-                    'occult': occult_book.properties['occult'],
-                    'subheading': occult_book.properties['subheading'],
-                    'subcategory': occult_book.properties['subcategory']
-                }
-            }
-            for occult_book in occult_books
-        ]
-        res = {
-            'artifacts': artifacts,
-            'tomes': tomes,
-            'occult_books': occult_books,
-            'spells': spells,
-            'encounters': investigator.encounters_with_strange_entities
-        }
+        res = arcane_sanitizer(investigator, investigator.inventory_set.all())
         return JsonResponse(res, status=200)
 
 
@@ -485,16 +439,14 @@ class BackstoryInvestigatorViews:
             sanitize_data = {
                 k: data[k][0] for k in data.keys()
             }
-            inv_mania = ManiaInvestigator()
-            inv = Investigator.objects.get(uuid=sanitize_data['inv'])
-            mania = all_models['manias'].objects.get(uuid=sanitize_data['mania'])
-            mania_query = ManiaInvestigator.objects.filter(investigator=inv,mania=mania)
-            #checks if the investigator already has the mania, if not it adds it
-            if not mania_query.exists():
-                inv_mania.mania = mania
-                inv_mania.investigator = inv
-                inv_mania.save()
-                return JsonResponse({'title': mania.__str__()}, status=201)
+            inv_mania, created = add_once(
+                ManiaInvestigator,
+                select_related=('mania',),
+                investigator_id=sanitize_data['inv'],
+                mania_id=sanitize_data['mania']
+            )
+            if created:
+                return JsonResponse({'title': inv_mania.mania.__str__()}, status=201)
             else:
                 return JsonResponse({'response': 'Already in use'}, status=304)
         return JsonResponse({'response': 'Unauthorized'}, status=401)
@@ -513,16 +465,14 @@ class BackstoryInvestigatorViews:
             sanitize_data = {
                 k: data[k][0] for k in data.keys()
             }
-            inv_phobia = PhobiaInvestigator()
-            inv = Investigator.objects.get(uuid=sanitize_data['inv'])
-            phobia = all_models['phobias'].objects.get(uuid=sanitize_data['phobia'])
-            phobia_query = PhobiaInvestigator.objects.filter(investigator=inv,phobia=phobia)
-            #checks if the investigator already has the phobia, if not it adds it
-            if not phobia_query.exists():
-                inv_phobia.phobia = phobia
-                inv_phobia.investigator = inv
-                inv_phobia.save()
-                return JsonResponse({'title': phobia.__str__()}, status=201)
+            inv_phobia, created = add_once(
+                PhobiaInvestigator,
+                select_related=('phobia',),
+                investigator_id=sanitize_data['inv'],
+                phobia_id=sanitize_data['phobia']
+            )
+            if created:
+                return JsonResponse({'title': inv_phobia.phobia.__str__()}, status=201)
             else:
                 return JsonResponse({'response': 'Already in use'}, status=304)
         return JsonResponse({'response': 'Unauthorized'}, status=401)
@@ -541,16 +491,14 @@ class BackstoryInvestigatorViews:
             sanitize_data = {
                 k: data[k][0] for k in data.keys()
             }
-            inv_spell = SpellInvestigator()
-            inv = Investigator.objects.get(uuid=sanitize_data['inv'])
-            spell = all_models['spells'].objects.get(uuid=sanitize_data['spell'])
-            spell_query = SpellInvestigator.objects.filter(investigator=inv,spell=spell)
-            #checks if the investigator already has the spell, if not it adds it
-            if not spell_query.exists():
-                inv_spell.spell = spell
-                inv_spell.investigator = inv
-                inv_spell.save()
-                return JsonResponse({'spell': spell.safe_dict()}, status=201)
+            inv_spell, created = add_once(
+                SpellInvestigator,
+                select_related=('spell',),
+                investigator_id=sanitize_data['inv'],
+                spell_id=sanitize_data['spell']
+            )
+            if created:
+                return JsonResponse({'spell': inv_spell.spell.safe_dict()}, status=201)
             else:
                 return JsonResponse({'response': 'Already in use'}, status=304)
         return JsonResponse({'response': 'Unauthorized'}, status=401)
@@ -566,26 +514,50 @@ class BackstoryInvestigatorViews:
 class GenericViews:
     '''Agnostic model views.'''
 
-    common_models = {
-        # if tuples second element is unset will look on key 'title'
-        Item: [],
-        Skills: [],
-        Occupation: [],
-        Mania: [],
-        Phobia: [],
-        Spell: ['name', 'alternative_names']
-    }
-
+    @cache_control(max_age=settings.CATALOG_MAX_AGE)
+    @etag(lambda request, model_type: cache.etag())
     def generic_model_list(request, model_type):
+        '''Titles of the model records, a page of ?limit= (100, 500 at most)
+        after the ?after= uuid, the `next` one of the previous page. The
+        pages are tagged with the catalog version, clients revalidating an
+        unchanged page get a 304 before any query. They are streamed, the
+        response cache would read them whole.'''
+        if model_type not in LISTING_TITLES:
+            return JsonResponse({'response': 'Not found'}, status=404)
+        try:
+            limit = int_param(request.GET.get('limit'), 100, maximum=500)
+            rows = listing_rows(model_type, after=request.GET.get('after'))
+        except ValidationError as error:
+            return JsonResponse({'errors': error.messages}, status=400)
+        return StreamingHttpResponse(
+            stream_listing(model_type, rows, limit),
+            content_type='application/json'
+        )
 
+    def autocomplete(request, model_type):
+        '''Up to ?limit= (10, 50 at most) records of the model whose title
+        starts with ?q=, of the ?era= if given. The query is returned along so
+        the client can drop the answers of the queries it typed past.'''
+        if model_type not in search.SEARCHABLE:
+            return JsonResponse({'response': 'Not found'}, status=404)
+        query = request.GET.get('q', '')
+        try:
+            limit = int_param(request.GET.get('limit'), 10, maximum=50)
+            era = era_param(request.GET.get('era'))
+        except ValidationError as error:
+            return JsonResponse({'errors': error.messages}, status=400)
+        completions = autocomplete.complete(
+            model_type, query, era=era, limit=limit)
         res = {
             'model_name': model_type,
-            'records_title': [[model.uuid, model.__str__()] for model in all_models[model_type].objects.all()],
+            'query': query,
+            'records_title': [[uuid, title] for uuid, title in completions],
         }
-
         return JsonResponse(res, status=200)
 
+    @cache.cache_response('detail')
     def record_detail(request, id, model_name):
+        '''Fields of a catalog record.'''
         record = all_models[model_name].objects.get(uuid=id)
         rec = {
             'record': record.safe_dict()
@@ -600,33 +572,75 @@ class GenericViews:
             a defined set of models and capable of accepting filters.
 
         '''
-        if request.POST:
-            # apply filters
-            data_unclean = dict(request.POST)
+        if request.method == 'POST':
+            # faceted search, filters are form fields, see search.filters.
+            params = dict(request.POST.lists())
+            params.pop('csrfmiddlewaretoken', None)
+            query = params.pop('q', [''])[0]
+            models = [
+                model for model in params.pop('models', [])
+                if model in search.SEARCHABLE
+            ]
+            try:
+                page = int_param(params.pop('page', [None])[0], 1)
+                page_size = int_param(
+                    params.pop('page_size', [None])[0], 20, maximum=100)
+            except ValidationError as error:
+                return JsonResponse({'errors': error.messages}, status=400)
+            uuids = None
+            if query.strip():
+                # restricted to the full text matches
+                uuids = {}
+                for hit in search.search(query, models or None):
+                    uuids.setdefault(hit.model, []).append(hit.uuid)
+            try:
+                results = filters.search(
+                    params, models, uuids,
+                    offset=(page - 1) * page_size, limit=page_size
+                )
+            except ValidationError as error:
+                return JsonResponse({'errors': error.messages}, status=400)
             res = {
-            "results": []
+                'count': sum(result['count'] for result in results.values()),
+                'page': page,
+                'results': results
             }
             return JsonResponse(res, status=200)
         else:
-            # simple search
-            query = str(request.GET.get('q'))
-            unclean_results = []
-            for model in GenericViews.common_models:
-                especial_keys = GenericViews.common_models[model]
-                if especial_keys:
-                    for key in especial_keys:
-                        unclean_results.extend(
-                            model.objects.filter(
-                                **{f'{key}__icontains': query},
-                            )
-                        )
-                else:
-                    unclean_results.extend(
-                        list(model.objects.filter(
-                            title__icontains=query 
-                        ))
-                    )
-            sanitized_results = {
-                str(res.uuid): res.safe_dict() for res in unclean_results
+            # ranked search, ?q=words&models=items,spells&page=1&page_size=20
+            models = request.GET.get('models')
+            if models:
+                models = [
+                    model for model in models.split(',')
+                    if model in search.SEARCHABLE
+                ]
+            try:
+                page_size = int_param(
+                    request.GET.get('page_size'), 20, maximum=100)
+            except ValidationError as error:
+                return JsonResponse({'errors': error.messages}, status=400)
+            hits = search.search(request.GET.get('q', ''), models or None)
+            page = Paginator(hits, page_size).get_page(
+                request.GET.get('page'))
+            # only the records of the page are read, one query per model.
+            records = {}
+            for model in {hit.model for hit in page}:
+                uuids = [hit.uuid for hit in page if hit.model == model]
+                records.update({
+                    str(uuid): record.safe_dict() for uuid, record in
+                    all_models[model].objects.in_bulk(uuids).items()
+                })
+            res = {
+                'count': page.paginator.count,
+                'page': page.number,
+                'pages': page.paginator.num_pages,
+                'results': [
+                    {
+                        'uuid': hit.uuid,
+                        'model': hit.model,
+                        'title': hit.title,
+                        'record': records[hit.uuid]
+                    } for hit in page if hit.uuid in records
+                ]
             }
-            return JsonResponse(sanitized_results, status=200)
\ No newline at end of file
+            return JsonResponse(res, status=200)
\ No newline at end of file
@@ -0,0 +1,32 @@
+# Gunicorn settings of the production profile, every one of them can be
+# overridden through the environment:
+#   GUNICORN_BIND         address to listen on (0.0.0.0:8000)
+#   GUNICORN_WORKERS      worker processes (2 * CPUs + 1)
+#   GUNICORN_THREADS      threads per worker, more than 1 uses gthread (4)
+#   GUNICORN_WORKER_CLASS sync, gthread, or uvicorn.workers.UvicornH11Worker
+#                         to serve coc.asgi:application
+#   GUNICORN_TIMEOUT      seconds before a silent worker is restarted (30)
+#   GUNICORN_MAX_REQUESTS requests before a worker is recycled, 0 never (1000)
+# Run it from the repository root:
+#   gunicorn -c docker/gunicorn.conf.py coc.wsgi:application
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.environ.get(
+    'GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+worker_class = os.environ.get(
+    'GUNICORN_WORKER_CLASS', 'gthread' if threads > 1 else 'sync')
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+keepalive = 5
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = max_requests // 10
+# load django, the schema and the settings once in the master, the workers
+# fork with them in memory.
+preload_app = True
+chdir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'coc')
+raw_env = ['DJANGO_SETTINGS_MODULE=coc.settings']
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
@@ -0,0 +1,114 @@
+"""Load test of the character sheet and graphql endpoints.
+
+Sends the same requests from concurrent clients and reports the throughput
+and latency of each endpoint, run it against the development server and
+the production profile to compare them:
+
+    python3 coc/manage.py runserver 8000
+    python3 docker/loadtest.py --url http://localhost:8000
+
+    DJANGO_DEBUG=0 gunicorn -c docker/gunicorn.conf.py coc.wsgi:application
+    python3 docker/loadtest.py --url http://localhost:8000
+
+Only the standard library is used so it runs anywhere python does.
+"""
+import argparse
+import json
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+from urllib.request import Request, urlopen
+
+SHEET_QUERY = """
+query ($uuid: String!) {
+    characterSheet(uuid: $uuid) {
+        basicInfo attributes derivativeAttributes skills weapons gear
+    }
+}
+"""
+
+INVESTIGATORS_QUERY = """
+query ($first: Int!) {
+    allInvestigators(first: $first) {
+        edges { node { uuid name occupation { title } user { username } } }
+    }
+}
+"""
+
+
+def graphql_request(base_url: str, query: str, variables: dict) -> Request:
+    # queries are sent by GET, POST requests need a csrf token.
+    params = urlencode({'query': query, 'variables': json.dumps(variables)})
+    return Request(
+        f'{base_url}/graphql?{params}',
+        headers={'Accept': 'application/json'}
+    )
+
+
+def first_investigator(base_url: str) -> str:
+    with urlopen(graphql_request(
+            base_url, INVESTIGATORS_QUERY, {'first': 1})) as response:
+        edges = json.load(response)['data']['allInvestigators']['edges']
+    if not edges:
+        raise SystemExit('No investigators, create one first.')
+    return edges[0]['node']['uuid']
+
+
+def timed(build_request) -> tuple:
+    """Latency in seconds of a request and whether it succeeded."""
+    start = time.perf_counter()
+    try:
+        with urlopen(build_request(), timeout=30) as response:
+            response.read()
+            ok = response.status == 200
+    except (HTTPError, OSError):
+        ok = False
+    return time.perf_counter() - start, ok
+
+
+def run(name: str, build_request, requests: int, concurrency: int):
+    # warm up the connections, the caches and the workers.
+    for _ in range(concurrency):
+        timed(build_request)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(
+            lambda _: timed(build_request), range(requests)))
+    elapsed = time.perf_counter() - start
+    latencies = sorted(latency for latency, _ in results)
+    failed = sum(1 for _, ok in results if not ok)
+    p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+    print(
+        f'{name:<22} {requests / elapsed:8.1f} req/s '
+        f'p50 {statistics.median(latencies) * 1000:7.1f}ms '
+        f'p95 {p95 * 1000:7.1f}ms '
+        f'errors {failed}'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='http://localhost:8000')
+    parser.add_argument('--investigator', help='uuid, the first by default')
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--concurrency', type=int, default=16)
+    args = parser.parse_args()
+    base_url = args.url.rstrip('/')
+    uuid = args.investigator or first_investigator(base_url)
+
+    print(f'{args.requests} requests, {args.concurrency} clients, {base_url}')
+    endpoints = {
+        'sheet view': lambda: Request(f'{base_url}/creator/{uuid}/sheet'),
+        'graphql sheet': lambda: graphql_request(
+            base_url, SHEET_QUERY, {'uuid': uuid}),
+        'graphql investigators': lambda: graphql_request(
+            base_url, INVESTIGATORS_QUERY, {'first': 20}),
+    }
+    for name, build_request in endpoints.items():
+        run(name, build_request, args.requests, args.concurrency)
+
+
+if __name__ == '__main__':
+    main()